@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory used by the aggregate command's article handling.
+
+Fills a temporary database with runs of articles for a few sessions (a
+share of them repeating earlier URLs, some without a link) and prepares the
+aggregate report's article list and counts twice: the old way (every
+session's articles loaded into lists, then deduplicated in Python) and the
+streaming way (counts in SQL, articles read with yield_per until the
+report's 50 unique articles are found). Checks both give the same list and
+counts; tracemalloc reports the peak memory of each.
+
+Usage:
+    python benchmarks/bench_aggregate_memory.py [articles]
+"""
+
+import gc
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import closing
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import insert
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.reporters.report_generator import first_unique_articles
+from src.scheduler.data_manager import DataManager, MonitoringRun, NewsArticle
+
+SESSIONS = 3
+RUN_SIZE = 20
+WORDS = (
+    "market energy policy election court climate budget trade security health "
+    "technology central bank growth inflation strike report agreement talks minister"
+).split()
+
+
+def fill_database(data_manager: DataManager, count: int) -> list:
+    """Insert ``count`` articles in hourly runs spread over the sessions."""
+    rng = random.Random(9)
+    session_ids = [data_manager.create_session(f"topic {i}", 1, "bench@example.com") for i in range(SESSIONS)]
+    start = datetime.now() - timedelta(hours=count // RUN_SIZE)
+    runs, rows = [], []
+    for i in range(count):
+        run = i // RUN_SIZE + 1
+        if i % RUN_SIZE == 0:
+            runs.append({
+                'id': run, 'session_id': session_ids[run % SESSIONS],
+                'run_at': start + timedelta(hours=run), 'article_count': RUN_SIZE
+            })
+        # A third of the results repeat a story seen before; a few have no link
+        story = rng.randrange(i + 1) if rng.random() < 0.3 else i
+        rows.append({
+            'session_id': session_ids[run % SESSIONS],
+            'run_id': run,
+            'title': ' '.join(rng.choice(WORDS) for _ in range(10)).capitalize(),
+            'url': '' if i % 50 == 49 else f"https://news.example.com/story/{story}",
+            'source': "Example News",
+            'snippet': ' '.join(rng.choice(WORDS) for _ in range(35)),
+            'found_at': start + timedelta(hours=run)
+        })
+    
+    session = data_manager.Session()
+    try:
+        session.execute(insert(MonitoringRun), runs)
+        session.execute(insert(NewsArticle), rows)
+        session.commit()
+    finally:
+        session.close()
+    return session_ids
+
+
+def load_all(data_manager: DataManager, session_ids: list):
+    """The old aggregate: all articles in lists, deduplicated in Python."""
+    all_articles = []
+    for session_id in session_ids:
+        all_articles.extend(data_manager.get_session_articles(session_id))
+    
+    seen_urls = set()
+    unique_articles = []
+    for articles in all_articles:
+        for article in articles:
+            if not article.has_link:
+                unique_articles.append(article)
+            elif article.url not in seen_urls:
+                seen_urls.add(article.url)
+                unique_articles.append(article)
+    
+    stats = {
+        'articles': sum(len(articles) for articles in all_articles),
+        'runs': len(all_articles),
+        'unique_articles': len(unique_articles)
+    }
+    return unique_articles[:50], stats
+
+
+def stream(data_manager: DataManager, session_ids: list):
+    """The streaming aggregate: counts in SQL, bounded article list."""
+    stats = data_manager.get_article_stats(session_ids)
+    with closing(data_manager.iter_articles(session_ids)) as articles:
+        return first_unique_articles(articles), stats
+
+
+def measure(load):
+    """Run a loader; return (result, peak bytes, seconds)."""
+    start = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start
+    
+    gc.collect()
+    tracemalloc.start()
+    result = load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak, elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        data_manager = DataManager(Path(tmp) / "bench.db")
+        session_ids = fill_database(data_manager, count)
+        
+        (old_articles, old_stats), old_peak, old_time = measure(lambda: load_all(data_manager, session_ids))
+        (new_articles, new_stats), new_peak, new_time = measure(lambda: stream(data_manager, session_ids))
+        data_manager.close()
+    
+    # Runs of different sessions interleave in time, so compare as sets
+    same = old_stats == new_stats and {a.url for a in old_articles} == {a.url for a in new_articles}
+    print(f"Articles:             {count} ({new_stats['unique_articles']} unique, {new_stats['runs']} runs)")
+    print(f"Same list and counts: {same}")
+    print(f"Load all   peak:      {old_peak / 1e6:8.1f} MB  {old_time:6.2f} s")
+    print(f"Streaming  peak:      {new_peak / 1e6:8.1f} MB  {new_time:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory used by a large aggregate's articles.
+
+Fills a temporary database with stored articles for one session and loads
+them twice: once the way get_session_articles used to (full ORM objects
+converted to dicts) and once with the current implementation (column rows
+converted to slotted Article records). tracemalloc reports the memory still
+held by the loaded articles and the peak while loading.
+
+Usage:
+    python benchmarks/bench_article_memory.py [articles]
+"""
+
+import gc
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import insert
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.scheduler.data_manager import DataManager, MonitoringRun, NewsArticle
+
+SOURCES = [f"Publisher {i}" for i in range(50)]
+WORDS = (
+    "market energy policy election court climate budget trade security health "
+    "technology central bank growth inflation strike report agreement talks minister "
+    "investment supply rates regulators outlook quarter record warning plan"
+).split()
+
+
+def fill_database(data_manager: DataManager, session_id: int, count: int):
+    """Insert ``count`` articles in runs of 10 (one run per hour)."""
+    rng = random.Random(42)
+    start = datetime.now() - timedelta(hours=count // 10)
+    runs = [
+        {'id': run, 'session_id': session_id, 'run_at': start + timedelta(hours=run - 1), 'article_count': 10}
+        for run in range(1, (count + 9) // 10 + 1)
+    ]
+    rows = []
+    for i in range(count):
+        title = ' '.join(rng.choice(WORDS) for _ in range(10)).capitalize()
+        rows.append({
+            'session_id': session_id,
+            'run_id': i // 10 + 1,
+            'title': title,
+            'url': f"https://news{i % 97}.example.com/{i // 10}/{'-'.join(title.lower().split()[:6])}-{i}",
+            'source': rng.choice(SOURCES),
+            'snippet': ' '.join(rng.choice(WORDS) for _ in range(35)),
+            'found_at': start + timedelta(hours=i // 10, seconds=i % 10)
+        })
+    
+    session = data_manager.Session()
+    try:
+        session.execute(insert(MonitoringRun), runs)
+        session.execute(insert(NewsArticle), rows)
+        session.commit()
+    finally:
+        session.close()
+
+
+def legacy_get_session_articles(data_manager: DataManager, session_id: int):
+    """get_session_articles as it was before Article: ORM objects to dicts."""
+    session = data_manager.Session()
+    try:
+        articles = session.query(NewsArticle).filter_by(session_id=session_id).order_by(NewsArticle.found_at).all()
+        grouped = []
+        current_group = []
+        last_time = None
+        for article in articles:
+            if last_time and (article.found_at - last_time).total_seconds() > 1800:
+                if current_group:
+                    grouped.append(current_group)
+                current_group = []
+            current_group.append({
+                'title': article.title,
+                'url': article.url,
+                'source': article.source,
+                'snippet': article.snippet,
+                'found_at': article.found_at
+            })
+            last_time = article.found_at
+        if current_group:
+            grouped.append(current_group)
+        return grouped
+    finally:
+        session.close()
+
+
+def measure(load):
+    """Run a loader; return (result, retained bytes, peak bytes, seconds)."""
+    # Time an untraced run, since tracemalloc slows allocation-heavy code
+    start = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start
+    
+    gc.collect()
+    tracemalloc.start()
+    result = load()
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, retained, peak, elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        data_manager = DataManager(Path(tmp) / "bench.db")
+        session_id = data_manager.create_session("benchmark", 1, "bench@example.com")
+        fill_database(data_manager, session_id, count)
+        
+        results = []
+        for name, load in [
+            ("dicts (before)", lambda: legacy_get_session_articles(data_manager, session_id)),
+            ("Article (after)", lambda: data_manager.get_session_articles(session_id)),
+        ]:
+            grouped, retained, peak, elapsed = measure(load)
+            loaded = sum(len(group) for group in grouped)
+            results.append((name, loaded, retained, peak, elapsed))
+            del grouped
+        
+        data_manager.close()
+    
+    print(f"{'loader':<18}{'articles':>10}{'retained MB':>13}{'bytes/article':>15}{'peak MB':>10}{'load s':>9}")
+    for name, loaded, retained, peak, elapsed in results:
+        print(f"{name:<18}{loaded:>10}{retained / 1e6:>13.1f}{retained / loaded:>15.0f}"
+              f"{peak / 1e6:>10.1f}{elapsed:>9.2f}")
+    
+    before, after = results[0], results[1]
+    print()
+    print(f"Retained memory: {after[2] / before[2]:.0%} of before")
+    print(f"Peak memory:     {after[3] / before[3]:.0%} of before")
+
+
+if __name__ == "__main__":
+    main()
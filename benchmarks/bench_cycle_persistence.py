@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark persisting monitoring cycles while many sessions write at once.
+
+Each of N threads (one per session) stores a number of cycles of synthetic
+articles into one shared database, first the old way (store_articles
+adding one ORM object per article, then store_report and
+update_session_run, each committing on its own) and then with
+DataManager.store_cycle (bulk inserts, one transaction). Reports stored
+rows per second for each.
+
+Usage:
+    python benchmarks/bench_cycle_persistence.py [sessions] [cycles] [articles]
+"""
+
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.article import Article
+from src.scheduler.data_manager import DataManager, NewsArticle, MonitoringReport
+
+
+def make_articles(count: int):
+    """Synthetic articles of a typical search result size."""
+    return [
+        Article(
+            title=f"Energy ministers agree on supply plan, part {i}",
+            url=f"https://example.com/news/{i}",
+            source="Example News",
+            snippet="Officials said the agreement would take effect next quarter as markets " * 3
+        )
+        for i in range(count)
+    ]
+
+
+def store_separately(data_manager: DataManager, session_id: int, articles, analysis: str):
+    """The old cycle: per-row ORM inserts and three separate commits."""
+    session = data_manager.Session()
+    try:
+        for article in articles:
+            session.add(NewsArticle(session_id=session_id, found_at=datetime.now(), **article.to_columns()))
+        session.commit()
+    finally:
+        session.close()
+    
+    session = data_manager.Session()
+    try:
+        session.add(MonitoringReport(
+            session_id=session_id, analysis=analysis, created_at=datetime.now(), article_count=len(articles)
+        ))
+        session.commit()
+    finally:
+        session.close()
+    
+    data_manager.update_session_run(session_id)
+
+
+def store_together(data_manager: DataManager, session_id: int, articles, analysis: str):
+    """The new cycle: one transaction with bulk inserts."""
+    data_manager.store_cycle(session_id, articles, analysis)
+
+
+def run(store, sessions: int, cycles: int, articles: list) -> float:
+    """Rows (articles + reports) stored per second by all sessions together."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_manager = DataManager(Path(tmp) / "news.db")
+        session_ids = [data_manager.create_session(f"topic {i}", 6, "you@example.com") for i in range(sessions)]
+        analysis = "Summary of the cycle. " * 100
+        
+        def cycles_for(session_id: int):
+            for _ in range(cycles):
+                store(data_manager, session_id, articles, analysis)
+        
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=sessions) as pool:
+            list(pool.map(cycles_for, session_ids))
+        elapsed = time.perf_counter() - start
+        data_manager.close()
+    
+    return sessions * cycles * (len(articles) + 1) / elapsed
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    cycles = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    articles = make_articles(int(sys.argv[3]) if len(sys.argv) > 3 else 30)
+    
+    separate = run(store_separately, sessions, cycles, articles)
+    together = run(store_together, sessions, cycles, articles)
+    
+    print(f"Sessions writing at once:      {sessions}")
+    print(f"Cycles per session:            {cycles} ({len(articles)} articles each)")
+    print(f"Separate commits, ORM rows:    {separate:8.0f} rows/s")
+    print(f"store_cycle (one transaction): {together:8.0f} rows/s")
+    print(f"Speedup:                       {together / separate:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
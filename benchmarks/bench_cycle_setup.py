@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Benchmark a warm monitoring cycle against per-cycle client construction.
+
+Runs complete monitoring cycles (query generation, search, analysis,
+storage, report rendering and an emailed report) against a local
+OpenAI-compatible API server and a local STARTTLS SMTP server:
+
+- before: every cycle builds its own DeepSeekClient, NewsAgent,
+  ReportGenerator and EmailReporter, as run_monitoring_cycle used to, so it
+  opens new HTTP connections and logs in to SMTP again
+- after: run_monitoring_cycle on a shared Components container; the first
+  cycle warms it up and only the following (second and later) cycles are
+  timed, reusing the pooled HTTP connections and the SMTP session
+
+Search results are fixed and both variants store the cycle with
+store_cycle, so only setup and connection reuse differ. The LLM cache and
+repeat filters are disabled so every cycle makes the same LLM calls.
+
+Loopback connections are almost free, so a connect delay (in ms, applied
+by both servers to every new connection) can be given to model the round
+trips of reaching a remote API and mail server.
+
+Requires the openssl command line tool (for the SMTP server certificate).
+
+Usage:
+    python benchmarks/bench_cycle_setup.py [cycles] [connect_delay_ms]
+"""
+
+import json
+import logging
+import os
+import socketserver
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from main import run_monitoring_cycle
+from src.config.config_manager import ConfigManager
+from src.components import Components
+from src.api.api_client import DeepSeekClient
+from src.agents.news_agent import NewsAgent
+from src.agents.tools import SimpleTool
+from src.models.article import Article
+from src.reporters.report_generator import ReportGenerator
+from src.reporters.email_reporter import EmailReporter
+from src.scheduler.data_manager import DataManager
+
+PROMPT = "energy prices"
+ANALYSIS = "Energy prices eased this week as new supply deals were signed. " * 20
+
+
+class Counters:
+    """Connections and requests seen by the local servers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.values = {'http_connections': 0, 'llm_calls': 0, 'smtp_logins': 0, 'emails': 0}
+
+    def add(self, name: str):
+        with self._lock:
+            self.values[name] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.values)
+
+
+def start_llm_server(counters: Counters, connect_delay: float) -> ThreadingHTTPServer:
+    """Serve /chat/completions with canned answers over HTTP/1.1 keep-alive."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            counters.add('http_connections')
+            time.sleep(connect_delay)
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            counters.add('llm_calls')
+            prompt = request['messages'][-1]['content']
+            if 'queries' in prompt.lower():
+                content = f"{PROMPT}\n{PROMPT} supply deals\n{PROMPT} market outlook"
+            else:
+                content = ANALYSIS
+            body = json.dumps({
+                'id': 'bench',
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': request.get('model', 'deepseek-chat'),
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': content},
+                    'finish_reason': 'stop'
+                }],
+                'usage': {'prompt_tokens': 100, 'completion_tokens': 50, 'total_tokens': 150}
+            }).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def start_smtp_server(counters: Counters, connect_delay: float, tmp: str) -> socketserver.ThreadingTCPServer:
+    """Serve just enough SMTP (STARTTLS, AUTH, NOOP, send) for EmailReporter."""
+    cert, key = os.path.join(tmp, 'cert.pem'), os.path.join(tmp, 'key.pem')
+    subprocess.run(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+         '-subj', '/CN=localhost', '-keyout', key, '-out', cert],
+        check=True, capture_output=True
+    )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            time.sleep(connect_delay)
+            sock = self.request
+            reader = sock.makefile('rb')
+            tls = False
+
+            def reply(line: str):
+                sock.sendall(line.encode() + b"\r\n")
+
+            reply("220 localhost ESMTP bench")
+            while True:
+                line = reader.readline()
+                if not line:
+                    return
+                command = line.decode().strip().upper()
+                if command.startswith(('EHLO', 'HELO')):
+                    if tls:
+                        reply("250-localhost\r\n250 AUTH PLAIN LOGIN")
+                    else:
+                        reply("250-localhost\r\n250 STARTTLS")
+                elif command == 'STARTTLS':
+                    reply("220 Ready to start TLS")
+                    sock = context.wrap_socket(sock, server_side=True)
+                    reader = sock.makefile('rb')
+                    tls = True
+                elif command.startswith('AUTH'):
+                    counters.add('smtp_logins')
+                    reply("235 Authentication successful")
+                elif command == 'DATA':
+                    reply("354 End data with <CR><LF>.<CR><LF>")
+                    while reader.readline() not in (b".\r\n", b""):
+                        pass
+                    counters.add('emails')
+                    reply("250 OK")
+                elif command == 'QUIT':
+                    reply("221 Bye")
+                    return
+                else:
+                    # MAIL, RCPT, RSET and NOOP
+                    reply("250 OK")
+
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_search_tool() -> SimpleTool:
+    """Search tool returning the same synthetic results for every query."""
+    articles = [
+        Article(
+            title=f"Energy ministers agree on supply plan, part {i}",
+            url=f"https://example.com/news/{i}",
+            source="Example News",
+            snippet="Officials said the agreement would take effect next quarter as markets " * 3
+        )
+        for i in range(10)
+    ]
+    return SimpleTool(name="web_search", description="Fixed results", func=lambda query: list(articles))
+
+
+def run_cycle_per_cycle_setup(
+    session_id: int,
+    email_to: str,
+    cfg: ConfigManager,
+    data_manager: DataManager
+):
+    """One cycle building its clients from scratch, as run_monitoring_cycle used to."""
+    DeepSeekClient(
+        api_key=cfg.deepseek_api_key,
+        base_url=cfg.deepseek_base_url,
+        model=cfg.deepseek_model,
+        temperature=cfg.deepseek_temperature,
+        max_tokens=cfg.deepseek_max_tokens
+    )
+    agent = NewsAgent(
+        api_key=cfg.deepseek_api_key,
+        base_url=cfg.deepseek_base_url,
+        model=cfg.deepseek_model,
+        temperature=cfg.deepseek_temperature,
+        search_tool=cfg.search_default_tool,
+        max_results=cfg.search_max_results
+    )
+    agent.search_tool = make_search_tool()
+
+    articles = agent.search_news(PROMPT, session_id=session_id)
+    analysis, _ = agent.analyze_articles(PROMPT, articles)
+    data_manager.store_cycle(session_id, articles, analysis)
+
+    report_gen = ReportGenerator()
+    html_report = report_gen.generate_html_report(articles, analysis, PROMPT, "scheduled")
+    text_report = report_gen.generate_text_report(articles, analysis, PROMPT, "scheduled")
+
+    email_reporter = EmailReporter(
+        smtp_server=cfg.email_smtp_server,
+        smtp_port=cfg.email_smtp_port,
+        from_address=cfg.email_from,
+        password=cfg.email_password,
+        use_tls=cfg.email_use_tls
+    )
+    email_reporter.send_scheduled_report(email_to, PROMPT, html_report, text_report)
+
+
+def measure(counters: Counters, cycles: int, run):
+    """Time ``cycles`` runs, returning seconds per cycle and counters per cycle."""
+    before = counters.snapshot()
+    start = time.perf_counter()
+    for _ in range(cycles):
+        run()
+    elapsed = (time.perf_counter() - start) / cycles
+    after = counters.snapshot()
+    return elapsed, {name: (after[name] - before[name]) / cycles for name in after}
+
+
+def main():
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    connect_delay = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.0
+
+    logging.disable(logging.WARNING)
+    counters = Counters()
+    email_to = "you@example.com"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        llm_server = start_llm_server(counters, connect_delay)
+        smtp_server = start_smtp_server(counters, connect_delay, tmp)
+
+        cfg = ConfigManager(os.path.join(tmp, "missing.yaml"))
+        cfg.config_data = {
+            "app": {"database_path": os.path.join(tmp, "bench.db")},
+            "deepseek": {
+                "api_key": "sk-benchmark",
+                "base_url": f"http://127.0.0.1:{llm_server.server_address[1]}/v1"
+            },
+            "email": {
+                "smtp_server": "127.0.0.1",
+                "smtp_port": smtp_server.server_address[1],
+                "use_tls": True,
+                "from_address": "bench@example.com",
+                "password": "benchmark"
+            },
+            "cache": {"enabled": False},
+            "dedup": {"enabled": False, "skip_seen_urls": False},
+            "history_index": {"enabled": False}
+        }
+
+        data_manager = DataManager(cfg.database_path)
+        session_id = data_manager.create_session(PROMPT, 6, email_to)
+
+        # Old behaviour, after one untimed cycle to load modules
+        run_cycle_per_cycle_setup(session_id, email_to, cfg, data_manager)
+        per_cycle, per_cycle_counts = measure(
+            counters, cycles,
+            lambda: run_cycle_per_cycle_setup(session_id, email_to, cfg, data_manager)
+        )
+
+        # Shared container: the first cycle builds it, later cycles reuse it
+        components = Components(cfg, data_manager=data_manager)
+        components.agent.search_tool = make_search_tool()
+        first, first_counts = measure(
+            counters, 1,
+            lambda: run_monitoring_cycle(session_id, PROMPT, email_to, components)
+        )
+        warm, warm_counts = measure(
+            counters, cycles,
+            lambda: run_monitoring_cycle(session_id, PROMPT, email_to, components)
+        )
+        components.close()
+
+        llm_server.shutdown()
+        smtp_server.shutdown()
+
+    def describe(counts):
+        return (
+            f"{counts['llm_calls']:.1f} LLM calls, {counts['emails']:.1f} emails, "
+            f"{counts['http_connections']:.1f} new HTTP connections, "
+            f"{counts['smtp_logins']:.1f} SMTP logins"
+        )
+
+    print(f"Cycles:                          {cycles}")
+    print(f"Connect delay:                   {connect_delay * 1000:10.1f} ms")
+    print(f"Per-cycle setup (before):        {per_cycle * 1000:10.1f} ms/cycle  ({describe(per_cycle_counts)})")
+    print(f"Shared container, first cycle:   {first * 1000:10.1f} ms        ({describe(first_counts)})")
+    print(f"Shared container, warm cycles:   {warm * 1000:10.1f} ms/cycle  ({describe(warm_counts)})")
+    print(f"Warm cycle speedup:              {per_cycle / warm:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark HTML-to-text extraction.
+
+Compares the lxml main-content extractor with the previous BeautifulSoup
+implementation on the saved pages in benchmarks/fixtures/, plus one long page
+built from them to show the early stop at the character limit. For each page
+it prints the time per call and how the output differs: how much of the new
+text also appears in the old output (content kept) and how much of the old
+output the new one leaves out (boilerplate dropped).
+
+Usage:
+    python benchmarks/bench_extraction.py [iterations]
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.agents.extraction import extract_text
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def legacy_extract_text(html: bytes) -> str:
+    """The BeautifulSoup extractor used before the lxml engine."""
+    soup = BeautifulSoup(html, 'html.parser')
+    for script in soup(["script", "style"]):
+        script.decompose()
+    text = soup.get_text()
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    text = ' '.join(chunk for chunk in chunks if chunk)
+    return text[:5000]
+
+
+def time_per_call(func, html: bytes, iterations: int) -> float:
+    """Average seconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(html)
+    return (time.perf_counter() - start) / iterations
+
+
+def words(text: str) -> set:
+    """Lowercased word set of a text."""
+    return set(re.findall(r'\w+', text.lower()))
+
+
+def load_pages():
+    """Fixture pages plus a long page that hits the character limit."""
+    pages = [(path.name, path.read_bytes()) for path in sorted(FIXTURES.glob("*.html"))]
+    
+    wire = (FIXTURES / "wire_article.html").read_bytes()
+    body_start = wire.index(b'<div class="article-body">')
+    body_end = wire.index(b'</div>', body_start)
+    long_body = wire[body_start:body_end] * 200
+    pages.append(("long_article (x200)", wire[:body_start] + long_body + wire[body_end:]))
+    return pages
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    pages = load_pages()
+    
+    print(f"{'page':<26}{'KB':>7}{'old ms':>9}{'new ms':>9}{'speedup':>9}"
+          f"{'old chars':>11}{'new chars':>11}{'kept':>7}{'dropped':>9}")
+    
+    total_old = total_new = total_bytes = 0
+    for name, html in pages:
+        # Long pages are slow with the old extractor, so time them fewer times
+        runs = max(1, iterations * 20_000 // max(len(html), 20_000))
+        old_time = time_per_call(legacy_extract_text, html, runs)
+        new_time = time_per_call(extract_text, html, runs)
+        total_old += old_time
+        total_new += new_time
+        total_bytes += len(html)
+        
+        old_text = legacy_extract_text(html)
+        new_text = extract_text(html)
+        old_words, new_words = words(old_text), words(new_text)
+        kept = len(new_words & old_words) / len(new_words) if new_words else 0
+        dropped = len(old_words - new_words) / len(old_words) if old_words else 0
+        
+        print(f"{name:<26}{len(html) / 1024:>7.1f}{old_time * 1000:>9.2f}{new_time * 1000:>9.2f}"
+              f"{old_time / new_time:>8.1f}x{len(old_text):>11}{len(new_text):>11}"
+              f"{kept:>7.0%}{dropped:>9.0%}")
+    
+    print()
+    print(f"Throughput (old): {total_bytes / total_old / 1e6:8.1f} MB/s")
+    print(f"Throughput (new): {total_bytes / total_new / 1e6:8.1f} MB/s")
+    print(f"Overall speedup:  {total_old / total_new:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
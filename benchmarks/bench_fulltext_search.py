@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark full-text search over stored articles.
+
+Fills a temporary database with synthetic articles (the FTS5 triggers index
+them as they are inserted), then times DataManager.search for rare and
+common words, prefix searches and searches limited to one session or one
+week, against the same lookup done with a LIKE scan of the articles table.
+
+Usage:
+    python benchmarks/bench_fulltext_search.py [rows]
+"""
+
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.scheduler.data_manager import DataManager
+
+BATCH = 50_000
+QUERIES = 20
+WORDS = (
+    "market energy policy election court climate budget trade security health technology "
+    "central bank growth inflation strike report agreement talks minister investment supply "
+    "rates regulators outlook quarter record warning plan oil gas chip export tariff vote "
+    "senate merger lawsuit drought wildfire vaccine satellite launch ceasefire sanctions"
+).split()
+START = datetime(2024, 1, 1)
+
+
+def rare_word(rng: random.Random) -> str:
+    """One of 10,000 made-up names (each in about 1 in 10,000 articles)."""
+    return f"name{rng.randrange(10_000)}"
+
+
+def fill(database: Path, rows: int, rng: random.Random):
+    """Insert synthetic articles spread over two years and 100 sessions."""
+    connection = sqlite3.connect(database)
+    for offset in range(0, rows, BATCH):
+        batch = []
+        for i in range(offset, min(rows, offset + BATCH)):
+            title = ' '.join(rng.choice(WORDS) for _ in range(7)) + ' ' + rare_word(rng)
+            snippet = ' '.join(rng.choice(WORDS) for _ in range(30))
+            found_at = START + timedelta(minutes=i * 1_051_200 // rows)
+            batch.append((i % 100, title, f"https://example.com/{i}", "Example", snippet, found_at.isoformat(' ')))
+        connection.executemany(
+            "INSERT INTO news_articles (session_id, title, url, source, snippet, found_at) VALUES (?, ?, ?, ?, ?, ?)",
+            batch
+        )
+        connection.commit()
+    connection.close()
+
+
+def timed(function, queries):
+    """Median seconds of function(query) over the queries."""
+    times = []
+    for query in queries:
+        start = time.perf_counter()
+        function(query)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(5)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Path(tmp) / "news.db"
+        data_manager = DataManager(database)
+        
+        start = time.perf_counter()
+        fill(database, rows, rng)
+        insert_rate = rows / (time.perf_counter() - start)
+        
+        rare = [f"{rare_word(rng)} {rng.choice(WORDS)}" for _ in range(QUERIES)]
+        common = [f"{rng.choice(WORDS)} {rng.choice(WORDS)}" for _ in range(QUERIES)]
+        prefix = [f"{rng.choice(WORDS)[:3]}*" for _ in range(QUERIES)]
+        week = (START + timedelta(days=300), START + timedelta(days=307))
+        
+        data_manager.search(rare[0])  # warm the page cache
+        results = {
+            "Rare words": timed(lambda q: data_manager.search(q), rare),
+            "Common words": timed(lambda q: data_manager.search(q), common),
+            "Prefix (3 letters*)": timed(lambda q: data_manager.search(q), prefix),
+            "Rare words, one session": timed(lambda q: data_manager.search(q, session_id=7), rare),
+            "Rare words, one week": timed(lambda q: data_manager.search(q, since=week[0], until=week[1]), rare),
+        }
+        
+        connection = sqlite3.connect(database)
+        like_scan = timed(
+            lambda q: connection.execute(
+                "SELECT id FROM news_articles WHERE (title LIKE ? OR snippet LIKE ?) LIMIT 20",
+                (f"%{q.split()[0]}%", f"%{q.split()[0]}%")
+            ).fetchall(),
+            rare[:5]
+        )
+        connection.close()
+        size = database.stat().st_size
+    
+    print(f"Rows:                          {rows}")
+    print(f"Database size (with index):    {size / 1e6:8.1f} MB")
+    print(f"Insert rate (incl. triggers):  {insert_rate:8.0f} articles/s")
+    for name, seconds in results.items():
+        print(f"Top-20, {name + ':':23s}{seconds * 1000:8.2f} ms p50")
+    print(f"LIKE scan, rare word:          {like_scan * 1000:8.2f} ms p50")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark search-history queries on the article vector index.
+
+Embeds a pool of synthetic articles, writes them repeatedly (with distinct
+IDs and sessions) into a temporary ArticleVectorIndex until it holds the
+requested number of rows, then times top-10 cosine queries over all rows and
+over one session. Also reports the embedding rate used by store_articles and
+the size of the index files per article.
+
+Usage:
+    python benchmarks/bench_history_search.py [rows] [dimensions]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.scheduler.vector_index import ArticleVectorIndex, article_text, embed
+
+POOL = 20_000
+QUERIES = 50
+WORDS = (
+    "market energy policy election court climate budget trade security health technology "
+    "central bank growth inflation strike report agreement talks minister investment supply "
+    "rates regulators outlook quarter record warning plan oil gas chip export tariff vote "
+    "senate merger lawsuit drought wildfire vaccine satellite launch ceasefire sanctions"
+).split()
+
+
+def make_pool(rng: random.Random):
+    """(title, snippet) pairs of synthetic articles."""
+    pool = []
+    for _ in range(POOL):
+        title = ' '.join(rng.choice(WORDS) for _ in range(8))
+        snippet = ' '.join(rng.choice(WORDS) for _ in range(30))
+        pool.append((title, snippet))
+    return pool
+
+
+def percentile(values, fraction):
+    """Value at a fraction of the sorted values."""
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    dimensions = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    rng = random.Random(3)
+    pool = make_pool(rng)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        index = ArticleVectorIndex(Path(tmp), dimensions)
+        
+        start = time.perf_counter()
+        vectors = np.stack([embed(article_text(t, s), dimensions) for t, s in pool])
+        embed_rate = POOL / (time.perf_counter() - start)
+        
+        # Fill the files directly from the embedded pool (embedding a million texts is not what is measured)
+        with open(index.vectors_path, 'ab') as vector_file, open(index.ids_path, 'ab') as id_file:
+            for offset in range(0, rows, POOL):
+                count = min(POOL, rows - offset)
+                ids = np.zeros(count, dtype=index.id_dtype)
+                ids['article_id'] = np.arange(offset + 1, offset + count + 1)
+                ids['session_id'] = ids['article_id'] % 100
+                vector_file.write(vectors[:count].tobytes())
+                id_file.write(ids.tobytes())
+        
+        queries = [' '.join(rng.choice(WORDS) for _ in range(3)) for _ in range(QUERIES)]
+        index.search(queries[0], 10)  # warm the page cache
+        
+        all_times = []
+        for query in queries:
+            start = time.perf_counter()
+            index.search(query, 10)
+            all_times.append(time.perf_counter() - start)
+        
+        session_times = []
+        for query in queries:
+            start = time.perf_counter()
+            index.search(query, 10, session_id=7)
+            session_times.append(time.perf_counter() - start)
+        
+        size = index.vectors_path.stat().st_size + index.ids_path.stat().st_size
+    
+    print(f"Rows:                      {rows}")
+    print(f"Dimensions:                {dimensions}")
+    print(f"Index size:                {size / 1e6:8.1f} MB ({size / rows:.0f} bytes/article)")
+    print(f"Embedding rate:            {embed_rate:8.0f} articles/s")
+    print(f"Top-10, all rows   p50:    {percentile(all_times, 0.5) * 1000:8.1f} ms")
+    print(f"Top-10, all rows   p95:    {percentile(all_times, 0.95) * 1000:8.1f} ms")
+    print(f"Top-10, one session p50:   {percentile(session_times, 0.5) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
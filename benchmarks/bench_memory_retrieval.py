@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark NewsMemory context retrieval.
+
+Writes a memory log of synthetic report summaries spread over many topics,
+loads it into NewsMemory (which builds the BM25 index) and times
+get_context for prompts related to each topic (worded differently from the
+topic's own prompt, so the BM25 path across all topics is measured). The NumPy-scored index is compared
+with the same BM25 ranking computed by a plain Python loop over every entry,
+and with the old behaviour (newest entries whatever their topic) on how many
+returned entries belong to the prompt's topic.
+
+Usage:
+    python benchmarks/bench_memory_retrieval.py [entries]
+"""
+
+import json
+import math
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.agents.memory import NewsMemory
+from src.agents.retrieval import tokenize
+
+TOPICS = 200
+QUERIES = 200
+COMMON = (
+    "market report analysis update officials week said growth risk plan statement sources "
+    "government sector investors outlook data expected industry months year pressure"
+).split()
+
+
+def topic_words(rng: random.Random, topic: int) -> list:
+    """Made-up words specific to a topic, plus one common word variant."""
+    return [f"t{topic}w{i}" for i in range(8)] + [f"{rng.choice(COMMON)}{topic % 7}"]
+
+
+def make_entries(count: int):
+    """Synthetic (topic, entry) pairs, oldest first."""
+    rng = random.Random(7)
+    vocab = [topic_words(rng, topic) for topic in range(TOPICS)]
+    entries = []
+    for i in range(count):
+        topic = rng.randrange(TOPICS)
+        words = vocab[topic]
+        summary = ' '.join(
+            rng.choice(words) if rng.random() < 0.25 else rng.choice(COMMON) for _ in range(120)
+        )
+        entries.append((topic, {
+            "timestamp": f"2026-01-01T00:00:{i:06d}",
+            "prompt": f"{words[0]} {words[1]} developments",
+            "summary": summary
+        }))
+    return entries, vocab
+
+
+def python_bm25(docs, query: str, k: int, k1: float = 1.5, b: float = 0.75):
+    """BM25 top-k computed entry by entry over token counters, for comparison."""
+    terms = set(tokenize(query))
+    avg_length = sum(sum(d.values()) for d in docs) / len(docs)
+    doc_freq = {t: sum(1 for d in docs if t in d) for t in terms}
+    scores = []
+    for i, doc in enumerate(docs):
+        length = sum(doc.values())
+        score = 0.0
+        for term in terms:
+            freq = doc.get(term)
+            if freq:
+                idf = math.log(1 + (len(docs) - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+                score += idf * freq * (k1 + 1) / (freq + k1 * (1 - b + b * length / avg_length))
+        if score:
+            scores.append((score, i))
+    return sorted(scores, reverse=True)[:k]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    entries, vocab = make_entries(count)
+    rng = random.Random(11)
+    queries = []
+    for _ in range(QUERIES):
+        topic = rng.randrange(TOPICS)
+        queries.append((topic, f"latest {vocab[topic][0]} {vocab[topic][1]} news"))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        log = Path(tmp) / "memory.jsonl"
+        with open(log, 'w') as f:
+            for _, entry in entries:
+                f.write(json.dumps(entry) + '\n')
+        
+        start = time.perf_counter()
+        # Every entry stays a full report so the index holds all of them
+        memory = NewsMemory(str(log), recent_entries=count)
+        load_time = time.perf_counter() - start
+        
+        topic_of = {entry["timestamp"]: topic for topic, entry in entries}
+        latencies = []
+        on_topic = 0
+        for topic, query in queries:
+            start = time.perf_counter()
+            memory.get_context(query)
+            latencies.append(time.perf_counter() - start)
+            
+            hits = memory.search(query, 3)
+            on_topic += sum(1 for entry in hits if topic_of[entry["timestamp"]] == topic)
+        
+        newest_on_topic = sum(
+            1 for topic, _ in queries for newest_topic, _ in entries[-3:] if newest_topic == topic
+        )
+        
+        start = time.perf_counter()
+        for i in range(100):
+            memory.add_report(f"{vocab[i][0]} {vocab[i][1]} developments", ' '.join(COMMON))
+        add_time = (time.perf_counter() - start) / 100
+    
+    # The Python loop is slow, so it runs a few queries only
+    docs = [Counter(tokenize(f"{entry['prompt']}\n{entry['summary']}")) for _, entry in entries]
+    runs = 3
+    start = time.perf_counter()
+    for _, query in queries[:runs]:
+        python_bm25(docs, query, 3)
+    python_time = (time.perf_counter() - start) / runs
+    
+    latencies.sort()
+    print(f"Entries:                     {count}")
+    print(f"Load + index build:          {load_time:8.2f} s")
+    print(f"get_context p50:             {latencies[len(latencies) // 2] * 1000:8.2f} ms")
+    print(f"get_context p95:             {latencies[int(len(latencies) * 0.95)] * 1000:8.2f} ms")
+    print(f"BM25 Python loop per query:  {python_time * 1000:8.2f} ms (scoring only)")
+    print(f"add_report (fsync + index):  {add_time * 1000:8.2f} ms")
+    print(f"On-topic entries (BM25):     {on_topic / (3 * QUERIES):8.0%}")
+    print(f"On-topic entries (newest 3): {newest_on_topic / (3 * QUERIES):8.0%}")
+
+
+if __name__ == "__main__":
+    main()
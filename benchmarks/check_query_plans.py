@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Check that DataManager queries use indexes instead of scanning tables.
+
+Creates a database in the schema before the lookup indexes existed
+(schema version 0), fills it with synthetic sessions, articles and reports,
+then opens it with DataManager so the migrations upgrade it in place. Every
+statement the DataManager read/cleanup methods send is captured and run
+through EXPLAIN QUERY PLAN; a full scan of a base table fails the check.
+tests/test_query_plans.py runs the same checks as assertions.
+
+Usage:
+    python benchmarks/check_query_plans.py
+"""
+
+import sqlite3
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from sqlalchemy import event
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.scheduler import migrations
+from src.scheduler.data_manager import DataManager
+
+SESSIONS = 50
+ARTICLES = 20_000
+
+
+def make_legacy_database(path: Path):
+    """A populated database as it was before the lookup indexes (version 0)."""
+    data_manager = DataManager(path)
+    data_manager.close()
+    
+    db = sqlite3.connect(path)
+    for name, in db.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'ix_%'").fetchall():
+        if name != 'ix_article_signature_bands_lookup':
+            db.execute(f"DROP INDEX {name}")
+    db.execute("DROP TABLE IF EXISTS sqlite_stat1")
+    db.execute("PRAGMA user_version = 0")
+    
+    start = datetime(2025, 1, 1)
+    db.executemany(
+        "INSERT INTO monitoring_sessions (prompt, interval_hours, started_at, is_active) VALUES (?, 6, ?, ?)",
+        [(f"topic {i}", start.isoformat(' '), i % 5 == 0) for i in range(SESSIONS)]
+    )
+    db.executemany(
+        "INSERT INTO news_articles (session_id, title, url, source, snippet, found_at) VALUES (?, ?, ?, 'Example', ?, ?)",
+        [
+            (i % SESSIONS + 1, f"Article {i}", f"https://example.com/{i}", "markets policy outlook",
+             (start + timedelta(minutes=10 * i)).isoformat(' '))
+            for i in range(ARTICLES)
+        ]
+    )
+    db.executemany(
+        "INSERT INTO monitoring_reports (session_id, analysis, created_at, article_count) VALUES (?, ?, ?, 10)",
+        [
+            (i % SESSIONS + 1, f"Report {i} on markets", (start + timedelta(hours=i)).isoformat(' '))
+            for i in range(ARTICLES // 10)
+        ]
+    )
+    db.commit()
+    db.close()
+
+
+def full_scans(db: sqlite3.Connection, statement: str, parameters) -> list:
+    """Plan lines that scan a base table without an index."""
+    plan = db.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return [
+        detail for *_, detail in plan
+        if detail.startswith('SCAN ') and 'INDEX' not in detail and 'VIRTUAL TABLE' not in detail
+        and not detail.startswith('SCAN CONSTANT')
+    ]
+
+
+# Read/cleanup calls checked, against a database made by make_legacy_database
+CHECKS: Dict[str, Callable[[DataManager], Any]] = {
+    'get_active_sessions': lambda dm: dm.get_active_sessions(),
+    'get_session_articles': lambda dm: dm.get_session_articles(7),
+    'get_session_articles (since)': lambda dm: dm.get_session_articles(7, since=datetime(2025, 3, 1)),
+    'get_session_articles (last runs)': lambda dm: dm.get_session_articles(7, last_runs=5),
+    'get_runs (second page)': lambda dm: dm.get_runs(7, limit=10, before_id=500),
+    'count_runs': lambda dm: dm.count_runs(7),
+    'get_run_articles': lambda dm: dm.get_run_articles(42),
+    'iter_articles': lambda dm: list(dm.iter_articles([7, 8])),
+    'get_article_stats': lambda dm: dm.get_article_stats([7, 8]),
+    'get_session_reports': lambda dm: dm.get_session_reports(7, until=datetime(2025, 2, 1)),
+    'get_report_buckets': lambda dm: dm.get_report_buckets(7, 'week'),
+    'search (one week)': lambda dm: dm.search(
+        "markets", since=datetime(2025, 2, 1), until=datetime(2025, 2, 8)
+    ),
+    'cleanup_old_data': lambda dm: dm.cleanup_old_data(days=30),
+}
+
+
+def check_full_scans(data_manager: DataManager, db: sqlite3.Connection, call: Callable[[DataManager], Any]) -> list:
+    """
+    Run a DataManager call and collect the full scans of the statements it sends.
+    
+    Args:
+        data_manager: DataManager to call
+        db: Separate connection to the same database, used for EXPLAIN
+        call: One of CHECKS
+    
+    Returns:
+        Plan lines that scan a base table without an index
+    """
+    statements = []
+    
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(('SELECT', 'DELETE', 'UPDATE')):
+            statements.append((statement, parameters))
+    
+    event.listen(data_manager.engine, 'before_cursor_execute', capture)
+    try:
+        call(data_manager)
+    finally:
+        event.remove(data_manager.engine, 'before_cursor_execute', capture)
+    return [scan for statement, parameters in statements for scan in full_scans(db, statement, parameters)]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "news.db"
+        make_legacy_database(path)
+        
+        data_manager = DataManager(path)
+        db = sqlite3.connect(path)
+        version = db.execute("PRAGMA user_version").fetchone()[0]
+        
+        failures = 0
+        print(f"Schema version after upgrade: {version} (latest {migrations.SCHEMA_VERSION})")
+        for name, call in CHECKS.items():
+            scans = check_full_scans(data_manager, db, call)
+            failures += bool(scans)
+            print(f"{'FAIL' if scans else 'ok':4s}  {name}" + (f": {'; '.join(scans)}" if scans else ''))
+        db.close()
+        data_manager.close()
+    
+    if version != migrations.SCHEMA_VERSION or failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
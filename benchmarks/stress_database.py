@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Stress test the monitoring database with concurrent writers and readers.
+
+Writer threads store monitoring cycles (DataManager.store_cycle) while
+reader threads run the queries the CLI and aggregate use, all on one shared
+DataManager, for a fixed time. One more thread streams the whole history
+slowly with iter_articles, like the aggregate command building its report;
+each pass keeps a read transaction open for about LONG_READ_SECONDS.
+
+Runs twice: with the engine as DataManager configures it (WAL, busy timeout,
+pragmas, connection pool) and with a plain sqlite:/// engine in
+rollback-journal mode, as before. Reports operations per second and
+"database is locked" errors for each. In rollback-journal mode a writer
+cannot commit while the long read is open and gives up after pysqlite's
+default 5 s timeout; in WAL mode readers never block the writer.
+
+Usage:
+    python benchmarks/stress_database.py [writers] [readers] [seconds]
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.article import Article
+from src.scheduler.data_manager import DataManager
+
+ARTICLES = [
+    Article(
+        title=f"Energy ministers agree on supply plan, part {i}",
+        url=f"https://example.com/news/{i}",
+        source="Example News",
+        snippet="Officials said the agreement would take effect next quarter as markets " * 3
+    )
+    for i in range(30)
+]
+ANALYSIS = "Summary of the cycle on energy markets. " * 50
+
+# Cycles stored before the run, so the long read has a history to stream
+HISTORY_CYCLES = 100
+LONG_READ_SECONDS = 8
+
+
+def use_default_engine(data_manager: DataManager):
+    """Point a DataManager at a plain engine in rollback-journal mode (the old setup)."""
+    data_manager.engine.dispose()
+    data_manager.engine = create_engine(f'sqlite:///{data_manager.database_path}')
+    with data_manager.engine.connect() as connection:
+        connection.execute(text("PRAGMA journal_mode=DELETE"))
+    data_manager.Session = sessionmaker(bind=data_manager.engine)
+
+
+def stress(writers: int, readers: int, seconds: float, tuned: bool) -> dict:
+    """Run writers and readers against a fresh database; return counts."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_manager = DataManager(Path(tmp) / "news.db", pool_size=writers + readers)
+        if not tuned:
+            use_default_engine(data_manager)
+        session_ids = [data_manager.create_session(f"topic {i}", 6, "you@example.com") for i in range(writers)]
+        for i in range(HISTORY_CYCLES):
+            data_manager.store_cycle(session_ids[i % writers], ARTICLES, ANALYSIS)
+        
+        counts = {'writes': 0, 'reads': 0, 'long_reads': 0, 'locked': 0, 'errors': 0}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + seconds
+        
+        def count(key: str):
+            with lock:
+                counts[key] += 1
+        
+        def attempt(operation, key: str):
+            try:
+                operation()
+                count(key)
+            except OperationalError as e:
+                count('locked' if 'locked' in str(e) else 'errors')
+        
+        def write(session_id: int):
+            while time.perf_counter() < deadline:
+                attempt(lambda: data_manager.store_cycle(session_id, ARTICLES, ANALYSIS), 'writes')
+        
+        def read(i: int):
+            queries = (
+                lambda: data_manager.get_session_articles(session_ids[i % writers], last_runs=5),
+                lambda: data_manager.get_article_stats(session_ids),
+                lambda: data_manager.search("energy markets", limit=10),
+                lambda: data_manager.get_active_sessions(),
+            )
+            n = 0
+            while time.perf_counter() < deadline:
+                attempt(queries[n % len(queries)], 'reads')
+                n += 1
+        
+        def long_read():
+            pause = LONG_READ_SECONDS / (HISTORY_CYCLES * len(ARTICLES) / 100)
+            
+            def stream():
+                for n, _ in enumerate(data_manager.iter_articles(session_ids, batch_size=100)):
+                    if n % 100 == 0:
+                        time.sleep(pause)
+            
+            while time.perf_counter() < deadline:
+                attempt(stream, 'long_reads')
+        
+        threads = [threading.Thread(target=write, args=(session_id,)) for session_id in session_ids]
+        threads += [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+        threads.append(threading.Thread(target=long_read))
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counts['seconds'] = time.perf_counter() - start
+        data_manager.close()
+    
+    return counts
+
+
+def report(name: str, counts: dict):
+    """Print throughput and errors of one run."""
+    seconds = counts['seconds']
+    print(
+        f"{name:24s} {counts['writes'] / seconds:8.1f} cycles/s  {counts['reads'] / seconds:8.1f} reads/s  "
+        f"{counts['long_reads']:3d} long reads  {counts['locked']:6d} locked  {counts['errors']:4d} other errors"
+    )
+
+
+def main():
+    writers = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 20
+    
+    print(f"Writers: {writers}  Readers: {readers}  Duration: {seconds:.0f} s each")
+    report("Default engine", stress(writers, readers, seconds, tuned=False))
+    report("WAL, pragmas, pool", stress(writers, readers, seconds, tuned=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,12 @@ and DeepSeek API to search the web and deliver email reports.
 import sys
 import logging
 import signal
+from contextlib import closing
 from pathlib import Path
 from datetime import datetime
 import click
 from rich.console import Console
+from rich.markup import escape
 from rich.logging import RichHandler
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
@@ -20,12 +22,11 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from src.config.config_manager import ConfigManager
-from src.api.api_client import DeepSeekClient
-from src.agents.news_agent import NewsAgent
-from src.reporters.report_generator import ReportGenerator
-from src.reporters.email_reporter import EmailReporter
+from src.components import Components
+from src.api.llm_cache import LLMCache
 from src.scheduler.scheduler import NewsScheduler
-from src.scheduler.data_manager import DataManager
+from src.scheduler.data_manager import DataManager, MATCH_START, MATCH_END
+from src.reporters.report_generator import first_unique_articles
 
 console = Console()
 logger = logging.getLogger(__name__)
@@ -60,8 +61,7 @@ def run_monitoring_cycle(
     session_id: int,
     prompt: str,
     email_to: str,
-    config: ConfigManager,
-    data_manager: DataManager
+    components: Components
 ):
     """
     Run a single monitoring cycle.
@@ -70,43 +70,31 @@ def run_monitoring_cycle(
         session_id: Monitoring session ID
         prompt: Search prompt
         email_to: Email recipient
-        config: Configuration manager
-        data_manager: Data manager
+        components: Shared process-wide components
     """
     try:
         logger.info(f"Running monitoring cycle for session {session_id}")
         
-        # Initialize components
-        deepseek = DeepSeekClient(
-            api_key=config.deepseek_api_key,
-            base_url=config.deepseek_base_url,
-            model=config.deepseek_model,
-            temperature=config.deepseek_temperature,
-            max_tokens=config.deepseek_max_tokens
-        )
-        
-        agent = NewsAgent(
-            api_key=config.deepseek_api_key,
-            base_url=config.deepseek_base_url,
-            model=config.deepseek_model,
-            temperature=config.deepseek_temperature,
-            search_tool=config.search_default_tool,
-            max_results=config.search_max_results
-        )
+        agent = components.agent
+        data_manager = components.data_manager
         
         # Search for news
-        articles = agent.search_news(prompt)
+        articles = agent.search_news(prompt, session_id=session_id)
+        if not articles:
+            # Everything found was already reported in this session
+            data_manager.update_session_run(session_id)
+            logger.info(f"No new articles for session {session_id}, skipping analysis and report")
+            return
         
         # Analyze with context-aware agent
-        analysis = agent.analyze_results(prompt, articles)
+        analysis, analyzed = agent.analyze_articles(prompt, articles)
         
-        # Store data
-        data_manager.store_articles(session_id, articles)
-        data_manager.store_report(session_id, analysis, len(articles))
-        data_manager.update_session_run(session_id)
+        # Store data, then mark the analyzed stories as reported
+        data_manager.store_cycle(session_id, articles, analysis)
+        agent.remember_articles(session_id, analyzed)
         
         # Generate and send report
-        report_gen = ReportGenerator()
+        report_gen = components.report_generator
         html_report = report_gen.generate_html_report(
             articles, analysis, prompt, "scheduled"
         )
@@ -114,15 +102,7 @@ def run_monitoring_cycle(
             articles, analysis, prompt, "scheduled"
         )
         
-        email_reporter = EmailReporter(
-            smtp_server=config.email_smtp_server,
-            smtp_port=config.email_smtp_port,
-            from_address=config.email_from,
-            password=config.email_password,
-            use_tls=config.email_use_tls
-        )
-        
-        email_reporter.send_scheduled_report(email_to, prompt, html_report, text_report)
+        components.email_reporter.send_scheduled_report(email_to, prompt, html_report, text_report)
         
         logger.info(f"Monitoring cycle completed for session {session_id}")
         
@@ -167,22 +147,8 @@ def instant(prompt: str, email: str, config: str):
         # Initialize components
         task = progress.add_task("Initializing...", total=None)
         
-        deepseek = DeepSeekClient(
-            api_key=cfg.deepseek_api_key,
-            base_url=cfg.deepseek_base_url,
-            model=cfg.deepseek_model,
-            temperature=cfg.deepseek_temperature,
-            max_tokens=cfg.deepseek_max_tokens
-        )
-        
-        agent = NewsAgent(
-            api_key=cfg.deepseek_api_key,
-            base_url=cfg.deepseek_base_url,
-            model=cfg.deepseek_model,
-            temperature=cfg.deepseek_temperature,
-            search_tool=cfg.search_default_tool,
-            max_results=cfg.search_max_results
-        )
+        components = Components(cfg)
+        agent = components.agent
         
         # Search for news
         progress.update(task, description=f"Searching for news about: {prompt}")
@@ -198,21 +164,14 @@ def instant(prompt: str, email: str, config: str):
         
         # Generate report
         progress.update(task, description="Generating report...")
-        report_gen = ReportGenerator()
+        report_gen = components.report_generator
         html_report = report_gen.generate_html_report(articles, analysis, prompt, "instant")
         text_report = report_gen.generate_text_report(articles, analysis, prompt, "instant")
         
         # Send email
         progress.update(task, description=f"Sending report to {email}...")
-        email_reporter = EmailReporter(
-            smtp_server=cfg.email_smtp_server,
-            smtp_port=cfg.email_smtp_port,
-            from_address=cfg.email_from,
-            password=cfg.email_password,
-            use_tls=cfg.email_use_tls
-        )
-        
-        success = email_reporter.send_instant_report(email, prompt, html_report, text_report)
+        success = components.email_reporter.send_instant_report(email, prompt, html_report, text_report)
+        components.close()
         
         if success:
             console.print(f"\n[bold green]✓ Report sent successfully to {email}![/bold green]")
@@ -225,8 +184,9 @@ def instant(prompt: str, email: str, config: str):
 @click.option('--prompt', '-p', required=True, help='Search query/topic')
 @click.option('--email', '-e', required=True, help='Email address to send reports')
 @click.option('--interval', '-i', type=int, required=True, help='Monitoring interval in hours')
+@click.option('--register-only', is_flag=True, help='Only create the session and let a running daemon pick it up')
 @click.option('--config', '-c', default=None, help='Path to config file')
-def schedule(prompt: str, email: str, interval: int, config: str):
+def schedule(prompt: str, email: str, interval: int, register_only: bool, config: str):
     """Start scheduled news monitoring (runs every N hours)."""
     
     global scheduler_instance
@@ -245,8 +205,9 @@ def schedule(prompt: str, email: str, interval: int, config: str):
             console.print(f"  - {key}")
         sys.exit(1)
     
-    # Initialize data manager
-    data_manager = DataManager(cfg.database_path)
+    # Shared components (the data manager keeps the history index up to date)
+    components = Components(cfg)
+    data_manager = components.data_manager
     
     # Create monitoring session
     session_id = data_manager.create_session(prompt, interval, email)
@@ -256,6 +217,11 @@ def schedule(prompt: str, email: str, interval: int, config: str):
     console.print(f"[cyan]Interval:[/cyan] Every {interval} hours")
     console.print(f"[cyan]Email:[/cyan] {email}\n")
     
+    if register_only:
+        console.print("[green]✓ Session registered, it will be picked up by the running daemon[/green]")
+        components.close()
+        return
+    
     # Initialize scheduler
     scheduler_instance = NewsScheduler(cfg.scheduler_timezone)
     
@@ -266,8 +232,7 @@ def schedule(prompt: str, email: str, interval: int, config: str):
         callback=run_monitoring_cycle,
         prompt=prompt,
         email_to=email,
-        config=cfg,
-        data_manager=data_manager
+        components=components
     )
     
     scheduler_instance.start()
@@ -284,9 +249,90 @@ def schedule(prompt: str, email: str, interval: int, config: str):
         console.print("\n[yellow]Stopping monitoring...[/yellow]")
         data_manager.stop_session(session_id)
         scheduler_instance.stop()
+        components.close()
         console.print("[green]✓ Monitoring stopped[/green]")
 
 
+@cli.command()
+@click.option('--workers', '-w', type=int, default=None, help='Max monitoring cycles running at once')
+@click.option('--poll', type=int, default=None, help='Seconds between checks for added/stopped sessions')
+@click.option('--config', '-c', default=None, help='Path to config file')
+def daemon(workers: int, poll: int, config: str):
+    """Run every active monitoring session in a single long-lived process."""
+    
+    global scheduler_instance
+    
+    console.print("[bold blue]🛰️ News Aggregation System - Monitoring Daemon[/bold blue]\n")
+    
+    # Load configuration
+    cfg = ConfigManager(config)
+    setup_logging(cfg.log_level)
+    
+    # Validate configuration
+    is_valid, missing = cfg.validate_required()
+    if not is_valid:
+        console.print("[bold red]Error: Missing required configuration:[/bold red]")
+        for key in missing:
+            console.print(f"  - {key}")
+        sys.exit(1)
+    
+    workers = workers or cfg.scheduler_max_workers
+    poll = poll or cfg.scheduler_poll_interval
+    
+    components = Components(cfg, max_workers=workers)
+    data_manager = components.data_manager
+    scheduler_instance = NewsScheduler(cfg.scheduler_timezone, max_workers=workers)
+    
+    # Resume every active session stored in the database
+    added, _ = scheduler_instance.sync_sessions(
+        data_manager.get_active_sessions(),
+        callback=run_monitoring_cycle,
+        components=components
+    )
+    scheduler_instance.start()
+    
+    console.print(f"[green]✓[/green] Resumed {added} active session(s)")
+    console.print(f"[cyan]Workers:[/cyan] {workers}")
+    console.print(f"[cyan]Session poll:[/cyan] every {poll} seconds")
+    console.print(f"[yellow]Press Ctrl+C to stop[/yellow]\n")
+    
+    # Pick up sessions added or stopped from other processes
+    try:
+        import time
+        while True:
+            time.sleep(poll)
+            try:
+                scheduler_instance.sync_sessions(
+                    data_manager.get_active_sessions(),
+                    callback=run_monitoring_cycle,
+                    components=components
+                )
+            except Exception as e:
+                logger.error(f"Error synchronizing sessions: {e}")
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopping daemon...[/yellow]")
+        scheduler_instance.stop()
+        components.close()
+        console.print("[green]✓ Daemon stopped[/green]")
+
+
+@cli.command()
+@click.option('--session-id', '-s', type=int, required=True, help='Session ID to stop')
+@click.option('--config', '-c', default=None, help='Path to config file')
+def stop(session_id: int, config: str):
+    """Stop a monitoring session (a running daemon drops it on its next poll)."""
+    
+    cfg = ConfigManager(config)
+    data_manager = DataManager(cfg.database_path)
+    
+    if not data_manager.get_session(session_id):
+        console.print(f"[bold red]Error: Session {session_id} not found[/bold red]")
+        sys.exit(1)
+    
+    data_manager.stop_session(session_id)
+    console.print(f"[green]✓ Stopped monitoring session #{session_id}[/green]")
+
+
 @cli.command()
 @click.option('--session-id', '-s', type=int, help='Specific session ID')
 @click.option('--all', 'all_sessions', is_flag=True, help='Aggregate all sessions')
@@ -314,14 +360,8 @@ def aggregate(session_id: int, all_sessions: bool, email: str, config: str):
         sys.exit(1)
     
     # Initialize components
-    data_manager = DataManager(cfg.database_path)
-    deepseek = DeepSeekClient(
-        api_key=cfg.deepseek_api_key,
-        base_url=cfg.deepseek_base_url,
-        model=cfg.deepseek_model,
-        temperature=cfg.deepseek_temperature,
-        max_tokens=cfg.deepseek_max_tokens
-    )
+    components = Components(cfg)
+    data_manager = components.data_manager
     
     with Progress(
         SpinnerColumn(),
@@ -345,45 +385,33 @@ def aggregate(session_id: int, all_sessions: bool, email: str, config: str):
             console.print("[yellow]No sessions found[/yellow]")
             sys.exit(0)
         
-        # Collect all data
-        all_articles = []
-        all_reports = []
+        # Count in SQL and stream articles only until the report's list is full
+        session_ids = [session['id'] for session in sessions_to_aggregate]
         prompt = sessions_to_aggregate[0]['prompt']
         start_date = min(s['started_at'] for s in sessions_to_aggregate)
         end_date = datetime.now()
         
-        for session in sessions_to_aggregate:
-            sid = session['id']
-            articles_grouped = data_manager.get_session_articles(sid)
-            all_articles.extend(articles_grouped)
-            reports = data_manager.get_session_reports(sid)
-            all_reports.extend(reports)
+        stats = data_manager.get_article_stats(session_ids)
+        with closing(data_manager.iter_articles(session_ids)) as articles:
+            unique_articles = first_unique_articles(articles)
         
         console.print(f"[green]✓[/green] Retrieved data from {len(sessions_to_aggregate)} session(s)")
-        console.print(f"[green]✓[/green] Total articles: {sum(len(group) for group in all_articles)}")
+        console.print(f"[green]✓[/green] Total articles: {stats['articles']}")
         
         # Generate aggregate analysis
         progress.update(task, description="Creating aggregate analysis...")
-        aggregate_analysis = deepseek.create_aggregate_summary(all_reports) if all_reports else "No previous reports found."
+        aggregate_analysis = components.rollups.summarize_sessions(session_ids)
         
         # Generate report
         progress.update(task, description="Generating aggregate report...")
-        report_gen = ReportGenerator()
-        html_report = report_gen.generate_aggregate_report(
-            all_articles, aggregate_analysis, prompt, start_date, end_date
+        html_report = components.report_generator.generate_aggregate_report(
+            unique_articles, stats, aggregate_analysis, prompt, start_date, end_date
         )
         
         # Send email
         progress.update(task, description=f"Sending report to {email}...")
-        email_reporter = EmailReporter(
-            smtp_server=cfg.email_smtp_server,
-            smtp_port=cfg.email_smtp_port,
-            from_address=cfg.email_from,
-            password=cfg.email_password,
-            use_tls=cfg.email_use_tls
-        )
-        
-        success = email_reporter.send_aggregate_report(email, prompt, html_report)
+        success = components.email_reporter.send_aggregate_report(email, prompt, html_report)
+        components.close()
         
         if success:
             console.print(f"\n[bold green]✓ Aggregate report sent to {email}![/bold green]")
@@ -392,6 +420,119 @@ def aggregate(session_id: int, all_sessions: bool, email: str, config: str):
             sys.exit(1)
 
 
+def highlight_excerpt(excerpt: str) -> str:
+    """Render a search excerpt as Rich markup with the matched words highlighted."""
+    text = escape(' '.join((excerpt or '').split()))
+    return text.replace(MATCH_START, '[bold yellow]').replace(MATCH_END, '[/bold yellow]')
+
+
+@cli.command()
+@click.argument('query')
+@click.option('--reports', is_flag=True, help='Search report analyses instead of articles')
+@click.option('--session-id', '-s', type=int, default=None, help='Only search this session')
+@click.option('--since', type=click.DateTime(), default=None, help='Only results from this date on')
+@click.option('--until', type=click.DateTime(), default=None, help='Only results before this date')
+@click.option('--limit', '-n', type=int, default=20, help='Max number of results shown')
+@click.option('--config', '-c', default=None, help='Path to config file')
+def search(query: str, reports: bool, session_id: int, since: datetime, until: datetime, limit: int, config: str):
+    """Full-text search over stored articles or reports (e.g. "opec cut*")."""
+    
+    cfg = ConfigManager(config)
+    data_manager = DataManager(cfg.database_path)
+    
+    kind = 'reports' if reports else 'articles'
+    results = data_manager.search(
+        query, kind=kind, session_id=session_id, since=since, until=until, limit=limit
+    )
+    if not results:
+        console.print(f"[yellow]No matching {kind} found[/yellow]")
+        return
+    
+    console.print(f"[bold blue]{kind.capitalize()} matching:[/bold blue] {escape(query)}\n")
+    for result in results:
+        if reports:
+            console.print(
+                f"[cyan]Report #{result['id']}[/cyan] · session #{result['session_id']} · "
+                f"{result['created_at']:%Y-%m-%d %H:%M} · {result['article_count']} articles"
+            )
+        else:
+            console.print(f"[cyan]{escape(result['title'] or 'Untitled Article')}[/cyan]")
+            console.print(
+                f"  {escape(result['source'] or 'Web')} · {result['found_at']:%Y-%m-%d %H:%M} · "
+                f"session #{result['session_id']} · {escape(result['url'] or 'N/A')}"
+            )
+        console.print(f"  {highlight_excerpt(result['excerpt'])}\n")
+
+
+@cli.command('search-history')
+@click.argument('query')
+@click.option('--session-id', '-s', type=int, default=None, help='Only search this session')
+@click.option('--limit', '-n', type=int, default=10, help='Max number of articles shown')
+@click.option('--rebuild', is_flag=True, help='Re-index all stored articles first')
+@click.option('--config', '-c', default=None, help='Path to config file')
+def search_history(query: str, session_id: int, limit: int, rebuild: bool, config: str):
+    """Search stored articles of past monitoring runs (local vector index)."""
+    
+    cfg = ConfigManager(config)
+    setup_logging(cfg.log_level)
+    
+    if not cfg.history_index_enabled:
+        console.print("[bold red]Error: history_index is disabled in the configuration[/bold red]")
+        sys.exit(1)
+    
+    data_manager = Components(cfg).data_manager
+    if rebuild:
+        data_manager.vector_index.clear()
+    
+    # Catch up with articles stored before the index existed
+    indexed = data_manager.sync_vector_index()
+    if indexed:
+        console.print(f"[green]✓[/green] Indexed {indexed} stored articles")
+    
+    results = data_manager.search_history(query, limit=limit, session_id=session_id)
+    if not results:
+        console.print("[yellow]No matching articles found[/yellow]")
+        return
+    
+    console.print(f"[bold blue]Articles matching:[/bold blue] {escape(query)}\n")
+    for result in results:
+        article = result['article']
+        found = article.found_at.strftime('%Y-%m-%d %H:%M') if article.found_at else 'unknown date'
+        console.print(f"[cyan]{result['score']:.2f}[/cyan] {escape(article.title)}")
+        console.print(f"  {escape(article.source)} · {found} · session #{result['session_id']}")
+        console.print(f"  {escape(article.url)}\n")
+
+
+@cli.command()
+@click.option('--session-id', '-s', type=int, required=True, help='Session to list runs of')
+@click.option('--limit', '-n', type=int, default=20, help='Runs per page')
+@click.option('--before', type=int, default=None, help='Only runs older than this run ID (next page)')
+@click.option('--articles', is_flag=True, help='Also list each run\'s articles')
+@click.option('--config', '-c', default=None, help='Path to config file')
+def runs(session_id: int, limit: int, before: int, articles: bool, config: str):
+    """List the monitoring runs of a session, newest first."""
+    
+    cfg = ConfigManager(config)
+    data_manager = DataManager(cfg.database_path)
+    
+    page = data_manager.get_runs(session_id, limit=limit, before_id=before)
+    if not page:
+        console.print(f"[yellow]No runs found for session {session_id}[/yellow]")
+        return
+    
+    console.print(
+        f"[bold blue]Runs of session #{session_id}[/bold blue] ({data_manager.count_runs(session_id)} total)\n"
+    )
+    for run in page:
+        console.print(f"[cyan]Run #{run['id']}[/cyan] · {run['run_at']:%Y-%m-%d %H:%M} · {run['article_count']} articles")
+        if articles:
+            for article in data_manager.get_run_articles(run['id']):
+                console.print(f"  {escape(article.title)} ({escape(article.source)})")
+    
+    if len(page) == limit:
+        console.print(f"\nNext page: --before {page[-1]['id']}")
+
+
 @cli.command()
 @click.option('--config', '-c', default=None, help='Path to config file')
 def status(config: str):
@@ -415,6 +556,12 @@ def status(config: str):
         console.print(f"  Started: {session['started_at']}")
         console.print(f"  Last run: {session['last_run_at'] or 'Not yet run'}")
         console.print(f"  Email: {session['email_to']}\n")
+    
+    if cfg.cache_enabled and cfg.cache_path.exists():
+        cache_stats = LLMCache(cfg.cache_path).stats()
+        console.print(f"[bold blue]LLM Cache:[/bold blue] {cache_stats['entries']} cached responses")
+        for stage, counts in cache_stats['stages'].items():
+            console.print(f"  {stage}: {counts['hits']} hits, {counts['misses']} misses")
 
 
 if __name__ == '__main__':
@@ -1,12 +1,28 @@
 """Research chains for the news agent."""
 
+import asyncio
 import logging
-from typing import List, Dict, Any
+import re
+from typing import List, Optional, Tuple
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
+from langchain_core.messages import SystemMessage, HumanMessage, BaseMessage
+
+from .event_loop import run_sync
+from ..api.llm_cache import LLMCache
+from ..models.article import Article
+from ..api.tokens import (
+    TokenUsage, count_tokens, messages_tokens, pack_articles, truncate_to_tokens
+)
 
 logger = logging.getLogger(__name__)
 
+# Report text used when the analysis call fails
+ANALYSIS_ERROR = "Error generating analysis."
+
+# Lines of a query list that introduce it instead of being a query
+# ("Here are 3 queries:", "Search queries:", "Sure!")
+_PREAMBLE_RE = re.compile(r'^(?:here (?:are|is)|sure|certainly)\b|:$', re.IGNORECASE)
+
 
 class ResearchChain:
     """
@@ -16,20 +32,156 @@ class ResearchChain:
     3. Analyze: Synthesize findings with context.
     """
     
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(
+        self,
+        llm: ChatOpenAI,
+        cache: Optional[LLMCache] = None,
+        token_budget: int = 12000,
+        usage: Optional[TokenUsage] = None
+    ):
         """
         Initialize the research chain.
         
         Args:
             llm: Configured ChatOpenAI instance
+            cache: Response cache for repeated prompts (optional)
+            token_budget: Max prompt tokens for the analysis call
+            usage: Shared token usage record (optional)
         """
         self.llm = llm
+        self.cache = cache
+        self.token_budget = token_budget
+        self.usage = usage or TokenUsage()
+    
+    async def _ainvoke(
+        self,
+        stage: str,
+        messages: List[BaseMessage],
+        key_messages: Optional[List[BaseMessage]] = None
+    ) -> Tuple[str, bool]:
+        """
+        Invoke the LLM, serving repeated requests from the cache.
+        
+        Args:
+            stage: Pipeline stage used for cache TTL and counters
+            messages: Messages to send
+            key_messages: Messages the cache key is built from (default:
+                ``messages``); leaves out inputs that change on every run,
+                such as the memory context
+        
+        Returns:
+            Tuple of (response content, whether it came from the cache)
+        """
+        key = None
+        if self.cache is not None:
+            key = LLMCache.make_key(self.llm.model_name, self.llm.temperature, key_messages or messages)
+            # The lookup writes (access time, counters), so it stays off the event loop
+            cached = await asyncio.to_thread(self.cache.get, stage, key)
+            if cached is not None:
+                self.usage.record(stage, 0, cached=True)
+                return cached, True
+        
+        response = await self.llm.ainvoke(messages)
+        
+        # Prefer the provider's counts, fall back to the local tokenizer
+        usage_metadata = getattr(response, 'usage_metadata', None) or {}
+        self.usage.record(
+            stage,
+            usage_metadata.get('input_tokens') or messages_tokens(messages),
+            usage_metadata.get('output_tokens') or count_tokens(response.content)
+        )
+        
+        if key is not None:
+            await asyncio.to_thread(self.cache.set, stage, key, response.content)
+        return response.content, False
         
     def generate_search_query(self, prompt: str, context: str) -> str:
         """
         Generate a refined search query based on prompt and context.
         """
-        messages = [
+        return run_sync(self.agenerate_search_query(prompt, context))
+    
+    async def agenerate_search_query(self, prompt: str, context: str) -> str:
+        """
+        Generate a refined search query based on prompt and context (async).
+        """
+        messages = self._search_query_messages(prompt, context)
+        
+        try:
+            content, _ = await self._ainvoke(
+                'search_query', messages, self._search_query_messages(prompt, '')
+            )
+            query = content.strip().replace('"', '')
+            logger.info(f"Generated search query: {query}")
+            return query
+        except Exception as e:
+            logger.error(f"Error generating search query: {e}")
+            return prompt  # Fallback to original prompt
+    
+    def generate_search_queries(self, prompt: str, context: str, count: int = 3) -> List[str]:
+        """
+        Generate several complementary search queries based on prompt and context.
+        """
+        return run_sync(self.agenerate_search_queries(prompt, context, count))
+    
+    async def agenerate_search_queries(self, prompt: str, context: str, count: int = 3) -> List[str]:
+        """
+        Generate several complementary search queries based on prompt and context (async).
+        
+        Args:
+            prompt: User prompt
+            context: Context from previous reports
+            count: Number of queries to generate
+        
+        Returns:
+            Up to ``count`` distinct queries (the prompt itself on failure)
+        """
+        if count <= 1:
+            return [await self.agenerate_search_query(prompt, context)]
+        
+        messages = self._search_queries_messages(prompt, context, count)
+        
+        try:
+            content, _ = await self._ainvoke(
+                'search_query', messages, self._search_queries_messages(prompt, '', count)
+            )
+            queries = []
+            for line in content.splitlines():
+                # Strip list markers and quotes the model may add
+                query = re.sub(r'^\s*(?:[-*•]|\d+[.)])\s*', '', line).strip().strip('"\'')
+                if _PREAMBLE_RE.search(query):
+                    continue
+                if query and query.lower() not in (q.lower() for q in queries):
+                    queries.append(query)
+            
+            queries = queries[:count] or [prompt]
+            logger.info(f"Generated search queries: {queries}")
+            return queries
+        except Exception as e:
+            logger.error(f"Error generating search queries: {e}")
+            return [prompt]  # Fallback to original prompt
+    
+    def _search_queries_messages(self, prompt: str, context: str, count: int) -> List[BaseMessage]:
+        """Build the strategist messages for generating several queries."""
+        return [
+            SystemMessage(content=(
+                "You are a research strategist. Your goal is to create a set of complementary "
+                "web search queries that together find new information about a topic.\n"
+                "Consider the user's prompt and the context of what we already know.\n"
+                "Each query should cover a different angle (e.g. latest events, key actors, "
+                "regional or industry impact) so that results overlap as little as possible.\n"
+                f"Return ONLY {count} search queries, one per line, nothing else."
+            )),
+            HumanMessage(content=(
+                f"User Prompt: {prompt}\n\n"
+                f"Context (Previous Reports):\n{context}\n\n"
+                f"Generate {count} search queries to find the latest updates or missing details."
+            ))
+        ]
+    
+    def _search_query_messages(self, prompt: str, context: str) -> List[BaseMessage]:
+        """Build the strategist messages for query generation."""
+        return [
             SystemMessage(content=(
                 "You are a research strategist. Your goal is to create the most effective "
                 "web search query to find new information about a topic.\n"
@@ -42,37 +194,90 @@ class ResearchChain:
                 "Generate a search query to find the latest updates or missing details."
             ))
         ]
-        
-        try:
-            response = self.llm.invoke(messages)
-            query = response.content.strip().replace('"', '')
-            logger.info(f"Generated search query: {query}")
-            return query
-        except Exception as e:
-            logger.error(f"Error generating search query: {e}")
-            return prompt  # Fallback to original prompt
             
-    def analyze_results(self, prompt: str, articles: List[Dict[str, Any]], context: str) -> str:
+    def analyze_results(self, prompt: str, articles: List[Article], context: str) -> str:
         """
         Analyze search results and generate a report, considering context.
         """
+        return run_sync(self.aanalyze_results(prompt, articles, context))
+    
+    async def aanalyze_results(self, prompt: str, articles: List[Article], context: str) -> str:
+        """
+        Analyze search results and generate a report, considering context (async).
+        """
+        analysis, _, _ = await self.aanalyze_packed(prompt, articles, context)
+        return analysis
+    
+    async def aanalyze_packed(
+        self,
+        prompt: str,
+        articles: List[Article],
+        context: str
+    ) -> Tuple[str, List[Article], bool]:
+        """
+        Analyze search results and tell which articles the report covers (async).
+        
+        The response is cached by prompt and packed articles, not by the
+        context, so the same articles on the same topic get the same report.
+        
+        Args:
+            prompt: User prompt
+            articles: Articles in priority order
+            context: Context from previous reports
+        
+        Returns:
+            Tuple of (analysis, articles that fit the token budget, whether
+            the analysis came from the cache); no articles if the analysis failed
+        """
+        messages, packed = self._analysis_messages(prompt, articles, context)
+        key_messages, _ = self._analysis_messages(prompt, articles, '')
+        
+        try:
+            analysis, cached = await self._ainvoke('analysis', messages, key_messages)
+            return analysis, packed, cached
+        except Exception as e:
+            logger.error(f"Error analyzing results: {e}")
+            return ANALYSIS_ERROR, [], False
+    
+    def _analysis_messages(
+        self,
+        prompt: str,
+        articles: List[Article],
+        context: str
+    ) -> Tuple[List[BaseMessage], List[Article]]:
+        """Build the analyst messages packed into the token budget, and the articles that fit."""
+        system_prompt = (
+            "You are a professional news analyst. Your task is to write a comprehensive update report.\n"
+            "1. Focus on NEW information found in the articles.\n"
+            "2. Reference the 'Previous Context' to show continuity or changes.\n"
+            "3. If the new articles just repeat the context, state that there are no significant updates.\n"
+            "4. Cite sources (titles/publications) in your analysis."
+        )
+        
+        # Context gets at most a quarter of the budget, articles get the rest.
+        # The quarter is reserved even when the context is shorter, so which
+        # articles fit does not depend on the context.
+        context_budget = self.token_budget // 4
+        context = truncate_to_tokens(context, context_budget)
+        articles_budget = (
+            self.token_budget - count_tokens(system_prompt) - context_budget
+            - count_tokens(prompt) - 64
+        )
+        # Full text from enrichment replaces the search snippet when available
+        packed = pack_articles(articles, articles_budget)
+        
         # Format articles for the LLM
         articles_text = "\n\n".join([
-            f"Title: {a.get('title', 'N/A')}\n"
-            f"Source: {a.get('source', 'N/A')}\n"
-            f"URL: {a.get('url', 'N/A')}\n"
-            f"Content: {a.get('snippet', 'N/A')}"
-            for a in articles
+            f"Title: {a.title}\n"
+            f"Source: {a.source}\n"
+            f"URL: {a.url}\n"
+            f"Published: {a.published or 'N/A'}\n"
+            f"Content: {body or 'N/A'}"
+            for a, body in packed
         ])
         
         messages = [
-            SystemMessage(content=(
-                "You are a professional news analyst. Your task is to write a comprehensive update report.\n"
-                "1. Focus on NEW information found in the articles.\n"
-                "2. Reference the 'Previous Context' to show continuity or changes.\n"
-                "3. If the new articles just repeat the context, state that there are no significant updates.\n"
-                "4. Cite sources (titles/publications) in your analysis."
-            )),
+            SystemMessage(content=system_prompt),
             HumanMessage(content=(
                 f"Topic: {prompt}\n\n"
                 f"Previous Context:\n{context}\n\n"
@@ -80,10 +285,4 @@ class ResearchChain:
                 "Write the analysis report:"
             ))
         ]
-        
-        try:
-            response = self.llm.invoke(messages)
-            return response.content
-        except Exception as e:
-            logger.error(f"Error analyzing results: {e}")
-            return "Error generating analysis."
+        return messages, [a for a, _ in packed]
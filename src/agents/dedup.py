@@ -0,0 +1,306 @@
+"""Repeated-story detection: seen canonical URLs and near duplicates (MinHash/LSH)."""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import List, Optional, Set, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from ..models.article import Article
+from .urls import url_hash
+
+if TYPE_CHECKING:
+    from ..scheduler.data_manager import DataManager
+
+logger = logging.getLogger(__name__)
+
+# Signatures of 60 min-hashes split into 20 bands of 3: pairs with a word-pair
+# Jaccard similarity of 0.5 share at least one band 93% of the time, pairs
+# at 0.2 only 15% of the time (and are then rejected on the full signature)
+NUM_PERM = 60
+BAND_ROWS = 3
+NUM_BANDS = NUM_PERM // BAND_ROWS
+
+# Texts shorter than this give signatures too unstable to compare
+MIN_TOKENS = 6
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def _hash64(data: str) -> int:
+    """Stable 64-bit hash (Python's hash() changes between runs)."""
+    return int.from_bytes(hashlib.blake2b(data.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+# Fixed multiply-add hash family, derived from constants so signatures stay
+# comparable with the ones already stored
+_MULTIPLIERS = np.array([_hash64(f"minhash-a-{i}") | 1 for i in range(NUM_PERM)], dtype=np.uint64)
+_OFFSETS = np.array([_hash64(f"minhash-b-{i}") for i in range(NUM_PERM)], dtype=np.uint64)
+
+
+def minhash(text: str) -> Optional[np.ndarray]:
+    """
+    Compute the MinHash signature of a text's word pairs.
+    
+    The fraction of equal positions in two signatures estimates the Jaccard
+    similarity of the texts' sets of consecutive word pairs, which stays high
+    for reworded, truncated or re-titled copies of the same story.
+    
+    Args:
+        text: Text to sign
+    
+    Returns:
+        Array of NUM_PERM uint32 min-hashes, or None if the text is too short
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    if len(tokens) < MIN_TOKENS:
+        return None
+    
+    shingles = {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+    hashes = np.fromiter((_hash64(s) for s in shingles), dtype=np.uint64, count=len(shingles))
+    
+    # uint64 arithmetic wraps, giving a multiply-add hash mod 2**64 per permutation
+    permuted = (hashes[:, None] * _MULTIPLIERS + _OFFSETS) >> np.uint64(32)
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def article_signature(article: Article) -> Optional[np.ndarray]:
+    """
+    Sign an article by its title and snippet.
+    
+    Args:
+        article: Article to sign
+    
+    Returns:
+        MinHash signature, or None if the article has too little text
+    """
+    return minhash(f"{article.title} {article.snippet}")
+
+
+def band_keys(signature: np.ndarray) -> List[int]:
+    """
+    Hash each LSH band of a signature to one signed 64-bit key.
+    
+    Args:
+        signature: MinHash signature
+    
+    Returns:
+        NUM_BANDS keys (the band number is part of each key)
+    """
+    keys = []
+    for band in range(NUM_BANDS):
+        rows = signature[band * BAND_ROWS:(band + 1) * BAND_ROWS].tobytes()
+        digest = hashlib.blake2b(bytes([band]) + rows, digest_size=8).digest()
+        # Signed so the key fits a SQLite INTEGER
+        keys.append(int.from_bytes(digest, 'little', signed=True))
+    return keys
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signed texts."""
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+
+class NearDuplicateIndex:
+    """
+    In-memory LSH index of MinHash signatures.
+    
+    Signatures are filed under their band keys, so a lookup only compares
+    against signatures sharing a band instead of all of them.
+    """
+    
+    def __init__(self, threshold: float = 0.5):
+        """
+        Initialize an empty index.
+        
+        Args:
+            threshold: Min estimated similarity counted as a near duplicate
+        """
+        self.threshold = threshold
+        self._signatures: List[np.ndarray] = []
+        self._buckets = defaultdict(list)
+    
+    def add(self, signature: np.ndarray, keys: Optional[List[int]] = None):
+        """Add a signature (with its band keys, if already computed)."""
+        position = len(self._signatures)
+        self._signatures.append(signature)
+        for key in keys or band_keys(signature):
+            self._buckets[key].append(position)
+    
+    def find(self, signature: np.ndarray, keys: Optional[List[int]] = None) -> bool:
+        """
+        Check whether a near duplicate of a signature is indexed.
+        
+        Args:
+            signature: Signature to look up
+            keys: Its band keys, if already computed
+        
+        Returns:
+            True if an indexed signature is at least ``threshold`` similar
+        """
+        checked = set()
+        for key in keys or band_keys(signature):
+            for position in self._buckets.get(key, ()):
+                if position in checked:
+                    continue
+                checked.add(position)
+                if similarity(signature, self._signatures[position]) >= self.threshold:
+                    return True
+        return False
+
+
+class NearDuplicateFilter:
+    """
+    Drops articles that repeat a story already seen in a monitoring session.
+    
+    Signatures of analyzed articles are persisted per session, so syndicated
+    copies of a story published under different URLs are collapsed within a
+    cycle and skipped in every later cycle.
+    """
+    
+    def __init__(self, data_manager: "DataManager", threshold: float = 0.5):
+        """
+        Initialize the filter.
+        
+        Args:
+            data_manager: Storage for per-session signatures
+            threshold: Min estimated similarity counted as the same story
+        """
+        self.data_manager = data_manager
+        self.threshold = threshold
+    
+    def filter(self, session_id: int, articles: List[Article]) -> List[Article]:
+        """
+        Collapse near-duplicate articles and drop stories seen in earlier cycles.
+        
+        Args:
+            session_id: Monitoring session ID
+            articles: Articles in rank order
+        
+        Returns:
+            Articles that are new, keeping the highest-ranked copy of each story
+        """
+        signatures = [article_signature(article) for article in articles]
+        keys = [band_keys(sig) if sig is not None else None for sig in signatures]
+        
+        # Only stored signatures sharing a band with this batch are loaded
+        index = NearDuplicateIndex(self.threshold)
+        stored = self.data_manager.get_similar_signatures(
+            session_id, {key for article_keys in keys if article_keys for key in article_keys}
+        )
+        for data in stored:
+            index.add(np.frombuffer(data, dtype=np.uint32))
+        
+        kept = []
+        for article, signature, article_keys in zip(articles, signatures, keys):
+            if signature is None:
+                kept.append(article)
+            elif not index.find(signature, article_keys):
+                index.add(signature, article_keys)
+                kept.append(article)
+        
+        if len(kept) < len(articles):
+            logger.info(f"Dropped {len(articles) - len(kept)} near-duplicate articles for session {session_id}")
+        return kept
+    
+    def remember(self, session_id: int, articles: List[Article]):
+        """
+        Record the articles of a completed cycle so later cycles skip them.
+        
+        Args:
+            session_id: Monitoring session ID
+            articles: Analyzed articles
+        """
+        entries = []
+        # Placeholders without a link ("No Results", errors) are not stories
+        for article in articles:
+            signature = article_signature(article) if article.has_link else None
+            if signature is not None:
+                entries.append((signature.tobytes(), band_keys(signature)))
+        if entries:
+            self.data_manager.store_signatures(session_id, entries)
+
+
+class SeenUrlFilter:
+    """
+    Drops articles whose canonical URL was already analyzed in a monitoring session.
+    
+    Each session's URL hashes are loaded from the database into a set, so a
+    lookup is a constant-time membership test; newly analyzed URLs are added
+    to the set and persisted. Sets of the ``max_sessions`` most recently used
+    sessions are cached and reloaded after ``ttl`` seconds, so URLs removed
+    by cleanup_old_data become reportable again.
+    """
+    
+    def __init__(self, data_manager: "DataManager", max_sessions: int = 64, ttl: float = 3600):
+        """
+        Initialize the filter.
+        
+        Args:
+            data_manager: Storage for per-session URL hashes
+            max_sessions: Sessions whose URL hashes are kept in memory
+            ttl: Seconds a session's cached URL hashes are used before reloading
+        """
+        self.data_manager = data_manager
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        # Session ID -> (load time, URL hashes), least recently used first
+        self._seen: "OrderedDict[int, Tuple[float, Set[int]]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _session_hashes(self, session_id: int) -> Set[int]:
+        """Get the cached URL hashes of a session, (re)loading them when missing or expired."""
+        with self._lock:
+            cached = self._seen.get(session_id)
+            if cached is None or time.monotonic() - cached[0] > self.ttl:
+                cached = (time.monotonic(), self.data_manager.get_seen_url_hashes(session_id))
+                self._seen[session_id] = cached
+            self._seen.move_to_end(session_id)
+            while len(self._seen) > self.max_sessions:
+                self._seen.popitem(last=False)
+            return cached[1]
+    
+    def clear(self):
+        """Drop all cached URL hashes (e.g. after cleanup_old_data)."""
+        with self._lock:
+            self._seen.clear()
+    
+    def filter(self, session_id: int, articles: List[Article]) -> List[Article]:
+        """
+        Drop articles already seen in a session.
+        
+        Args:
+            session_id: Monitoring session ID
+            articles: Articles found by this cycle
+        
+        Returns:
+            Articles whose URL is new to the session (placeholders are kept)
+        """
+        seen = self._session_hashes(session_id)
+        kept = [a for a in articles if not a.has_link or url_hash(a.url) not in seen]
+        
+        if len(kept) < len(articles):
+            logger.info(f"Dropped {len(articles) - len(kept)} already seen articles for session {session_id}")
+        return kept
+    
+    def remember(self, session_id: int, articles: List[Article]):
+        """
+        Record the URLs of a completed cycle so later cycles skip them.
+        
+        Args:
+            session_id: Monitoring session ID
+            articles: Analyzed articles
+        """
+        hashes = {url_hash(a.url) for a in articles if a.has_link}
+        if not hashes:
+            return
+        self.data_manager.store_seen_urls(session_id, hashes)
+        with self._lock:
+            # Sessions not cached load the new hashes with the rest
+            cached = self._seen.get(session_id)
+            if cached is not None:
+                cached[1].update(hashes)
@@ -0,0 +1,74 @@
+"""Shared background event loop for the async research pipeline."""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the process-wide research event loop, starting it on first use.
+    
+    Every async LLM and HTTP client is bound to this single loop, so in-flight
+    requests from all monitoring cycles are multiplexed on one thread instead
+    of each holding a scheduler thread busy on blocking I/O.
+    
+    Returns:
+        Running event loop
+    """
+    global _loop, _thread
+    
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(
+                target=_loop.run_forever,
+                name="research-event-loop",
+                daemon=True
+            )
+            _thread.start()
+            logger.debug("Started research event loop")
+    
+    return _loop
+
+
+def submit(coro: Coroutine) -> Future:
+    """
+    Schedule a coroutine on the research event loop.
+    
+    Args:
+        coro: Coroutine to run
+    
+    Returns:
+        concurrent.futures.Future with the coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+
+def run_sync(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """
+    Run a coroutine on the research event loop and wait for its result.
+    
+    Used by the synchronous API so CLI commands and scheduler threads can
+    call into the async pipeline.
+    
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait before giving up (None waits forever)
+    
+    Returns:
+        The coroutine's result
+    """
+    if threading.current_thread() is _thread:
+        coro.close()
+        raise RuntimeError("run_sync() cannot be called from the research event loop; await instead")
+    
+    return submit(coro).result(timeout)
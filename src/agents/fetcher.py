@@ -0,0 +1,347 @@
+"""Concurrent, pooled article fetcher with an on-disk HTTP cache."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Cache writes between two passes of cache pruning
+PRUNE_EVERY = 200
+
+
+class _HostState:
+    """Pooled session and politeness state of one host."""
+    
+    def __init__(self, per_host_limit: int):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=per_host_limit)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.slot = threading.BoundedSemaphore(per_host_limit)
+        self.lock = threading.Lock()
+        self.last_request = 0.0
+        # Fetches currently using this state; only unused states are evicted
+        self.users = 0
+
+
+class ArticleFetcher:
+    """
+    Fetches article pages concurrently with per-host pooling and politeness.
+    
+    Each host gets its own pooled session, at most ``per_host_limit`` requests
+    at a time and at least ``min_host_interval`` seconds between request
+    starts; the state of the ``max_hosts`` most recently used hosts is kept.
+    Bodies are streamed and cut at ``max_bytes``. Responses are cached on
+    disk and revalidated with ETag / Last-Modified once they are older than
+    ``cache_ttl``; entries unused for ``cache_max_age`` seconds or beyond
+    ``cache_max_bytes`` in total (least recently used first) are deleted.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: Path = Path("data/http_cache"),
+        max_workers: int = 8,
+        per_host_limit: int = 2,
+        min_host_interval: float = 0.5,
+        max_bytes: int = 512 * 1024,
+        timeout: float = 10.0,
+        cache_ttl: int = 3600,
+        max_hosts: int = 64,
+        cache_max_bytes: int = 256 * 1024 * 1024,
+        cache_max_age: int = 7 * 24 * 3600
+    ):
+        """
+        Initialize the fetcher.
+        
+        Args:
+            cache_dir: Directory for cached responses
+            max_workers: Max fetches running at once
+            per_host_limit: Max concurrent requests to one host
+            min_host_interval: Min seconds between requests to one host
+            max_bytes: Max bytes downloaded per page
+            timeout: Connect/read timeout per request in seconds
+            cache_ttl: Seconds a cached page is used without revalidation
+            max_hosts: Max pooled host sessions kept open
+            cache_max_bytes: Max total size of the disk cache
+            cache_max_age: Seconds an unused cache entry is kept
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.per_host_limit = per_host_limit
+        self.min_host_interval = min_host_interval
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.max_hosts = max_hosts
+        self.cache_max_bytes = cache_max_bytes
+        self.cache_max_age = cache_max_age
+        
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetcher")
+        self._lock = threading.Lock()
+        # Host -> state, least recently used first
+        self._hosts: "OrderedDict[str, _HostState]" = OrderedDict()
+        self._cache_writes = 0
+        self._pruning = False
+        
+        self.prune_cache()
+        
+        logger.info(f"ArticleFetcher initialized (workers: {max_workers}, per host: {per_host_limit})")
+    
+    def fetch(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one page, using the disk cache when possible.
+        
+        Args:
+            url: Page URL
+        
+        Returns:
+            Dict with url, status, content (bytes), encoding and from_cache,
+            or None if the page could not be fetched
+        """
+        host = urlsplit(url).netloc.lower()
+        if not host:
+            return None
+        
+        cached = self._read_cache(url)
+        if cached and time.time() - cached['meta']['fetched_at'] < self.cache_ttl:
+            return self._result(url, cached['meta'], cached['content'], from_cache=True)
+        
+        headers = {'User-Agent': USER_AGENT}
+        if cached:
+            if cached['meta'].get('etag'):
+                headers['If-None-Match'] = cached['meta']['etag']
+            if cached['meta'].get('last_modified'):
+                headers['If-Modified-Since'] = cached['meta']['last_modified']
+        
+        try:
+            with self._host_slot(host) as state:
+                response = state.session.get(
+                    url, headers=headers, timeout=self.timeout, stream=True
+                )
+                try:
+                    if response.status_code == 304 and cached:
+                        cached['meta']['fetched_at'] = time.time()
+                        self._write_cache(url, cached['meta'], cached['content'])
+                        return self._result(url, cached['meta'], cached['content'], from_cache=True)
+                    
+                    response.raise_for_status()
+                    content = self._read_capped(response)
+                finally:
+                    response.close()
+        except Exception as e:
+            logger.warning(f"Could not fetch {url}: {e}")
+            return None
+        
+        meta = {
+            'url': url,
+            'status': response.status_code,
+            'encoding': response.encoding,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time()
+        }
+        self._write_cache(url, meta, content)
+        return self._result(url, meta, content, from_cache=False)
+    
+    def fetch_many(self, urls: List[str], timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several pages concurrently.
+        
+        Args:
+            urls: Page URLs
+            timeout: Overall deadline in seconds (pages not done by then are skipped)
+        
+        Returns:
+            Dict of url -> result for pages fetched successfully in time
+        """
+        futures = {self._executor.submit(self.fetch, url): url for url in dict.fromkeys(urls)}
+        done, not_done = wait(futures, timeout=timeout)
+        
+        if not_done:
+            logger.info(f"Fetch deadline reached, skipping {len(not_done)} of {len(futures)} pages")
+            for future in not_done:
+                future.cancel()
+        
+        results = {}
+        for future in done:
+            result = future.result()
+            if result is not None:
+                results[futures[future]] = result
+        return results
+    
+    def close(self):
+        """Close pooled sessions and stop worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            for state in self._hosts.values():
+                state.session.close()
+            self._hosts.clear()
+    
+    def _acquire_host(self, host: str) -> _HostState:
+        """Get a host's state for one fetch, evicting unused least recently used hosts."""
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.per_host_limit)
+            self._hosts.move_to_end(host)
+            state.users += 1
+            
+            if len(self._hosts) > self.max_hosts:
+                idle = [name for name, other in self._hosts.items() if other.users == 0]
+                for name in idle[:len(self._hosts) - self.max_hosts]:
+                    self._hosts.pop(name).session.close()
+            return state
+    
+    def _release_host(self, state: _HostState):
+        """End a fetch's use of a host's state."""
+        with self._lock:
+            state.users -= 1
+    
+    @contextmanager
+    def _host_slot(self, host: str):
+        """Hold one of the host's concurrency slots, spacing out request starts."""
+        state = self._acquire_host(host)
+        try:
+            with state.slot:
+                with state.lock:
+                    wait_for = state.last_request + self.min_host_interval - time.monotonic()
+                    if wait_for > 0:
+                        time.sleep(wait_for)
+                    state.last_request = time.monotonic()
+                yield state
+        finally:
+            self._release_host(state)
+    
+    def _read_capped(self, response: requests.Response) -> bytes:
+        """Stream a response body, stopping at ``max_bytes``."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=16384):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.max_bytes:
+                break
+        return b''.join(chunks)[:self.max_bytes]
+    
+    def _cache_paths(self, url: str):
+        """Metadata and body file paths for a URL."""
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+    
+    def _read_cache(self, url: str) -> Optional[Dict[str, Any]]:
+        """Load a cached response, if any."""
+        meta_path, body_path = self._cache_paths(url)
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            content = body_path.read_bytes()
+            # The metadata file's mtime marks the last use for pruning
+            os.utime(meta_path)
+            return {'meta': meta, 'content': content}
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cache(self, url: str, meta: Dict[str, Any], content: bytes):
+        """Store a response atomically (body first, then metadata)."""
+        meta_path, body_path = self._cache_paths(url)
+        try:
+            suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+            body_tmp = body_path.with_suffix(suffix)
+            body_tmp.write_bytes(content)
+            os.replace(body_tmp, body_path)
+            
+            meta_tmp = meta_path.with_suffix(suffix)
+            with open(meta_tmp, 'w') as f:
+                json.dump(meta, f)
+            os.replace(meta_tmp, meta_path)
+        except OSError as e:
+            logger.warning(f"Could not cache {url}: {e}")
+            return
+        
+        with self._lock:
+            self._cache_writes += 1
+            due = self._cache_writes % PRUNE_EVERY == 0 and not self._pruning
+        if due:
+            self.prune_cache()
+    
+    def prune_cache(self) -> int:
+        """
+        Delete cache entries unused for too long or beyond the size limit.
+        
+        Entries unused for ``cache_max_age`` seconds go first, then the least
+        recently used ones until the cache fits ``cache_max_bytes``.
+        
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock:
+            if self._pruning:
+                return 0
+            self._pruning = True
+        
+        try:
+            now = time.time()
+            entries = []
+            for meta_path in self.cache_dir.glob('*.json'):
+                body_path = meta_path.with_suffix('.body')
+                try:
+                    meta_stat = meta_path.stat()
+                    size = meta_stat.st_size + (body_path.stat().st_size if body_path.exists() else 0)
+                except OSError:
+                    continue
+                entries.append((meta_stat.st_mtime, size, meta_path, body_path))
+            
+            # Temporary files left by a crash between write and rename
+            for tmp_path in self.cache_dir.glob('*.tmp'):
+                try:
+                    if now - tmp_path.stat().st_mtime > 3600:
+                        tmp_path.unlink()
+                except OSError:
+                    pass
+            
+            entries.sort(key=lambda entry: entry[0])
+            total = sum(size for _, size, _, _ in entries)
+            deleted = 0
+            for used_at, size, meta_path, body_path in entries:
+                if now - used_at <= self.cache_max_age and total <= self.cache_max_bytes:
+                    break
+                # Metadata first, so a reader never sees metadata without a body
+                for path in (meta_path, body_path):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+                total -= size
+                deleted += 1
+            
+            if deleted:
+                logger.info(f"Pruned {deleted} cached pages ({total / 1e6:.1f} MB left)")
+            return deleted
+        finally:
+            with self._lock:
+                self._pruning = False
+    
+    def _result(self, url: str, meta: Dict[str, Any], content: bytes, from_cache: bool) -> Dict[str, Any]:
+        """Build a fetch result dict."""
+        return {
+            'url': url,
+            'status': meta.get('status'),
+            'content': content,
+            'encoding': meta.get('encoding'),
+            'from_cache': from_cache
+        }
@@ -3,57 +3,299 @@
 import json
 import logging
 import os
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Callable, Deque, List, Dict, Any, Optional
 from pathlib import Path
 
+from .retrieval import BM25Index
+
 logger = logging.getLogger(__name__)
 
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+_MARKUP_RE = re.compile(r'[#*_`>|]+')
+
+
+def topic_key(prompt: str) -> str:
+    """Namespace of a prompt's memory (case and spacing do not matter)."""
+    return ' '.join(prompt.lower().split())
+
+
+def condense_summary(summary: str, max_chars: int = 300) -> str:
+    """
+    Shorten a report summary to its leading sentences.
+    
+    Args:
+        summary: Full report summary (Markdown)
+        max_chars: Maximum characters returned
+    
+    Returns:
+        Plain-text leading sentences that fit ``max_chars``
+    """
+    text = ' '.join(_MARKUP_RE.sub(' ', summary).split())
+    if len(text) <= max_chars:
+        return text
+    
+    condensed = ''
+    for sentence in _SENTENCE_END_RE.split(text):
+        if len(condensed) + len(sentence) + 1 > max_chars:
+            break
+        condensed = f"{condensed} {sentence}" if condensed else sentence
+    return condensed or text[:max_chars - 3] + '...'
+
+
+@dataclass
+class _TopicMemory:
+    """Tiers of one topic's memory, newest entries first."""
+    recent: Deque[Dict[str, Any]] = field(default_factory=deque)
+    # Entries pushed out of recent; condensed by the next compaction
+    older: Deque[Dict[str, Any]] = field(default_factory=deque)
+    archive: Optional[Dict[str, Any]] = None
+    
+    def __len__(self) -> int:
+        return len(self.recent) + len(self.older) + (self.archive is not None)
+
 
 class NewsMemory:
     """
     Manages long-term memory for the news agent.
-    Persists report summaries to a JSON file to provide context for future runs.
+    Persists report summaries to an append-only JSON Lines file to provide
+    context for future runs.
+    
+    Memory is namespaced per topic (the normalized prompt) and tiered: the
+    newest ``recent_entries`` reports of a topic are kept in full, older ones
+    are condensed to their leading sentences, and condensed entries beyond
+    ``condensed_entries`` are merged into one archive digest per topic. A
+    busy topic never pushes out another topic's context, and each topic's
+    history stays bounded instead of being dropped.
+    
+    Each report is one appended, fsynced line, so adding a report costs the
+    same however long the log is and a crash can at most tear the last line
+    (skipped on load). Once the log holds well over the kept entries it is
+    compacted in the background: old entries are condensed and the kept
+    tiers are written to a temporary file that atomically replaces the log.
+    
+    Kept entries are indexed with BM25, so a prompt without history of its
+    own still gets context from past reports on related topics.
     """
     
-    def __init__(self, memory_file: str = "data/memory.json", max_entries: int = 10):
+    # Compact once the log holds this many times the kept entries
+    COMPACT_FACTOR = 5
+    
+    # Length of a topic's archive digest (its oldest part is cut first)
+    ARCHIVE_CHARS = 1500
+    
+    def __init__(
+        self,
+        memory_file: str = "data/memory.jsonl",
+        recent_entries: int = 5,
+        condensed_entries: int = 20,
+        context_chars: int = 3000,
+        condenser: Callable[[str], str] = condense_summary
+    ):
         """
         Initialize memory manager.
         
         Args:
-            memory_file: Path to the JSON memory file
-            max_entries: Maximum number of past reports to keep
+            memory_file: Path to the JSON Lines memory file (a legacy JSON
+                file next to it, e.g. data/memory.json, is migrated once)
+            recent_entries: Full report summaries kept per topic
+            condensed_entries: Condensed older summaries kept per topic before
+                they are merged into the topic's archive digest
+            context_chars: Default character budget of get_context
+            condenser: Shortens a summary for the condensed tier
         """
         self.memory_file = Path(memory_file)
-        self.max_entries = max_entries
-        self.memory_data = self._load_memory()
+        self.recent_entries = recent_entries
+        self.condensed_entries = condensed_entries
+        self.context_chars = context_chars
+        self.condenser = condenser
+        
+        # Shared by concurrent monitoring cycles
+        self._lock = threading.Lock()
+        self._compacting = False
         
         # Ensure directory exists
         self.memory_file.parent.mkdir(parents=True, exist_ok=True)
         
-    def _load_memory(self) -> List[Dict[str, Any]]:
-        """Load memory from file."""
+        self._migrate_legacy_file()
+        self.topics: Dict[str, _TopicMemory] = {}
+        # Entries in index order (document i of the index is _indexed[i])
+        self._indexed: List[Dict[str, Any]] = []
+        self._index = BM25Index()
+        self._log_lines = self._load_memory()
+    
+    def _migrate_legacy_file(self):
+        """Convert the old whole-file JSON memory (newest first) to the append-only log."""
+        legacy_file = self.memory_file.with_suffix('.json')
+        if legacy_file == self.memory_file or not legacy_file.exists() or self.memory_file.exists():
+            return
+        
+        try:
+            with open(legacy_file, 'r') as f:
+                entries = json.load(f)
+            self._write_atomically(list(reversed(entries)))
+            legacy_file.replace(legacy_file.with_suffix('.json.migrated'))
+            logger.info(f"Migrated {len(entries)} memory entries from {legacy_file} to {self.memory_file}")
+        except Exception as e:
+            logger.error(f"Failed to migrate legacy memory file: {e}")
+    
+    def _load_memory(self) -> int:
+        """
+        Replay the log into the topic tiers and the index.
+        
+        Returns:
+            Number of lines in the log
+        """
         if not self.memory_file.exists():
-            return []
-            
+            return 0
+        
+        lines = 0
+        torn = False
         try:
             with open(self.memory_file, 'r') as f:
-                return json.load(f)
+                for line in f:
+                    lines += 1
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn write from a crash
+                        logger.warning(f"Skipping unreadable line {lines} of {self.memory_file}")
+                        torn = True
+                        continue
+                    self._restore(entry)
         except Exception as e:
             logger.error(f"Failed to load memory: {e}")
-            return []
-            
+        
+        # Rewrite so the next append does not continue the torn line
+        if torn:
+            entries = self._kept_entries()
+            self._write_atomically(entries)
+            return len(entries)
+        return lines
+    
+    def _restore(self, entry: Dict[str, Any]):
+        """Put a logged entry back into its topic tier (lines without a tier are reports)."""
+        entry.setdefault('topic', topic_key(entry['prompt']))
+        tier = entry.get('tier', 'recent')
+        topic = self.topics.setdefault(entry['topic'], _TopicMemory())
+        
+        if tier == 'archive':
+            topic.archive = entry
+        elif tier == 'condensed':
+            # Logged oldest first
+            topic.older.appendleft(entry)
+        else:
+            self._add_recent(topic, entry)
+            return
+        self._index_entry(entry)
+    
+    def _add_recent(self, topic: _TopicMemory, entry: Dict[str, Any]):
+        """Add a report to a topic, pushing its oldest recent report to the older tier."""
+        topic.recent.appendleft(entry)
+        if len(topic.recent) > self.recent_entries:
+            topic.older.appendleft(topic.recent.pop())
+        self._index_entry(entry)
+    
+    def _index_entry(self, entry: Dict[str, Any]):
+        """Make an entry retrievable by search."""
+        self._indexed.append(entry)
+        self._index.add(f"{entry['prompt']}\n{entry['summary']}")
+    
+    def _kept_entries(self) -> List[Dict[str, Any]]:
+        """All kept entries, oldest first within each topic."""
+        entries = []
+        for topic in self.topics.values():
+            if topic.archive is not None:
+                entries.append(topic.archive)
+            entries.extend(reversed(topic.older))
+            entries.extend(reversed(topic.recent))
+        return entries
+    
+    def _condense_topic(self, topic: _TopicMemory):
+        """Condense a topic's older reports and merge the overflow into its archive."""
+        condensed = deque(
+            entry if entry.get('tier') == 'condensed'
+            else dict(entry, tier='condensed', summary=self.condenser(entry['summary']))
+            for entry in topic.older
+        )
+        
+        # Oldest first, so the archive reads as one chronological digest
+        overflow = []
+        while len(condensed) > self.condensed_entries:
+            overflow.append(condensed.pop())
+        topic.older = condensed
+        if not overflow:
+            return
+        
+        previous = topic.archive
+        digest = ' '.join(
+            ([previous['summary']] if previous else []) +
+            [f"{entry['timestamp'][:10]}: {entry['summary']}" for entry in overflow]
+        )
+        if len(digest) > self.ARCHIVE_CHARS:
+            digest = digest[-self.ARCHIVE_CHARS:].split(' ', 1)[-1]
+        
+        topic.archive = {
+            'timestamp': overflow[-1]['timestamp'],
+            'since': previous['since'] if previous else overflow[0]['timestamp'],
+            'prompt': overflow[-1]['prompt'],
+            'topic': overflow[-1]['topic'],
+            'tier': 'archive',
+            'summary': digest
+        }
+    
+    def _write_atomically(self, entries: List[Dict[str, Any]]):
+        """Replace the log with the given entries (oldest first) via a temporary file."""
+        tmp_file = self.memory_file.with_name(f"{self.memory_file.name}.tmp")
+        with open(tmp_file, 'w') as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.memory_file)
+    
     def save_memory(self):
-        """Save memory to file."""
-        try:
-            with open(self.memory_file, 'w') as f:
-                json.dump(self.memory_data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save memory: {e}")
-            
+        """Condense old entries of every topic and compact the log to the kept tiers (atomic rewrite)."""
+        with self._lock:
+            for topic in self.topics.values():
+                self._condense_topic(topic)
+            entries = self._kept_entries()
+            try:
+                self._write_atomically(entries)
+                self._log_lines = len(entries)
+            except Exception as e:
+                logger.error(f"Failed to save memory: {e}")
+            indexed_before = len(self._indexed)
+        
+        # Re-index off the lock, then catch up with reports added meanwhile
+        index = BM25Index()
+        for entry in entries:
+            index.add(f"{entry['prompt']}\n{entry['summary']}")
+        with self._lock:
+            added = self._indexed[indexed_before:]
+            self._index, self._indexed = index, entries
+            for entry in added:
+                self._index_entry(entry)
+    
+    def _compact_in_background(self):
+        """Run save_memory on a background thread unless one is already running."""
+        def compact():
+            try:
+                self.save_memory()
+                logger.debug(f"Compacted memory log to {self._log_lines} entries")
+            finally:
+                self._compacting = False
+        
+        self._compacting = True
+        threading.Thread(target=compact, name="memory-compaction", daemon=True).start()
+    
     def add_report(self, prompt: str, summary: str, timestamp: Optional[str] = None):
         """
-        Add a new report summary to memory.
+        Add a new report summary to its topic's memory.
         
         Args:
             prompt: The search prompt used
@@ -62,46 +304,108 @@ class NewsMemory:
         """
         if timestamp is None:
             timestamp = datetime.now().isoformat()
-            
+        
         entry = {
             "timestamp": timestamp,
             "prompt": prompt,
+            "topic": topic_key(prompt),
             "summary": summary
         }
+        line = json.dumps(entry) + '\n'
         
-        # Add to beginning of list
-        self.memory_data.insert(0, entry)
-        
-        # Trim to max entries
-        if len(self.memory_data) > self.max_entries:
-            self.memory_data = self.memory_data[:self.max_entries]
+        with self._lock:
+            self._add_recent(self.topics.setdefault(entry['topic'], _TopicMemory()), entry)
             
-        self.save_memory()
+            try:
+                with open(self.memory_file, 'a') as f:
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._log_lines += 1
+            except Exception as e:
+                logger.error(f"Failed to save memory: {e}")
+            
+            # What compaction keeps per topic: older grows until it is condensed
+            topic_limit = self.recent_entries + self.condensed_entries + 1
+            kept = sum(min(len(topic), topic_limit) for topic in self.topics.values())
+            if self._log_lines > self.COMPACT_FACTOR * max(kept, 10) and not self._compacting:
+                self._compact_in_background()
+    
+    def search(self, prompt: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Find the kept entries most relevant to a prompt across all topics.
+        
+        Args:
+            prompt: Search prompt
+            limit: Max number of entries returned
         
-    def get_context(self, prompt: str, limit: int = 3) -> str:
+        Returns:
+            Entries by descending BM25 relevance
+        """
+        with self._lock:
+            live = len(self._indexed)
+            return [self._indexed[live - 1 - age] for age, _ in self._index.search(prompt, limit)]
+    
+    def get_context(self, prompt: str, limit: int = 3, max_chars: Optional[int] = None) -> str:
         """
         Get relevant context from past reports.
         
+        The prompt's own topic gives its newest full reports followed by its
+        condensed history; a prompt without history of its own gets the most
+        relevant reports of other topics instead.
+        
         Args:
-            prompt: Current search prompt (to filter relevant memory)
-            limit: Max number of past entries to return
-            
+            prompt: Current search prompt
+            limit: Max number of full past reports to return
+            max_chars: Character budget for the returned context (defaults to context_chars)
+        
         Returns:
             String containing context from previous runs
         """
-        # Simple filtering: if the prompt is similar or if we just want recent context
-        # For now, we'll return the most recent entries regardless of prompt
-        # to establish a timeline of what the user has seen.
+        with self._lock:
+            topic = self.topics.get(topic_key(prompt))
+            if topic is not None:
+                recent = list(topic.recent)
+                full, older, archive = recent[:limit], recent[limit:] + list(topic.older), topic.archive
+        
+        if topic is None:
+            full, older, archive = self.search(prompt, limit), [], None
         
-        if not self.memory_data:
+        if not full:
             return "No previous reports found."
-            
+        
+        # Full reports first, each cut to what is left of the budget
         context_parts = []
-        for i, entry in enumerate(self.memory_data[:limit]):
-            context_parts.append(
+        remaining = max_chars or self.context_chars
+        for entry in full:
+            header = (
                 f"--- Report from {entry['timestamp']} ---\n"
                 f"Topic: {entry['prompt']}\n"
-                f"Summary: {entry['summary'][:500]}..." # Truncate for context window
+                f"Summary: "
             )
-            
+            room = min(500, remaining - len(header) - 3)
+            if room <= 0:
+                break
+            summary = entry['summary']
+            if len(summary) > room:
+                summary = summary[:room] + "..."
+            context_parts.append(header + summary)
+            remaining -= len(context_parts[-1]) + 2
+        
+        # Then the topic's condensed history, newest first, while the budget lasts
+        history = [f"- {entry['timestamp'][:10]}: {self.condenser(entry['summary'])}" for entry in older]
+        if archive is not None:
+            history.append(f"- {archive['since'][:10]} to {archive['timestamp'][:10]}: {archive['summary']}")
+        
+        heading = "--- Earlier reports on this topic ---"
+        remaining -= len(heading) + 3
+        lines = []
+        for line in history:
+            if len(line) > remaining:
+                break
+            lines.append(line)
+            remaining -= len(line) + 1
+        if lines:
+            context_parts.append("\n".join([heading] + lines))
+        
         return "\n\n".join(context_parts)
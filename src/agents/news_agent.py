@@ -1,12 +1,22 @@
 """News aggregation agent using LangChain and DeepSeek."""
 
+import asyncio
 import logging
-from typing import List, Dict, Any
+import re
+from dataclasses import replace
+from typing import List, Optional, Tuple
+import httpx
 from langchain_openai import ChatOpenAI
 
-from .tools import create_search_tool, create_content_extractor_tool
+from .tools import create_search_tool, create_content_extractor_tool, extract_articles_content
 from .memory import NewsMemory
 from .chains import ResearchChain
+from .fetcher import ArticleFetcher
+from .dedup import NearDuplicateFilter, SeenUrlFilter
+from .event_loop import run_sync
+from ..models.article import Article
+from ..api.llm_cache import LLMCache
+from ..api.tokens import TokenUsage
 
 logger = logging.getLogger(__name__)
 
@@ -22,161 +32,290 @@ class NewsAgent:
         temperature: float = 0.7,
         search_tool: str = "duckduckgo",
         max_results: int = 10,
-        max_iterations: int = 3
+        max_iterations: int = 3,
+        http_client: Optional[httpx.Client] = None,
+        memory: Optional[NewsMemory] = None,
+        http_async_client: Optional[httpx.AsyncClient] = None,
+        num_queries: int = 3,
+        max_concurrency: int = 3,
+        cache: Optional[LLMCache] = None,
+        token_budget: int = 12000,
+        usage: Optional[TokenUsage] = None,
+        fetcher: Optional[ArticleFetcher] = None,
+        enrich_top_k: int = 0,
+        enrich_deadline: float = 8.0,
+        enrich_max_chars: int = 15000,
+        search_source: str = "news",
+        dedup: Optional[NearDuplicateFilter] = None,
+        seen_urls: Optional[SeenUrlFilter] = None
     ):
         """
         Initialize the news agent.
+        
+        Args:
+            http_client: Shared pooled HTTP client for LLM calls (optional)
+            memory: Shared memory instance (optional, loaded from disk otherwise)
+            http_async_client: Shared pooled async HTTP client for LLM calls (optional)
+            num_queries: Number of complementary queries searched per cycle
+            max_concurrency: Max searches of one cycle running at once
+            cache: Response cache for repeated prompts (optional)
+            token_budget: Max prompt tokens for the analysis call
+            usage: Shared token usage record (optional)
+            fetcher: Shared article fetcher (optional)
+            enrich_top_k: Articles whose full text is fetched before analysis (0 disables)
+            enrich_deadline: Seconds the full-text fetch may take before falling back to snippets
+            enrich_max_chars: Total characters of full text passed to analysis
+            search_source: Search endpoint ("news" or "text")
+            dedup: Per-session near-duplicate filter (optional)
+            seen_urls: Per-session filter of already analyzed URLs (optional)
         """
         # Initialize LLM with DeepSeek
         self.llm = ChatOpenAI(
             api_key=api_key,
             base_url=base_url,
             model=model,
-            temperature=temperature
+            temperature=temperature,
+            http_client=http_client,
+            http_async_client=http_async_client
         )
         
         # Initialize components
-        self.search_tool = create_search_tool(search_tool, max_results)
-        self.content_tool = create_content_extractor_tool()
-        self.memory = NewsMemory()
-        self.chain = ResearchChain(self.llm)
+        self.search_tool = create_search_tool(search_tool, max_results, search_source)
+        self.content_tool = create_content_extractor_tool(fetcher)
+        self.fetcher = fetcher
+        self.dedup = dedup
+        self.seen_urls = seen_urls
+        self.memory = memory or NewsMemory()
+        self.chain = ResearchChain(
+            self.llm,
+            cache=cache,
+            token_budget=token_budget,
+            usage=usage
+        )
         
         self.max_iterations = max_iterations
+        self.num_queries = max(1, num_queries)
+        self.max_concurrency = max(1, max_concurrency)
+        self.enrich_top_k = enrich_top_k
+        self.enrich_deadline = enrich_deadline
+        self.enrich_max_chars = enrich_max_chars
         
         logger.info(f"NewsAgent initialized with {search_tool} search tool")
     
-    def search_news(self, prompt: str) -> List[Dict[str, Any]]:
+    def search_news(self, prompt: str, session_id: Optional[int] = None) -> List[Article]:
         """
         Search for news based on the given prompt, using context from memory.
         """
+        return run_sync(self.asearch_news(prompt, session_id))
+    
+    async def asearch_news(self, prompt: str, session_id: Optional[int] = None) -> List[Article]:
+        """
+        Search for news based on the given prompt, using context from memory (async).
+        
+        With a session ID, URLs and stories already analyzed in that session
+        and near-duplicate copies of the same story are dropped; if nothing
+        new is left the result is empty, so the cycle can be skipped.
+        """
         logger.info(f"Searching for news: {prompt}")
         
         try:
             # 1. Get context from memory
             context = self.memory.get_context(prompt)
             
-            # 2. Generate refined search query
-            search_query = self.chain.generate_search_query(prompt, context)
+            # 2. Generate complementary search queries
+            search_queries = await self.chain.agenerate_search_queries(
+                prompt, context, self.num_queries
+            )
+            
+            # 3. Execute searches concurrently
+            semaphore = asyncio.Semaphore(self.max_concurrency)
             
-            # 3. Execute search
-            search_results = self.search_tool.func(search_query)
+            async def run_query(query: str) -> List[Article]:
+                async with semaphore:
+                    return await self.search_tool.arun(query)
             
-            # 4. Parse results
-            articles = self._parse_search_results(search_results, prompt)
+            results = await asyncio.gather(
+                *(run_query(query) for query in search_queries),
+                return_exceptions=True
+            )
             
-            logger.info(f"Found {len(articles)} articles using query: {search_query}")
+            result_lists = []
+            for query, result in zip(search_queries, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Search failed for query '{query}': {result}")
+                else:
+                    result_lists.append(result)
+            
+            if not result_lists:
+                raise results[0]
+            
+            # 4. Merge and deduplicate
+            articles = self._merge_results(result_lists)
+            
+            # 5. Drop repeated stories before they reach the LLM (seen URLs first, it is cheaper)
+            if session_id is not None and articles:
+                for repeat_filter in (self.seen_urls, self.dedup):
+                    if repeat_filter is not None and articles:
+                        articles = await asyncio.to_thread(repeat_filter.filter, session_id, articles)
+                if not articles:
+                    logger.info(f"All news found for session {session_id} was already reported")
+                    return []
+            
+            if not articles:
+                articles = [Article(
+                    title='No Results',
+                    snippet=f'No news found for: {prompt}',
+                    source='Search'
+                )]
+            
+            logger.info(f"Found {len(articles)} articles using queries: {search_queries}")
             return articles
             
         except Exception as e:
             logger.error(f"Error in news search: {e}")
-            return [{
-                'title': 'Error in Search',
-                'snippet': f'Unable to retrieve news: {str(e)}',
-                'url': 'N/A',
-                'source': 'Error'
-            }]
+            return [Article(
+                title='Error in Search',
+                snippet=f'Unable to retrieve news: {str(e)}',
+                source='Error'
+            )]
             
-    def analyze_results(self, prompt: str, articles: List[Dict[str, Any]]) -> str:
+    def analyze_results(self, prompt: str, articles: List[Article]) -> str:
         """
         Analyze results using the research chain and save to memory.
         """
+        return run_sync(self.aanalyze_results(prompt, articles))
+    
+    async def aanalyze_results(self, prompt: str, articles: List[Article]) -> str:
+        """
+        Analyze results using the research chain and save to memory (async).
+        """
+        analysis, _ = await self.aanalyze_articles(prompt, articles)
+        return analysis
+    
+    def analyze_articles(self, prompt: str, articles: List[Article]) -> Tuple[str, List[Article]]:
+        """
+        Analyze results, save to memory and tell which articles the report covers.
+        """
+        return run_sync(self.aanalyze_articles(prompt, articles))
+    
+    async def aanalyze_articles(self, prompt: str, articles: List[Article]) -> Tuple[str, List[Article]]:
+        """
+        Analyze results, save to memory and tell which articles the report covers (async).
+        
+        Args:
+            prompt: Search prompt
+            articles: Articles from search
+        
+        Returns:
+            Tuple of (analysis, articles that made it into the analysis prompt);
+            no articles if the analysis failed, which is then not saved to memory
+            (neither is an analysis served from the cache)
+        """
         # Get context again (or pass it through, but fetching is cheap)
         context = self.memory.get_context(prompt)
         
+        # Replace snippets with article bodies where possible
+        if self.enrich_top_k > 0:
+            articles = await self.aenrich_articles(prompt, articles)
+        
         # Analyze
-        analysis = self.chain.analyze_results(prompt, articles, context)
+        analysis, analyzed, cached = await self.chain.aanalyze_packed(prompt, articles, context)
         
-        # Save to memory
-        self.memory.add_report(prompt, analysis)
+        # Save to memory (file write stays off the event loop); a cached
+        # analysis of the same articles is already there
+        if analyzed and not cached:
+            await asyncio.to_thread(self.memory.add_report, prompt, analysis)
         
-        return analysis
+        return analysis, analyzed
     
-    def _parse_search_results(self, results: str, prompt: str) -> List[Dict[str, Any]]:
+    def remember_articles(self, session_id: int, articles: List[Article]):
         """
-        Parse search results into structured article format.
+        Record the analyzed articles of a stored cycle so later cycles of the session skip them.
+        
+        Call this only once the cycle is stored, with the articles the
+        analysis covered, so a failed cycle does not hide its stories.
         
         Args:
-            results: Raw search results string
-            prompt: Original search prompt
-            
+            session_id: Monitoring session ID
+            articles: Articles returned by analyze_articles
+        """
+        for repeat_filter in (self.seen_urls, self.dedup):
+            if repeat_filter is not None and articles:
+                repeat_filter.remember(session_id, articles)
+    
+    async def aenrich_articles(self, prompt: str, articles: List[Article]) -> List[Article]:
+        """
+        Fetch the full text of the most relevant articles within the deadline.
+        
+        The top ``enrich_top_k`` articles by overlap with the prompt are fetched
+        in parallel. Pages not fetched before ``enrich_deadline`` keep their
+        snippet, so a slow site never stalls the cycle.
+        
+        Args:
+            prompt: Search prompt
+            articles: Articles from search
+        
         Returns:
-            List of article dictionaries
-        """
-        articles = []
-        
-        # DuckDuckGo returns results in a specific format
-        # Split by common delimiters and try to extract articles
-        if not results or len(results.strip()) == 0:
-            return [{
-                'title': 'No Results',
-                'snippet': f'No news found for: {prompt}',
-                'url': 'N/A',
-                'source': 'Search'
-            }]
-        
-        # Simple parsing - try to extract multiple results
-        # Results are typically separated by newlines or specific markers
-        lines = results.split('\n')
-        current_article = {}
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                if current_article and 'title' in current_article:
-                    articles.append(current_article)
-                    current_article = {}
-                continue
-            
-            # Check if line contains URL
-            if 'http' in line.lower():
-                # Extract URL
-                url_start = line.find('http')
-                url_end = line.find(' ', url_start)
-                if url_end == -1:
-                    url_end = len(line)
-                url = line[url_start:url_end].strip()
-                
-                if current_article and 'title' in current_article:
-                    articles.append(current_article)
-                
-                current_article = {
-                    'url': url,
-                    'source': 'Web',
-                    'title': line[:url_start].strip() if url_start > 0 else 'News Article',
-                }
-            elif 'title' not in current_article:
-                # First non-URL line is likely title
-                current_article['title'] = line
-            else:
-                # Subsequent lines are snippet
-                if 'snippet' not in current_article:
-                    current_article['snippet'] = line
-                else:
-                    current_article['snippet'] += ' ' + line
+            Copies of the articles, with ``content`` set on enriched ones
+        """
+        candidates = [a for a in articles if a.has_link]
+        if not candidates:
+            return articles
+        
+        terms = set(re.findall(r'\w+', prompt.lower()))
+        
+        def relevance(article: Article) -> int:
+            text = f"{article.title} {article.snippet}".lower()
+            return len(terms & set(re.findall(r'\w+', text)))
         
-        # Add last article if any
-        if current_article and 'title' in current_article:
-            articles.append(current_article)
+        # Stable sort keeps search rank among equally relevant articles
+        selected = sorted(candidates, key=relevance, reverse=True)[:self.enrich_top_k]
+        urls = [a.url for a in selected]
+        per_article_chars = self.enrich_max_chars // len(urls)
         
-        # Ensure all articles have required fields
+        try:
+            contents = await asyncio.wait_for(
+                asyncio.to_thread(
+                    extract_articles_content, urls, self.fetcher, self.enrich_deadline
+                ),
+                timeout=self.enrich_deadline + 1
+            )
+        except Exception as e:
+            logger.warning(f"Full-text enrichment failed, using snippets: {e}")
+            return articles
+        
+        enriched = []
         for article in articles:
-            if 'url' not in article:
-                article['url'] = 'N/A'
-            if 'source' not in article:
-                article['source'] = 'Web'
-            if 'snippet' not in article:
-                article['snippet'] = article.get('title', '')[:200]
-            if 'title' not in article:
-                article['title'] = 'Untitled Article'
-        
-        # If no articles were parsed, create one from the raw results
-        if not articles:
-            articles = [{
-                'title': f'News about: {prompt}',
-                'snippet': results[:500] if len(results) > 500 else results,
-                'url': 'N/A',
-                'source': 'Search Results'
-            }]
-        
-        return articles[:10]  # Limit to 10 articles
-
+            content = contents.get(article.url)
+            if content:
+                article = replace(article, content=content[:per_article_chars])
+            enriched.append(article)
+        
+        logger.info(f"Enriched {sum(1 for c in contents.values() if c)} of {len(urls)} selected articles")
+        return enriched
+    
+    def _merge_results(self, result_lists: List[List[Article]]) -> List[Article]:
+        """
+        Interleave per-query results and drop duplicates by canonical URL.
+        
+        Args:
+            result_lists: Parsed articles for each query, in query order
+        
+        Returns:
+            Merged list with each query's top results first
+        """
+        merged = []
+        seen = set()
+        
+        for rank in range(max(len(results) for results in result_lists)):
+            for results in result_lists:
+                if rank >= len(results):
+                    continue
+                article = results[rank]
+                # Canonical URL, or the title for articles without a link
+                key = article.dedup_key
+                if key not in seen:
+                    seen.add(key)
+                    merged.append(article)
+        
+        return merged
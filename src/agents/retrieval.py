@@ -0,0 +1,117 @@
+"""Local lexical retrieval (BM25) over memory entries."""
+
+import math
+import re
+from array import array
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# Words too common in prompts and reports to say anything about the topic
+STOPWORDS = frozenset((
+    'a', 'about', 'after', 'all', 'also', 'an', 'and', 'any', 'are', 'as', 'at', 'be',
+    'been', 'but', 'by', 'can', 'for', 'from', 'has', 'have', 'in', 'into', 'is', 'it',
+    'its', 'latest', 'more', 'new', 'news', 'no', 'not', 'of', 'on', 'or', 'over', 'said',
+    'than', 'that', 'the', 'their', 'there', 'this', 'to', 'today', 'was', 'were', 'what',
+    'when', 'which', 'will', 'with'
+))
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of a text without stopwords and single characters."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Incrementally updated BM25 index.
+    
+    Documents get consecutive ids in the order they are added; NewsMemory
+    rebuilds the index when it compacts its log. Each term's postings are two
+    growable arrays (doc ids in ascending order and term frequencies) that are
+    scored as NumPy views, so a query costs one vectorized pass per query term
+    instead of a loop over documents.
+    """
+    
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize an empty index.
+        
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization (0 = none, 1 = full)
+        """
+        self.k1 = k1
+        self.b = b
+        self._vocab: Dict[str, int] = {}
+        self._doc_ids: List[array] = []
+        self._term_freqs: List[array] = []
+        self._doc_lengths = array('f')
+        self._total_length = 0.0
+    
+    def __len__(self) -> int:
+        """Number of documents."""
+        return len(self._doc_lengths)
+    
+    def add(self, text: str):
+        """
+        Index a document as the newest one.
+        
+        Args:
+            text: Document text
+        """
+        doc_id = len(self._doc_lengths)
+        tokens = tokenize(text)
+        for term, freq in Counter(tokens).items():
+            term_id = self._vocab.get(term)
+            if term_id is None:
+                term_id = self._vocab[term] = len(self._doc_ids)
+                self._doc_ids.append(array('i'))
+                self._term_freqs.append(array('f'))
+            self._doc_ids[term_id].append(doc_id)
+            self._term_freqs[term_id].append(freq)
+        self._doc_lengths.append(len(tokens))
+        self._total_length += len(tokens)
+    
+    def search(self, query: str, k: int) -> List[Tuple[int, float]]:
+        """
+        Find the documents that best match a query.
+        
+        Args:
+            query: Query text
+            k: Max number of documents returned
+        
+        Returns:
+            (age, score) pairs by descending score, where age 0 is the newest
+            document; documents sharing no term with the query are left out
+        """
+        count = len(self)
+        if count == 0 or k <= 0:
+            return []
+        
+        lengths = np.frombuffer(self._doc_lengths, dtype=np.float32)
+        avg_length = max(self._total_length / count, 1.0)
+        # Per-document length normalization, shared by every query term
+        norms = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+        scores = np.zeros(count, dtype=np.float32)
+        
+        for term in set(tokenize(query)):
+            term_id = self._vocab.get(term)
+            if term_id is None:
+                continue
+            ids = np.frombuffer(self._doc_ids[term_id], dtype=np.int32)
+            freqs = np.frombuffer(self._term_freqs[term_id], dtype=np.float32)
+            doc_freq = len(ids)
+            idf = math.log(1 + (count - doc_freq + 0.5) / (doc_freq + 0.5))
+            # Ids are unique per term, so fancy-indexed += adds every posting
+            scores[ids] += idf * freqs * (self.k1 + 1) / (freqs + norms[ids])
+        
+        matched = np.flatnonzero(scores)
+        if len(matched) > k:
+            matched = matched[np.argpartition(scores[matched], -k)[-k:]]
+        # Best score first, the newest document first among equal scores
+        ranked = matched[np.lexsort((-matched, -scores[matched]))]
+        return [(count - 1 - int(i), float(scores[i])) for i in ranked]
@@ -1,36 +1,130 @@
 """Custom tools for LangChain agents."""
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Awaitable
 from datetime import datetime, timedelta
+from urllib.parse import urlsplit
 from langchain_community.utilities import DuckDuckGoSearchAPIWrapper
-import requests
-from bs4 import BeautifulSoup
+
+from ..models.article import Article
+from .fetcher import ArticleFetcher
+from .extraction import extract_text
 
 logger = logging.getLogger(__name__)
 
 
 class SimpleTool:
     """Simple tool wrapper."""
-    def __init__(self, name: str, description: str, func: Callable):
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        func: Callable,
+        coroutine: Optional[Callable[..., Awaitable]] = None
+    ):
         self.name = name
         self.description = description
         self.func = func
+        self.coroutine = coroutine
+    
+    async def arun(self, *args, **kwargs):
+        """Run the tool without blocking the event loop."""
+        if self.coroutine is not None:
+            return await self.coroutine(*args, **kwargs)
+        # Blocking tools run in the loop's worker threads
+        return await asyncio.to_thread(self.func, *args, **kwargs)
+
+
+def normalize_search_result(raw: Dict[str, Any]) -> Optional[Article]:
+    """
+    Convert a provider result into an Article.
+    
+    Accepts the key variants used by the DuckDuckGo text and news endpoints
+    (link/url/href, snippet/body, date).
+    
+    Args:
+        raw: Result dict from the search provider
+    
+    Returns:
+        Normalized result, or None if it has neither a title nor a link
+    """
+    url = (raw.get('link') or raw.get('url') or raw.get('href') or '').strip()
+    title = ' '.join((raw.get('title') or '').split())
+    if not url and not title:
+        return None
+    
+    snippet = ' '.join((raw.get('snippet') or raw.get('body') or '').split())
+    source = (raw.get('source') or '').strip() or _source_from_url(url)
+    
+    return Article(
+        title=title or 'Untitled Article',
+        url=url or 'N/A',
+        source=source,
+        snippet=snippet or title[:200],
+        published=_normalize_date(raw.get('date') or raw.get('published'))
+    )
 
 
-def create_search_tool(tool_name: str = "duckduckgo", max_results: int = 10) -> SimpleTool:
+def _source_from_url(url: str) -> str:
+    """Use the site's domain as the source name when the provider gives none."""
+    try:
+        host = urlsplit(url).netloc.lower()
+    except ValueError:
+        # Malformed URL (e.g. an unclosed IPv6 bracket)
+        return 'Web'
+    if host.startswith('www.'):
+        host = host[4:]
+    return host or 'Web'
+
+
+def _normalize_date(value: Any) -> Optional[str]:
+    """Convert a provider date to an ISO 8601 string (None if missing or unparseable)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).strip()).isoformat()
+    except ValueError:
+        return None
+
+
+def create_search_tool(
+    tool_name: str = "duckduckgo",
+    max_results: int = 10,
+    source: str = "news"
+) -> SimpleTool:
     """
     Create a search tool based on the specified provider.
     
+    The tool returns a list of Article records taken from the provider's
+    structured results.
+    
     Args:
         tool_name: Name of the search tool (duckduckgo, google, tavily)
         max_results: Maximum number of results to return
+        source: DuckDuckGo endpoint, "news" (falls back to "text" when empty) or "text"
         
     Returns:
         SimpleTool instance
     """
     if tool_name.lower() == "duckduckgo":
         search = DuckDuckGoSearchAPIWrapper(max_results=max_results)
+        
+        def run(query: str) -> List[Article]:
+            raw_results = []
+            if source != "text":
+                try:
+                    raw_results = search.results(query, max_results, source=source)
+                except Exception as e:
+                    logger.debug(f"DuckDuckGo {source} search failed for '{query}': {e}")
+            if not raw_results:
+                raw_results = search.results(query, max_results, source="text")
+            
+            results = [normalize_search_result(raw) for raw in raw_results]
+            return [result for result in results if result is not None]
+        
         return SimpleTool(
             name="web_search",
             description=(
@@ -38,55 +132,68 @@ def create_search_tool(tool_name: str = "duckduckgo", max_results: int = 10) ->
                 "Use this to find recent news articles, updates, and developments. "
                 "Input should be a search query string."
             ),
-            func=search.run
+            func=run
         )
     else:
         # Placeholder for other search tools
         raise NotImplementedError(f"Search tool '{tool_name}' not yet implemented")
 
 
-def extract_article_content(url: str) -> str:
+_default_fetcher: Optional[ArticleFetcher] = None
+
+
+def get_default_fetcher() -> ArticleFetcher:
+    """Get the process-wide article fetcher, creating it on first use."""
+    global _default_fetcher
+    if _default_fetcher is None:
+        _default_fetcher = ArticleFetcher()
+    return _default_fetcher
+
+
+def extract_article_content(url: str, fetcher: Optional[ArticleFetcher] = None) -> str:
     """
     Extract text content from a news article URL.
     
     Args:
         url: URL of the article
+        fetcher: Fetcher to use (defaults to the shared one)
         
     Returns:
         Extracted text content
     """
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Get text
-        text = soup.get_text()
-        
-        # Clean up text
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        return text[:5000]  # Limit to first 5000 characters
-        
-    except Exception as e:
-        logger.warning(f"Could not extract content from {url}: {e}")
+    result = (fetcher or get_default_fetcher()).fetch(url)
+    if result is None:
         return ""
+    return extract_text(result['content'])
+
+
+def extract_articles_content(
+    urls: List[str],
+    fetcher: Optional[ArticleFetcher] = None,
+    timeout: Optional[float] = None
+) -> Dict[str, str]:
+    """
+    Extract text content from several article URLs concurrently.
+    
+    Args:
+        urls: Article URLs
+        fetcher: Fetcher to use (defaults to the shared one)
+        timeout: Overall deadline in seconds
+    
+    Returns:
+        Dict of url -> extracted text for pages fetched in time
+    """
+    results = (fetcher or get_default_fetcher()).fetch_many(urls, timeout=timeout)
+    return {url: extract_text(result['content']) for url, result in results.items()}
 
 
-def create_content_extractor_tool() -> SimpleTool:
+def create_content_extractor_tool(fetcher: Optional[ArticleFetcher] = None) -> SimpleTool:
     """
     Create a tool for extracting content from URLs.
     
+    Args:
+        fetcher: Fetcher to use (defaults to the shared one)
+    
     Returns:
         SimpleTool instance
     """
@@ -97,55 +204,16 @@ def create_content_extractor_tool() -> SimpleTool:
             "Use this when you need to read the full article content. "
             "Input should be a valid URL."
         ),
-        func=extract_article_content
+        func=lambda url: extract_article_content(url, fetcher)
     )
 
 
-def parse_search_results(search_output: str) -> List[Dict[str, str]]:
-    """
-    Parse search results from DuckDuckGo output into structured format.
-    
-    Args:
-        search_output: Raw search output string
-        
-    Returns:
-        List of article dictionaries
-    """
-    articles = []
-    
-    # DuckDuckGo returns results in a specific format
-    # This is a simplified parser - adjust based on actual output format
-    lines = search_output.split('\n')
-    current_article = {}
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            if current_article:
-                articles.append(current_article)
-                current_article = {}
-            continue
-        
-        # Try to parse title, snippet, and link
-        if line.startswith('http'):
-            current_article['url'] = line
-        elif 'title' not in current_article:
-            current_article['title'] = line
-        else:
-            current_article['snippet'] = current_article.get('snippet', '') + ' ' + line
-    
-    if current_article:
-        articles.append(current_article)
-    
-    return articles
-
-
-def format_news_results(articles: List[Dict[str, Any]]) -> str:
+def format_news_results(articles: List[Article]) -> str:
     """
     Format news articles into a readable string.
     
     Args:
-        articles: List of article dictionaries
+        articles: List of articles
         
     Returns:
         Formatted string
@@ -156,10 +224,10 @@ def format_news_results(articles: List[Dict[str, Any]]) -> str:
     formatted = []
     for i, article in enumerate(articles, 1):
         formatted.append(
-            f"{i}. {article.get('title', 'No title')}\n"
-            f"   Source: {article.get('source', 'Unknown')}\n"
-            f"   URL: {article.get('url', 'N/A')}\n"
-            f"   Summary: {article.get('snippet', 'N/A')[:200]}..."
+            f"{i}. {article.title}\n"
+            f"   Source: {article.source}\n"
+            f"   URL: {article.url}\n"
+            f"   Summary: {article.snippet[:200]}..."
         )
     
     return "\n\n".join(formatted)
@@ -0,0 +1,96 @@
+"""URL helpers for matching the same article across searches."""
+
+import hashlib
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Query parameters that track the click and never select content
+TRACKING_PARAMS = frozenset((
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    'ocid', 'cmpid', 'cmp', 'ncid', 'smid', 'smtyp', 'ito', 'sr_share', 'share',
+    'ref', 'ref_src', 'referrer', 'via', 'guccounter',
+    'amp', 'outputtype', '_ga', '_gl', 'icid', 'spm'
+))
+TRACKING_PREFIXES = ('utm_', 'pk_', 'mtm_', 'at_', 'hsa_')
+
+# AMP renderings of a page: /amp/..., .../amp, ....amp.html, ....amp
+_AMP_PATH_RE = re.compile(r'^/amp(?=/)|/amp/?$|\.amp(?=\.html?$)|\.amp$', re.IGNORECASE)
+_AMP_CACHE_SUFFIX = '.cdn.ampproject.org'
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so that trivially different links to one page compare equal.
+    
+    Treats http and https as one scheme, lowercases the host and drops a
+    leading ``www.``/``m.``/``amp.``, default ports, fragments, trailing
+    slashes and tracking parameters, unwraps AMP cache links and AMP page
+    variants, and sorts the remaining query parameters.
+    
+    Args:
+        url: URL as returned by the search provider
+    
+    Returns:
+        Canonical URL string (the input without surrounding whitespace if it
+        is not an http(s) URL or cannot be parsed)
+    """
+    url = url.strip() if url else url
+    if not url or not url.lower().startswith(('http://', 'https://')):
+        return url
+    
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        # Malformed port or IPv6 host; the raw URL still identifies the page
+        return url
+    
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    path = parts.path
+    
+    # https://example-com.cdn.ampproject.org/c/s/example.com/story -> example.com/story
+    if host.endswith(_AMP_CACHE_SUFFIX):
+        cached = re.match(r'^/[a-z](?:/s)?/([^/]+)(/.*)?$', path)
+        if cached:
+            host = cached.group(1).lower()
+            path = cached.group(2) or '/'
+    
+    for prefix in ('www.', 'm.', 'amp.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    
+    netloc = host
+    if port and port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{port}"
+    
+    path = _AMP_PATH_RE.sub('', path).rstrip('/') or '/'
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(key)
+    ))
+    
+    return urlunsplit(('https', netloc, path, query, ''))
+
+
+def url_hash(url: str) -> int:
+    """
+    Stable signed 64-bit hash of a URL's canonical form.
+    
+    Args:
+        url: Article URL
+    
+    Returns:
+        Hash that fits a SQLite INTEGER
+    """
+    digest = hashlib.blake2b(canonicalize_url(url).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little', signed=True)
+
+
+def _is_tracking_param(key: str) -> bool:
+    """Whether a query parameter only tracks the click."""
+    key = key.lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES)
@@ -1,9 +1,14 @@
 """DeepSeek API client implementation."""
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Optional
+import httpx
 from openai import OpenAI
 
+from .llm_cache import LLMCache
+from ..models.article import Article
+from .tokens import TokenUsage, fit_texts, messages_tokens, pack_articles
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,7 +21,11 @@ class DeepSeekClient:
         base_url: str = "https://api.deepseek.com/v1",
         model: str = "deepseek-chat",
         temperature: float = 0.7,
-        max_tokens: int = 4000
+        max_tokens: int = 4000,
+        http_client: Optional[httpx.Client] = None,
+        cache: Optional[LLMCache] = None,
+        token_budget: int = 48000,
+        usage: Optional[TokenUsage] = None
     ):
         """
         Initialize DeepSeek API client.
@@ -27,17 +36,25 @@ class DeepSeekClient:
             model: Model name to use
             temperature: Sampling temperature
             max_tokens: Maximum tokens in response
+            http_client: Shared pooled HTTP client (optional)
+            cache: Response cache for repeated prompts (optional)
+            token_budget: Max prompt tokens for analysis and aggregate calls
+            usage: Shared token usage record (optional)
         """
         self.api_key = api_key
         self.base_url = base_url
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache = cache
+        self.token_budget = token_budget
+        self.usage = usage or TokenUsage()
         
         # Initialize OpenAI client with DeepSeek endpoint
         self.client = OpenAI(
             api_key=api_key,
-            base_url=base_url
+            base_url=base_url,
+            http_client=http_client
         )
         
         logger.info(f"DeepSeek client initialized with model: {model}")
@@ -46,7 +63,8 @@ class DeepSeekClient:
         self,
         messages: List[Dict[str, str]],
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        stage: Optional[str] = None
     ) -> str:
         """
         Send a chat completion request to DeepSeek.
@@ -55,43 +73,66 @@ class DeepSeekClient:
             messages: List of message dicts with 'role' and 'content'
             temperature: Override default temperature
             max_tokens: Override default max tokens
+            stage: Pipeline stage; enables the response cache when set
             
         Returns:
             Response content as string
         """
+        temperature = temperature or self.temperature
+        max_tokens = max_tokens or self.max_tokens
+        
+        key = None
+        if self.cache is not None and stage:
+            key = LLMCache.make_key(self.model, temperature, messages, max_tokens=max_tokens)
+            cached = self.cache.get(stage, key)
+            if cached is not None:
+                self.usage.record(stage, 0, cached=True)
+                return cached
+        
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
-                temperature=temperature or self.temperature,
-                max_tokens=max_tokens or self.max_tokens
+                temperature=temperature,
+                max_tokens=max_tokens
             )
             
             content = response.choices[0].message.content
             logger.debug(f"Received response from DeepSeek: {content[:100]}...")
+            
+            usage = getattr(response, 'usage', None)
+            self.usage.record(
+                stage or 'chat',
+                getattr(usage, 'prompt_tokens', None) or messages_tokens(messages),
+                getattr(usage, 'completion_tokens', None) or 0
+            )
+            
+            if key is not None:
+                self.cache.set(stage, key, content)
             return content
             
         except Exception as e:
             logger.error(f"Error in DeepSeek API call: {e}")
             raise
     
-    def analyze_news(self, news_data: List[Dict[str, Any]]) -> str:
+    def analyze_news(self, news_data: List[Article]) -> str:
         """
         Analyze and summarize news articles using DeepSeek.
         
         Args:
-            news_data: List of news article dictionaries
+            news_data: List of news articles
             
         Returns:
             Analyzed and summarized news report
         """
-        # Format news data for analysis
+        # Format news data for analysis, leaving room for the instructions
+        packed = pack_articles(news_data, self.token_budget - 256)
         news_text = "\n\n".join([
-            f"Title: {article.get('title', 'N/A')}\n"
-            f"Source: {article.get('source', 'N/A')}\n"
-            f"URL: {article.get('url', 'N/A')}\n"
-            f"Snippet: {article.get('snippet', 'N/A')}"
-            for article in news_data
+            f"Title: {article.title}\n"
+            f"Source: {article.source}\n"
+            f"URL: {article.url}\n"
+            f"Snippet: {body or 'N/A'}"
+            for article, body in packed
         ])
         
         messages = [
@@ -118,7 +159,7 @@ class DeepSeekClient:
             }
         ]
         
-        return self.chat_completion(messages)
+        return self.chat_completion(messages, stage='analysis')
     
     def create_aggregate_summary(self, reports: List[str]) -> str:
         """
@@ -130,9 +171,15 @@ class DeepSeekClient:
         Returns:
             Aggregate summary
         """
+        # Newest reports have priority; the oldest are dropped first if over budget
+        fitted = fit_texts(reports[::-1], self.token_budget - 256, min_tokens=128)[::-1]
+        offset = len(reports) - len(fitted)
+        if offset:
+            logger.info(f"Token budget dropped the {offset} oldest of {len(reports)} reports")
+        
         combined_reports = "\n\n---\n\n".join([
-            f"Report {i+1}:\n{report}"
-            for i, report in enumerate(reports)
+            f"Report {offset + i + 1}:\n{report}"
+            for i, report in enumerate(fitted)
         ])
         
         messages = [
@@ -159,4 +206,4 @@ class DeepSeekClient:
             }
         ]
         
-        return self.chat_completion(messages)
+        return self.chat_completion(messages, stage='aggregate')
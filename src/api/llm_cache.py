@@ -0,0 +1,186 @@
+"""Persistent content-addressed cache for LLM responses."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """
+    SQLite-backed cache of LLM responses keyed on the exact request.
+    
+    Keys are a hash of model, temperature and messages, so identical prompts
+    return the stored response without an API call. Entries expire after a
+    per-stage TTL and the least recently used entries are evicted once the
+    cache grows past ``max_entries``. Hit/miss counters are kept per stage.
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = 5000,
+        ttls: Optional[Dict[str, int]] = None,
+        default_ttl: int = 3600
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: Path to the SQLite cache file
+            max_entries: Maximum number of cached responses
+            ttls: Time-to-live in seconds per stage (e.g. {"analysis": 1800})
+            default_ttl: TTL for stages not listed in ``ttls``
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # One connection shared by all threads, serialized by the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, stage TEXT NOT NULL, response TEXT NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_llm_cache_accessed_at ON llm_cache (accessed_at)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache_stats ("
+            "stage TEXT PRIMARY KEY, hits INTEGER NOT NULL DEFAULT 0, "
+            "misses INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.commit()
+        
+        logger.info(f"LLM cache initialized at {self.path} (max {max_entries} entries)")
+    
+    @staticmethod
+    def make_key(model: str, temperature: Optional[float], messages: List[Any], **params) -> str:
+        """
+        Build a cache key for a request.
+        
+        Args:
+            model: Model name
+            temperature: Sampling temperature
+            messages: LangChain messages or dicts with 'role' and 'content'
+            **params: Other request parameters that change the response (e.g. max_tokens)
+        
+        Returns:
+            Hex SHA-256 digest
+        """
+        normalized = [
+            [m['role'], m['content']] if isinstance(m, dict) else [m.type, m.content]
+            for m in messages
+        ]
+        payload = json.dumps(
+            {'model': model, 'temperature': temperature, 'messages': normalized, 'params': params},
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, stage: str, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            stage: Pipeline stage (selects the TTL and counters)
+            key: Key from make_key
+        
+        Returns:
+            Cached response, or None on a miss or expired entry
+        """
+        now = time.time()
+        ttl = self.ttls.get(stage, self.default_ttl)
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            
+            hit = row is not None and now - row[1] < ttl
+            if hit:
+                self._conn.execute(
+                    "UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+            elif row is not None:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            
+            column = 'hits' if hit else 'misses'
+            self._conn.execute(
+                f"INSERT INTO llm_cache_stats (stage, {column}) VALUES (?, 1) "
+                f"ON CONFLICT(stage) DO UPDATE SET {column} = {column} + 1",
+                (stage,)
+            )
+            self._conn.commit()
+        
+        if hit:
+            logger.debug(f"LLM cache hit for stage '{stage}'")
+            return row[0]
+        return None
+    
+    def set(self, stage: str, key: str, response: str):
+        """
+        Store a response, evicting least recently used entries if needed.
+        
+        Args:
+            stage: Pipeline stage
+            key: Key from make_key
+            response: Response content
+        """
+        now = time.time()
+        
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, stage, response, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, stage, response, now, now)
+            )
+            
+            count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            if count > self.max_entries:
+                # Evict down to 90% so eviction doesn't run on every insert
+                excess = count - int(self.max_entries * 0.9)
+                self._conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN "
+                    "(SELECT key FROM llm_cache ORDER BY accessed_at LIMIT ?)",
+                    (excess,)
+                )
+                logger.debug(f"Evicted {excess} LLM cache entries")
+            
+            self._conn.commit()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict with total entries and hit/miss counts per stage
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            rows = self._conn.execute(
+                "SELECT stage, hits, misses FROM llm_cache_stats ORDER BY stage"
+            ).fetchall()
+        
+        return {
+            'entries': entries,
+            'stages': {stage: {'hits': hits, 'misses': misses} for stage, hits, misses in rows}
+        }
+    
+    def close(self):
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
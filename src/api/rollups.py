@@ -0,0 +1,127 @@
+"""Incremental aggregate summaries built from persisted per-bucket rollups."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any
+
+from .summarizer import MapReduceSummarizer
+from ..scheduler.data_manager import DataManager
+
+logger = logging.getLogger(__name__)
+
+
+class RollupAggregator:
+    """
+    Builds aggregate summaries from per-session, per-time-bucket rollups.
+    
+    Each day (or week) of a session's reports is condensed once and stored in
+    the database. Later aggregate runs only re-summarize buckets that received
+    new reports and combine them with the stored rollups, so the cost of an
+    aggregate is proportional to new data rather than the whole history.
+    """
+    
+    def __init__(
+        self,
+        data_manager: DataManager,
+        summarizer: MapReduceSummarizer,
+        granularity: str = 'day'
+    ):
+        """
+        Initialize the aggregator.
+        
+        Args:
+            data_manager: Data manager holding reports and rollups
+            summarizer: Summarizer used to condense and combine buckets
+            granularity: Bucket size ('day' or 'week')
+        """
+        self.data_manager = data_manager
+        self.summarizer = summarizer
+        self.granularity = granularity
+    
+    def summarize_sessions(self, session_ids: List[int]) -> str:
+        """
+        Create an aggregate summary of the given sessions.
+        
+        Args:
+            session_ids: Monitoring session IDs
+        
+        Returns:
+            Aggregate summary
+        """
+        rollups = []
+        for session_id in session_ids:
+            rollups.extend(self.update_rollups(session_id))
+        
+        if not rollups:
+            return "No previous reports found."
+        
+        rollups.sort(key=lambda r: r['bucket_start'])
+        return self.summarizer.combine([
+            f"{r['bucket_start']:%Y-%m-%d} ({r['report_count']} reports):\n{r['summary']}"
+            for r in rollups
+        ])
+    
+    def update_rollups(self, session_id: int) -> List[Dict[str, Any]]:
+        """
+        Bring a session's rollups up to date, summarizing only changed buckets.
+        
+        Args:
+            session_id: Monitoring session ID
+        
+        Returns:
+            Chronological list of dicts with bucket_start, report_count and summary
+        """
+        buckets = self.data_manager.get_report_buckets(session_id, self.granularity)
+        stored = self.data_manager.get_rollups(session_id, self.granularity)
+        
+        stale = [
+            bucket for bucket in buckets
+            if not self._is_current(stored.get(bucket['bucket_start']), bucket)
+        ]
+        
+        if stale:
+            logger.info(
+                f"Session {session_id}: rebuilding {len(stale)} of {len(buckets)} "
+                f"{self.granularity} rollups"
+            )
+            # LLM calls of all buckets share the summarizer's max_workers limit
+            with ThreadPoolExecutor(max_workers=self.summarizer.max_workers) as executor:
+                summaries = list(executor.map(
+                    lambda bucket: self._summarize_bucket(session_id, bucket), stale
+                ))
+            for bucket, summary in zip(stale, summaries):
+                stored[bucket['bucket_start']] = {'summary': summary}
+        
+        return [
+            {
+                'bucket_start': bucket['bucket_start'],
+                'report_count': bucket['report_count'],
+                'summary': stored[bucket['bucket_start']]['summary']
+            }
+            for bucket in buckets
+        ]
+    
+    def _is_current(self, rollup: Dict[str, Any], bucket: Dict[str, Any]) -> bool:
+        """Check whether a stored rollup still covers exactly the bucket's reports."""
+        return (
+            rollup is not None
+            and rollup['report_count'] == bucket['report_count']
+            and rollup['last_report_id'] == bucket['last_report_id']
+        )
+    
+    def _summarize_bucket(self, session_id: int, bucket: Dict[str, Any]) -> str:
+        """Condense one bucket's reports and persist the rollup."""
+        reports = self.data_manager.get_session_reports(
+            session_id, since=bucket['bucket_start'], until=bucket['bucket_end']
+        )
+        summary = self.summarizer.condense(reports)
+        
+        self.data_manager.store_rollup(
+            session_id,
+            self.granularity,
+            bucket['bucket_start'],
+            bucket['report_count'],
+            bucket['last_report_id'],
+            summary
+        )
+        return summary
@@ -0,0 +1,182 @@
+"""Hierarchical map-reduce summarization of long report histories."""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from .api_client import DeepSeekClient
+from .tokens import count_tokens, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class MapReduceSummarizer:
+    """
+    Summarizes any number of reports with a bounded prompt size.
+    
+    ``condense`` splits reports into consecutive chunks that fit
+    ``chunk_tokens``, summarizes the chunks in parallel (map), then groups
+    the summaries and summarizes them again level by level (reduce) until one
+    is left. ``combine`` reduces partial summaries until they fit into a
+    single final aggregate call. Chunk boundaries only depend on earlier
+    reports, so when new reports are appended every older chunk produces the
+    exact same request and its summary is served from the LLM cache.
+    
+    At most ``max_workers`` map/reduce calls run at once per summarizer, also
+    when several callers (e.g. the rollup buckets) use it in parallel.
+    """
+    
+    def __init__(
+        self,
+        client: DeepSeekClient,
+        chunk_tokens: int = 12000,
+        summary_tokens: int = 1024,
+        max_workers: int = 4
+    ):
+        """
+        Initialize the summarizer.
+        
+        Args:
+            client: DeepSeek client (its cache stores intermediate summaries)
+            chunk_tokens: Max prompt tokens of reports per map/reduce call
+            summary_tokens: Max completion tokens per intermediate summary
+            max_workers: Max map/reduce calls running at once
+        """
+        self.client = client
+        self.chunk_tokens = chunk_tokens
+        self.summary_tokens = summary_tokens
+        self.max_workers = max_workers
+        # Shared by every thread, so nested parallelism cannot exceed max_workers calls
+        self._calls = threading.BoundedSemaphore(max_workers)
+    
+    def combine(self, summaries: List[str]) -> str:
+        """
+        Reduce chronological partial summaries into the final aggregate summary.
+        
+        Args:
+            summaries: Partial summaries in chronological order
+        
+        Returns:
+            Aggregate summary
+        """
+        if not summaries:
+            return "No previous reports found."
+        
+        level = 1
+        while (len(summaries) > 1 and
+               sum(count_tokens(summary) for summary in summaries) > self.client.token_budget):
+            groups = self._chunk(summaries, min_size=2)
+            summaries = self._map(groups, self._reduce_group)
+            logger.info(f"Reduce level {level}: {len(summaries)} summaries")
+            level += 1
+        
+        return self.client.create_aggregate_summary(summaries)
+    
+    def condense(self, reports: List[str]) -> str:
+        """
+        Condense reports into a single intermediate summary.
+        
+        Short inputs are returned as-is without an LLM call.
+        
+        Args:
+            reports: Report texts in chronological order
+        
+        Returns:
+            One summary covering all reports
+        """
+        if sum(count_tokens(report) for report in reports) <= self.summary_tokens:
+            return "\n\n---\n\n".join(reports)
+        
+        summaries = self._map(self._chunk(reports), self._summarize_chunk)
+        while len(summaries) > 1:
+            summaries = self._map(self._chunk(summaries, min_size=2), self._reduce_group)
+        return summaries[0]
+    
+    def _chunk(self, texts: List[str], min_size: int = 1) -> List[List[str]]:
+        """
+        Split texts into consecutive groups that fit ``chunk_tokens``.
+        
+        Args:
+            texts: Texts in chronological order
+            min_size: Minimum texts per group (so reduce levels always shrink)
+        
+        Returns:
+            List of groups
+        """
+        # Oversized single texts are cut so that one chunk always fits
+        limit = self.chunk_tokens // max(min_size, 1)
+        
+        chunks = []
+        current = []
+        current_tokens = 0
+        for text in texts:
+            tokens = count_tokens(text)
+            if tokens > limit:
+                text = truncate_to_tokens(text, limit)
+                tokens = limit
+            if current and len(current) >= min_size and current_tokens + tokens > self.chunk_tokens:
+                chunks.append(current)
+                current = []
+                current_tokens = 0
+            current.append(text)
+            current_tokens += tokens
+        
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    def _map(self, groups: List[List[str]], func) -> List[str]:
+        """Run ``func`` over groups in parallel, keeping their order."""
+        if len(groups) == 1:
+            return [func(groups[0])]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(func, groups))
+    
+    def _complete(self, messages: List[dict], stage: str) -> str:
+        """Run one map/reduce call within the summarizer's concurrency limit."""
+        with self._calls:
+            return self.client.chat_completion(messages, max_tokens=self.summary_tokens, stage=stage)
+    
+    def _summarize_chunk(self, reports: List[str]) -> str:
+        """Summarize one chunk of consecutive monitoring reports."""
+        combined = "\n\n---\n\n".join(reports)
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    "You are a professional news analyst condensing a sequence of monitoring "
+                    "reports. Keep the chronology, key developments, named actors, figures and "
+                    "emerging trends. Drop repetition between reports."
+                )
+            },
+            {
+                "role": "user",
+                "content": (
+                    f"Condense these {len(reports)} consecutive reports into one concise summary:\n\n"
+                    f"{combined}"
+                )
+            }
+        ]
+        return self._complete(messages, 'aggregate_map')
+    
+    def _reduce_group(self, summaries: List[str]) -> str:
+        """Merge consecutive period summaries into one."""
+        combined = "\n\n---\n\n".join(
+            f"Period {i + 1}:\n{summary}" for i, summary in enumerate(summaries)
+        )
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    "You are a professional news analyst merging summaries of consecutive "
+                    "monitoring periods. Preserve the chronology and the most significant "
+                    "developments and trends; remove repetition."
+                )
+            },
+            {
+                "role": "user",
+                "content": f"Merge these period summaries into one concise summary:\n\n{combined}"
+            }
+        ]
+        return self._complete(messages, 'aggregate_reduce')
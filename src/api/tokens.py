@@ -0,0 +1,246 @@
+"""Local token counting and token-budgeted prompt packing."""
+
+import logging
+import threading
+from functools import lru_cache
+from typing import List, Dict, Any, Sequence, Tuple
+
+from ..models.article import Article
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tiktoken encoding once, or None if it is unavailable offline."""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.debug(f"tiktoken unavailable, estimating tokens from length: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens in a text locally.
+    
+    Uses the cl100k tokenizer when available (close enough to DeepSeek's for
+    budgeting), otherwise estimates from the text length.
+    
+    Args:
+        text: Text to count
+    
+    Returns:
+        Number of tokens
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut a text down to at most ``max_tokens`` tokens.
+    
+    Args:
+        text: Text to truncate
+        max_tokens: Token limit
+    
+    Returns:
+        The text unchanged if it fits, otherwise a truncated copy ending in "..."
+    """
+    if max_tokens <= 0:
+        return ""
+    
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        # Leave room for the ellipsis so the result stays within the limit
+        return encoding.decode(tokens[:max_tokens - 1]).rstrip() + "..."
+    
+    if count_tokens(text) <= max_tokens:
+        return text
+    # count_tokens estimates len // CHARS_PER_TOKEN + 1, so this stays within the limit
+    return text[:max(max_tokens * CHARS_PER_TOKEN - 4, 0)].rstrip() + "..."
+
+
+def fit_texts(texts: Sequence[str], budget: int, min_tokens: int = 32) -> List[str]:
+    """
+    Fit texts into a token budget, trimming them proportionally.
+    
+    Texts are given in priority order. If they all fit they are returned
+    unchanged; otherwise every text is trimmed by the same ratio (but not below
+    ``min_tokens``) and the lowest-priority texts are dropped if even their
+    minimum share does not fit.
+    
+    Args:
+        texts: Texts in priority order (highest first)
+        budget: Total tokens available
+        min_tokens: Smallest useful share per text
+    
+    Returns:
+        Trimmed texts in the same order (possibly fewer)
+    """
+    counts = [count_tokens(text) for text in texts]
+    if sum(counts) <= budget:
+        return list(texts)
+    
+    # Keep as many high-priority texts as can get their minimum share
+    kept = 0
+    reserved = 0
+    for count in counts:
+        share = min(count, min_tokens)
+        if reserved + share > budget:
+            break
+        reserved += share
+        kept += 1
+    
+    counts = counts[:kept]
+    total = sum(counts)
+    if total <= budget:
+        return list(texts[:kept])
+    
+    # Scale every text by a common ratio, pinning those that would fall
+    # below their minimum share and re-spreading the rest of the budget
+    floors = [min(count, min_tokens) for count in counts]
+    pinned = [False] * kept
+    while True:
+        pinned_total = sum(floor for floor, pin in zip(floors, pinned) if pin)
+        free_total = sum(count for count, pin in zip(counts, pinned) if not pin)
+        ratio = (budget - pinned_total) / free_total if free_total else 0
+        below = [
+            i for i, count in enumerate(counts)
+            if not pinned[i] and count * ratio < floors[i]
+        ]
+        if not below:
+            break
+        for i in below:
+            pinned[i] = True
+    
+    return [
+        truncate_to_tokens(text, floor if pin else int(count * ratio))
+        for text, count, floor, pin in zip(texts[:kept], counts, floors, pinned)
+    ]
+
+
+def pack_articles(
+    articles: List[Article],
+    budget: int,
+    min_tokens: int = 32
+) -> List[Tuple[Article, str]]:
+    """
+    Fit articles into a token budget for an LLM prompt.
+    
+    Articles are taken in priority (search rank) order. Title, source and URL
+    are always kept; the body text (full content if fetched, otherwise the
+    snippet) is trimmed proportionally across articles and the lowest-ranked
+    articles are dropped when the budget runs out.
+    
+    Args:
+        articles: Articles in priority order
+        budget: Total tokens available for the articles
+        min_tokens: Smallest useful body share per article
+    
+    Returns:
+        (article, trimmed body text) pairs for the articles that fit
+    """
+    # Header lines (title/source/url/date) are not trimmed, so reserve them first
+    headers = [
+        count_tokens(f"{a.title} {a.source} {a.url} {a.published or ''}") + 10
+        for a in articles
+    ]
+    
+    # Every kept article also needs room for the smallest useful body
+    kept = 0
+    reserved = 0
+    for header in headers:
+        if reserved + header + min_tokens > budget:
+            break
+        reserved += header + min_tokens
+        kept += 1
+    
+    if kept < len(articles):
+        logger.info(f"Token budget dropped {len(articles) - kept} of {len(articles)} articles")
+    
+    bodies = fit_texts(
+        [a.text for a in articles[:kept]],
+        budget - sum(headers[:kept]),
+        min_tokens
+    )
+    return list(zip(articles, bodies))
+
+
+def messages_tokens(messages: List[Any]) -> int:
+    """
+    Count the tokens of a chat request.
+    
+    Args:
+        messages: LangChain messages or dicts with 'role' and 'content'
+    
+    Returns:
+        Approximate prompt tokens, including per-message overhead
+    """
+    total = 0
+    for message in messages:
+        content = message['content'] if isinstance(message, dict) else message.content
+        total += count_tokens(content) + 4
+    return total
+
+
+class TokenUsage:
+    """Thread-safe record of tokens used per pipeline stage."""
+    
+    def __init__(self):
+        """Initialize empty counters."""
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, int]] = {}
+    
+    def record(
+        self,
+        stage: str,
+        prompt_tokens: int,
+        completion_tokens: int = 0,
+        cached: bool = False
+    ):
+        """
+        Record the tokens of one LLM call.
+        
+        Args:
+            stage: Pipeline stage
+            prompt_tokens: Tokens sent
+            completion_tokens: Tokens received
+            cached: Whether the response came from the cache (no tokens billed)
+        """
+        with self._lock:
+            counters = self._stages.setdefault(stage, {
+                'calls': 0, 'cached_calls': 0, 'prompt_tokens': 0, 'completion_tokens': 0
+            })
+            if cached:
+                counters['cached_calls'] += 1
+                return
+            counters['calls'] += 1
+            counters['prompt_tokens'] += prompt_tokens
+            counters['completion_tokens'] += completion_tokens
+        
+        logger.info(
+            f"Stage '{stage}' used {prompt_tokens} prompt + {completion_tokens} completion tokens"
+        )
+    
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get a copy of the counters.
+        
+        Returns:
+            Dict of stage -> counters
+        """
+        with self._lock:
+            return {stage: dict(counters) for stage, counters in self._stages.items()}
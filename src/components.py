@@ -0,0 +1,299 @@
+"""Process-wide container of warm, shareable components."""
+
+import logging
+import threading
+from typing import Optional
+
+import httpx
+
+from .config.config_manager import ConfigManager
+from .api.api_client import DeepSeekClient
+from .api.llm_cache import LLMCache
+from .api.tokens import TokenUsage
+from .api.summarizer import MapReduceSummarizer
+from .api.rollups import RollupAggregator
+from .agents.news_agent import NewsAgent
+from .agents.memory import NewsMemory
+from .agents.event_loop import run_sync
+from .agents.fetcher import ArticleFetcher
+from .agents.dedup import NearDuplicateFilter, SeenUrlFilter
+from .reporters.report_generator import ReportGenerator
+from .reporters.email_reporter import EmailReporter
+from .scheduler.data_manager import DataManager
+from .scheduler.vector_index import ArticleVectorIndex
+
+logger = logging.getLogger(__name__)
+
+
+class Components:
+    """
+    Holds the clients used by monitoring cycles for the lifetime of the process.
+    
+    Components are created lazily on first use and then shared by every cycle,
+    so HTTP keep-alive connections, TLS sessions, the SMTP login and the loaded
+    memory survive between runs. All components are safe to use from several
+    scheduler threads at once.
+    """
+    
+    def __init__(
+        self,
+        config: ConfigManager,
+        data_manager: Optional[DataManager] = None,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Initialize the container.
+        
+        Args:
+            config: Configuration manager
+            data_manager: Existing data manager (created from config otherwise)
+            max_workers: Scheduler threads sharing the components (defaults to
+                scheduler.max_workers); sizes the database connection pool
+        """
+        self.config = config
+        self.max_workers = max_workers or config.scheduler_max_workers
+        self._data_manager = data_manager
+        self._http_client: Optional[httpx.Client] = None
+        self._http_async_client: Optional[httpx.AsyncClient] = None
+        self._llm_cache: Optional[LLMCache] = None
+        self._fetcher: Optional[ArticleFetcher] = None
+        self._seen_urls: Optional[SeenUrlFilter] = None
+        self.token_usage = TokenUsage()
+        self._deepseek: Optional[DeepSeekClient] = None
+        self._summarizer: Optional[MapReduceSummarizer] = None
+        self._agent: Optional[NewsAgent] = None
+        self._report_generator: Optional[ReportGenerator] = None
+        self._email_reporter: Optional[EmailReporter] = None
+        self._lock = threading.RLock()
+    
+    @property
+    def data_manager(self) -> DataManager:
+        """Get the shared data manager."""
+        if self._data_manager is None:
+            with self._lock:
+                if self._data_manager is None:
+                    vector_index = None
+                    if self.config.history_index_enabled:
+                        vector_index = ArticleVectorIndex(
+                            self.config.history_index_dir,
+                            dimensions=self.config.history_index_dimensions
+                        )
+                    self._data_manager = DataManager(
+                        self.config.database_path,
+                        vector_index=vector_index,
+                        pool_size=self.max_workers
+                    )
+        return self._data_manager
+    
+    @property
+    def http_client(self) -> httpx.Client:
+        """Get the pooled HTTP client shared by all LLM clients."""
+        if self._http_client is None:
+            with self._lock:
+                if self._http_client is None:
+                    max_connections = self.config.deepseek_max_connections
+                    self._http_client = httpx.Client(
+                        limits=httpx.Limits(
+                            max_connections=max_connections,
+                            max_keepalive_connections=max_connections
+                        ),
+                        timeout=httpx.Timeout(120.0, connect=10.0)
+                    )
+        return self._http_client
+    
+    @property
+    def http_async_client(self) -> httpx.AsyncClient:
+        """Get the pooled async HTTP client used on the research event loop."""
+        if self._http_async_client is None:
+            with self._lock:
+                if self._http_async_client is None:
+                    max_connections = self.config.deepseek_max_connections
+                    self._http_async_client = httpx.AsyncClient(
+                        limits=httpx.Limits(
+                            max_connections=max_connections,
+                            max_keepalive_connections=max_connections
+                        ),
+                        timeout=httpx.Timeout(120.0, connect=10.0)
+                    )
+        return self._http_async_client
+    
+    @property
+    def llm_cache(self) -> Optional[LLMCache]:
+        """Get the shared LLM response cache (None when disabled)."""
+        if self._llm_cache is None and self.config.cache_enabled:
+            with self._lock:
+                if self._llm_cache is None:
+                    self._llm_cache = LLMCache(
+                        self.config.cache_path,
+                        max_entries=self.config.cache_max_entries,
+                        ttls=self.config.cache_ttls
+                    )
+        return self._llm_cache
+    
+    @property
+    def fetcher(self) -> ArticleFetcher:
+        """Get the shared article page fetcher."""
+        if self._fetcher is None:
+            with self._lock:
+                if self._fetcher is None:
+                    self._fetcher = ArticleFetcher(
+                        cache_dir=self.config.fetcher_cache_dir,
+                        max_workers=self.config.fetcher_max_workers,
+                        per_host_limit=self.config.fetcher_per_host_limit,
+                        min_host_interval=self.config.fetcher_min_host_interval,
+                        max_bytes=self.config.fetcher_max_bytes,
+                        timeout=self.config.fetcher_timeout,
+                        cache_ttl=self.config.fetcher_cache_ttl,
+                        cache_max_bytes=self.config.fetcher_cache_max_mb * 1024 * 1024,
+                        cache_max_age=self.config.fetcher_cache_max_age
+                    )
+        return self._fetcher
+    
+    @property
+    def deepseek(self) -> DeepSeekClient:
+        """Get the shared DeepSeek client."""
+        if self._deepseek is None:
+            with self._lock:
+                if self._deepseek is None:
+                    self._deepseek = DeepSeekClient(
+                        api_key=self.config.deepseek_api_key,
+                        base_url=self.config.deepseek_base_url,
+                        model=self.config.deepseek_model,
+                        temperature=self.config.deepseek_temperature,
+                        max_tokens=self.config.deepseek_max_tokens,
+                        http_client=self.http_client,
+                        cache=self.llm_cache,
+                        token_budget=self.config.deepseek_aggregate_token_budget,
+                        usage=self.token_usage
+                    )
+        return self._deepseek
+    
+    @property
+    def summarizer(self) -> MapReduceSummarizer:
+        """Get the shared map-reduce summarizer (one limit on aggregate LLM calls)."""
+        if self._summarizer is None:
+            with self._lock:
+                if self._summarizer is None:
+                    self._summarizer = MapReduceSummarizer(
+                        self.deepseek,
+                        chunk_tokens=self.config.deepseek_aggregate_chunk_tokens,
+                        max_workers=self.config.deepseek_aggregate_workers
+                    )
+        return self._summarizer
+    
+    @property
+    def rollups(self) -> RollupAggregator:
+        """Get an incremental rollup aggregator over the shared data manager."""
+        return RollupAggregator(
+            self.data_manager,
+            self.summarizer,
+            granularity=self.config.scheduler_rollup_granularity
+        )
+    
+    @property
+    def near_duplicates(self) -> Optional[NearDuplicateFilter]:
+        """Get the per-session near-duplicate filter (None when disabled)."""
+        if not self.config.dedup_enabled:
+            return None
+        return NearDuplicateFilter(self.data_manager, threshold=self.config.dedup_threshold)
+    
+    @property
+    def seen_urls(self) -> Optional[SeenUrlFilter]:
+        """Get the shared per-session seen-URL filter (None when disabled)."""
+        if not self.config.dedup_skip_seen_urls:
+            return None
+        if self._seen_urls is None:
+            with self._lock:
+                if self._seen_urls is None:
+                    self._seen_urls = SeenUrlFilter(self.data_manager)
+        return self._seen_urls
+    
+    @property
+    def agent(self) -> NewsAgent:
+        """Get the shared news agent."""
+        if self._agent is None:
+            with self._lock:
+                if self._agent is None:
+                    self._agent = NewsAgent(
+                        api_key=self.config.deepseek_api_key,
+                        base_url=self.config.deepseek_base_url,
+                        model=self.config.deepseek_model,
+                        temperature=self.config.deepseek_temperature,
+                        search_tool=self.config.search_default_tool,
+                        max_results=self.config.search_max_results,
+                        http_client=self.http_client,
+                        http_async_client=self.http_async_client,
+                        memory=NewsMemory(
+                            recent_entries=self.config.memory_recent_entries,
+                            condensed_entries=self.config.memory_condensed_entries,
+                            context_chars=self.config.memory_context_chars
+                        ),
+                        num_queries=self.config.search_num_queries,
+                        max_concurrency=self.config.search_max_concurrency,
+                        cache=self.llm_cache,
+                        token_budget=self.config.deepseek_analysis_token_budget,
+                        usage=self.token_usage,
+                        fetcher=self.fetcher,
+                        enrich_top_k=self.config.enrichment_top_k,
+                        enrich_deadline=self.config.enrichment_deadline,
+                        enrich_max_chars=self.config.enrichment_max_chars,
+                        search_source=self.config.search_source,
+                        dedup=self.near_duplicates,
+                        seen_urls=self.seen_urls
+                    )
+        return self._agent
+    
+    @property
+    def report_generator(self) -> ReportGenerator:
+        """Get the shared report generator."""
+        if self._report_generator is None:
+            with self._lock:
+                if self._report_generator is None:
+                    self._report_generator = ReportGenerator()
+        return self._report_generator
+    
+    @property
+    def email_reporter(self) -> EmailReporter:
+        """Get the shared email reporter with a pooled SMTP connection."""
+        if self._email_reporter is None:
+            with self._lock:
+                if self._email_reporter is None:
+                    self._email_reporter = EmailReporter(
+                        smtp_server=self.config.email_smtp_server,
+                        smtp_port=self.config.email_smtp_port,
+                        from_address=self.config.email_from,
+                        password=self.config.email_password,
+                        use_tls=self.config.email_use_tls,
+                        keep_alive=True
+                    )
+        return self._email_reporter
+    
+    def close(self):
+        """Release pooled connections; components are rebuilt on next use."""
+        with self._lock:
+            if self._email_reporter is not None:
+                self._email_reporter.close()
+                self._email_reporter = None
+            if self._fetcher is not None:
+                self._fetcher.close()
+                self._fetcher = None
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+            if self._http_async_client is not None:
+                # Async connections belong to the research event loop
+                run_sync(self._http_async_client.aclose())
+                self._http_async_client = None
+            if self._llm_cache is not None:
+                self._llm_cache.close()
+                self._llm_cache = None
+            if self._data_manager is not None:
+                self._data_manager.close()
+                self._data_manager = None
+            # Clients bound to the closed pools must be rebuilt on next use
+            self._seen_urls = None
+            self._deepseek = None
+            self._summarizer = None
+            self._agent = None
+            self._report_generator = None
+        logger.info("Components closed")
@@ -59,6 +59,25 @@ class ConfigManager:
         
         return value if value is not None else default
     
+    def _get_bool(self, key_path: str, default: bool) -> bool:
+        """
+        Get a boolean configuration value.
+        
+        Strings (e.g. from environment variables) count as true if they are
+        'true', '1' or 'yes', in any case.
+        
+        Args:
+            key_path: Dot-notation path (e.g., "cache.enabled")
+            default: Default value if not found
+            
+        Returns:
+            Configuration value as a bool
+        """
+        value = self.get(key_path, default)
+        if isinstance(value, str):
+            return value.lower() in ('true', '1', 'yes')
+        return bool(value)
+    
     def validate_required(self) -> tuple[bool, list[str]]:
         """
         Validate that all required configuration values are present.
@@ -104,6 +123,31 @@ class ConfigManager:
         """Get DeepSeek max tokens."""
         return int(self.get("deepseek.max_tokens", 4000))
     
+    @property
+    def deepseek_analysis_token_budget(self) -> int:
+        """Get max prompt tokens for per-cycle analysis calls."""
+        return int(self.get("deepseek.analysis_token_budget", 12000))
+    
+    @property
+    def deepseek_aggregate_token_budget(self) -> int:
+        """Get max prompt tokens for aggregate calls."""
+        return int(self.get("deepseek.aggregate_token_budget", 48000))
+    
+    @property
+    def deepseek_aggregate_chunk_tokens(self) -> int:
+        """Get max report tokens per map/reduce call of the aggregate summarizer."""
+        return int(self.get("deepseek.aggregate_chunk_tokens", 12000))
+    
+    @property
+    def deepseek_aggregate_workers(self) -> int:
+        """Get max parallel map/reduce calls of the aggregate summarizer."""
+        return int(self.get("deepseek.aggregate_workers", 4))
+    
+    @property
+    def deepseek_max_connections(self) -> int:
+        """Get size of the pooled HTTP connection pool for LLM calls."""
+        return int(self.get("deepseek.max_connections", 20))
+    
     @property
     def email_smtp_server(self) -> str:
         """Get email SMTP server."""
@@ -117,10 +161,7 @@ class ConfigManager:
     @property
     def email_use_tls(self) -> bool:
         """Get email TLS setting."""
-        use_tls = self.get("email.use_tls", True)
-        if isinstance(use_tls, str):
-            return use_tls.lower() in ('true', '1', 'yes')
-        return bool(use_tls)
+        return self._get_bool("email.use_tls", True)
     
     @property
     def email_from(self) -> str:
@@ -142,6 +183,98 @@ class ConfigManager:
         """Get max search results."""
         return int(self.get("search.max_results", 10))
     
+    @property
+    def search_source(self) -> str:
+        """Get search endpoint (news or text)."""
+        return self.get("search.source", "news")
+    
+    @property
+    def search_num_queries(self) -> int:
+        """Get number of complementary queries searched per cycle."""
+        return int(self.get("search.num_queries", 3))
+    
+    @property
+    def search_max_concurrency(self) -> int:
+        """Get max concurrent searches per cycle."""
+        return int(self.get("search.max_concurrency", 3))
+    
+    @property
+    def dedup_enabled(self) -> bool:
+        """Check if near-duplicate filtering of scheduled cycles is enabled."""
+        return self._get_bool("dedup.enabled", True)
+    
+    @property
+    def dedup_skip_seen_urls(self) -> bool:
+        """Check if scheduled cycles skip URLs already analyzed in the session."""
+        return self._get_bool("dedup.skip_seen_urls", True)
+    
+    @property
+    def dedup_threshold(self) -> float:
+        """Get min estimated text similarity (0-1) counted as the same story."""
+        return float(self.get("dedup.threshold", 0.5))
+    
+    @property
+    def enrichment_top_k(self) -> int:
+        """Get number of articles whose full text is fetched before analysis (0 if disabled)."""
+        if not self._get_bool("enrichment.enabled", False):
+            return 0
+        return int(self.get("enrichment.top_k", 3))
+    
+    @property
+    def enrichment_deadline(self) -> float:
+        """Get seconds full-text enrichment may take before falling back to snippets."""
+        return float(self.get("enrichment.deadline_seconds", 8))
+    
+    @property
+    def enrichment_max_chars(self) -> int:
+        """Get total characters of full text passed to analysis."""
+        return int(self.get("enrichment.max_chars", 15000))
+    
+    @property
+    def fetcher_max_workers(self) -> int:
+        """Get max concurrent article page fetches."""
+        return int(self.get("fetcher.max_workers", 8))
+    
+    @property
+    def fetcher_per_host_limit(self) -> int:
+        """Get max concurrent requests to one host."""
+        return int(self.get("fetcher.per_host_limit", 2))
+    
+    @property
+    def fetcher_min_host_interval(self) -> float:
+        """Get min seconds between requests to one host."""
+        return float(self.get("fetcher.min_host_interval", 0.5))
+    
+    @property
+    def fetcher_max_bytes(self) -> int:
+        """Get max bytes downloaded per page."""
+        return int(self.get("fetcher.max_bytes", 512 * 1024))
+    
+    @property
+    def fetcher_timeout(self) -> float:
+        """Get per-request timeout in seconds."""
+        return float(self.get("fetcher.timeout", 10))
+    
+    @property
+    def fetcher_cache_ttl(self) -> int:
+        """Get seconds a cached page is used before revalidation."""
+        return int(self.get("fetcher.cache_ttl", 3600))
+    
+    @property
+    def fetcher_cache_max_mb(self) -> int:
+        """Get max size of the page cache in megabytes."""
+        return int(self.get("fetcher.cache_max_mb", 256))
+    
+    @property
+    def fetcher_cache_max_age(self) -> int:
+        """Get seconds an unused cached page is kept."""
+        return int(self.get("fetcher.cache_max_age", 7 * 24 * 3600))
+    
+    @property
+    def fetcher_cache_dir(self) -> Path:
+        """Get the page cache directory."""
+        return Path(self.get("fetcher.cache_dir", "./data/http_cache"))
+    
     @property
     def search_depth(self) -> int:
         """Get search depth."""
@@ -157,11 +290,67 @@ class ConfigManager:
         """Get scheduler timezone."""
         return self.get("scheduler.timezone", "America/New_York")
     
+    @property
+    def scheduler_max_workers(self) -> int:
+        """Get max number of concurrent monitoring cycles."""
+        return int(self.get("scheduler.max_workers", 10))
+    
+    @property
+    def scheduler_poll_interval(self) -> int:
+        """Get daemon session poll interval in seconds."""
+        return int(self.get("scheduler.poll_interval_seconds", 60))
+    
+    @property
+    def scheduler_rollup_granularity(self) -> str:
+        """Get time bucket size for aggregate rollups ('day' or 'week')."""
+        return self.get("scheduler.rollup_granularity", "day")
+    
     @property
     def scheduler_max_history_days(self) -> int:
         """Get max history days."""
         return int(self.get("scheduler.max_history_days", 30))
     
+    @property
+    def cache_enabled(self) -> bool:
+        """Get whether the LLM response cache is enabled."""
+        return self._get_bool("cache.enabled", True)
+    
+    @property
+    def cache_path(self) -> Path:
+        """Get LLM response cache file path."""
+        return Path(self.get("cache.path", "./data/llm_cache.db"))
+    
+    @property
+    def memory_recent_entries(self) -> int:
+        """Get number of full report summaries kept per topic in agent memory."""
+        return int(self.get("memory.recent_entries", 5))
+    
+    @property
+    def memory_condensed_entries(self) -> int:
+        """Get number of condensed older summaries kept per topic in agent memory."""
+        return int(self.get("memory.condensed_entries", 20))
+    
+    @property
+    def memory_context_chars(self) -> int:
+        """Get character budget of the memory context passed to the LLM."""
+        return int(self.get("memory.context_chars", 3000))
+    
+    @property
+    def cache_max_entries(self) -> int:
+        """Get max number of cached LLM responses."""
+        return int(self.get("cache.max_entries", 5000))
+    
+    @property
+    def cache_ttls(self) -> Dict[str, int]:
+        """Get LLM response cache TTLs in seconds per pipeline stage."""
+        return {
+            'search_query': int(self.get("cache.ttl.search_query", 1800)),
+            'analysis': int(self.get("cache.ttl.analysis", 1800)),
+            'aggregate': int(self.get("cache.ttl.aggregate", 86400)),
+            'aggregate_map': int(self.get("cache.ttl.aggregate_map", 30 * 86400)),
+            'aggregate_reduce': int(self.get("cache.ttl.aggregate_reduce", 30 * 86400)),
+        }
+    
     @property
     def log_level(self) -> str:
         """Get log level."""
@@ -181,6 +370,21 @@ class ConfigManager:
         path.mkdir(parents=True, exist_ok=True)
         return path
     
+    @property
+    def history_index_enabled(self) -> bool:
+        """Check if stored articles are added to the local vector index."""
+        return self._get_bool("history_index.enabled", True)
+    
+    @property
+    def history_index_dir(self) -> Path:
+        """Get the article vector index directory."""
+        return Path(self.get("history_index.dir", "./data/vector_index"))
+    
+    @property
+    def history_index_dimensions(self) -> int:
+        """Get the embedding length of the article vector index (power of two)."""
+        return int(self.get("history_index.dimensions", 256))
+    
     @property
     def database_path(self) -> Path:
         """Get database file path."""
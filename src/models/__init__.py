@@ -0,0 +1 @@
+"""Shared data models."""
@@ -0,0 +1,162 @@
+"""Compact article record shared by search, storage and reporting."""
+
+import hashlib
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Any, Optional, Sequence
+
+from ..agents.urls import canonicalize_url
+
+
+@dataclass(slots=True)
+class Article:
+    """
+    One news article as it moves through a monitoring cycle.
+    
+    Slotted so that large aggregates (hundreds of thousands of stored
+    articles) cost a fraction of the memory of plain dicts.
+    """
+    title: str = 'Untitled Article'
+    url: str = 'N/A'
+    source: str = 'Web'
+    snippet: str = ''
+    published: Optional[str] = None
+    found_at: Optional[datetime] = None
+    content: Optional[str] = None
+    
+    @property
+    def has_link(self) -> bool:
+        """Whether the article has a fetchable http(s) URL."""
+        return self.url.lower().startswith(('http://', 'https://'))
+    
+    @property
+    def text(self) -> str:
+        """Best available body text: the full content if fetched, otherwise the snippet."""
+        return self.content or self.snippet
+    
+    @property
+    def dedup_key(self) -> str:
+        """Key identifying the same story across searches (canonical URL, or title without a link)."""
+        if self.has_link:
+            return canonicalize_url(self.url)
+        return self.title.strip().lower()
+    
+    @property
+    def content_hash(self) -> str:
+        """Stable hex digest of the canonical URL, title and snippet."""
+        payload = f"{self.dedup_key}\n{self.title.strip()}\n{' '.join(self.snippet.split())}"
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Article":
+        """
+        Build an article from a dict with article keys (unknown keys are ignored).
+        
+        Args:
+            data: Dict with title, url, source, snippet, ... keys
+        
+        Returns:
+            Article instance
+        """
+        return cls(
+            title=data.get('title') or 'Untitled Article',
+            url=data.get('url') or 'N/A',
+            source=data.get('source') or 'Web',
+            snippet=data.get('snippet') or '',
+            published=data.get('published'),
+            found_at=data.get('found_at'),
+            content=data.get('content')
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dict, leaving out unset optional fields.
+        
+        Returns:
+            Dict of field -> value
+        """
+        data = {
+            'title': self.title,
+            'url': self.url,
+            'source': self.source,
+            'snippet': self.snippet
+        }
+        for name in ('published', 'found_at', 'content'):
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        return data
+    
+    @classmethod
+    def from_row(cls, row: Any) -> "Article":
+        """
+        Build an article from a NewsArticle row (or a row of its columns).
+        
+        Source names repeat across thousands of rows, so they are interned.
+        
+        Args:
+            row: Object with title, url, source, snippet and found_at attributes
+        
+        Returns:
+            Article instance
+        """
+        return cls(
+            title=row.title or 'Untitled Article',
+            url=row.url or 'N/A',
+            source=sys.intern(row.source) if row.source else 'Web',
+            snippet=row.snippet or '',
+            found_at=row.found_at
+        )
+    
+    def to_columns(self) -> Dict[str, Any]:
+        """
+        Get the NewsArticle column values for this article.
+        
+        Returns:
+            Dict of column -> value (without session_id and found_at)
+        """
+        return {
+            'title': self.title,
+            'url': self.url,
+            'source': self.source,
+            'snippet': self.snippet
+        }
+    
+    def to_compact(self) -> list:
+        """
+        Serialize to a compact JSON-compatible list.
+        
+        Fields are stored positionally and trailing unset fields are dropped.
+        
+        Returns:
+            List of field values
+        """
+        values = [
+            self.title,
+            self.url,
+            self.source,
+            self.snippet,
+            self.published,
+            self.found_at.isoformat() if self.found_at else None,
+            self.content
+        ]
+        while values and values[-1] is None:
+            values.pop()
+        return values
+    
+    @classmethod
+    def from_compact(cls, values: Sequence[Any]) -> "Article":
+        """
+        Rebuild an article from to_compact output.
+        
+        Args:
+            values: List from to_compact
+        
+        Returns:
+            Article instance
+        """
+        article = cls(*values)
+        if isinstance(article.found_at, str):
+            article.found_at = datetime.fromisoformat(article.found_at)
+        return article
@@ -2,6 +2,7 @@
 
 import logging
 import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Optional
@@ -18,7 +19,8 @@ class EmailReporter:
         smtp_port: int,
         from_address: str,
         password: str,
-        use_tls: bool = True
+        use_tls: bool = True,
+        keep_alive: bool = False
     ):
         """
         Initialize email reporter.
@@ -29,15 +31,59 @@ class EmailReporter:
             from_address: Sender email address
             password: Email password or app password
             use_tls: Whether to use TLS
+            keep_alive: Reuse one authenticated SMTP connection across sends
         """
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
         self.from_address = from_address
         self.password = password
         self.use_tls = use_tls
+        self.keep_alive = keep_alive
+        
+        # Pooled connection, shared by scheduler threads when keep_alive is set
+        self._server: Optional[smtplib.SMTP] = None
+        self._lock = threading.Lock()
         
         logger.info(f"EmailReporter initialized with {smtp_server}:{smtp_port}")
     
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection."""
+        if self.use_tls:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=60)
+            server.starttls()
+        else:
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, timeout=60)
+        server.login(self.from_address, self.password)
+        return server
+    
+    def _get_connection(self) -> smtplib.SMTP:
+        """Return the pooled connection, reconnecting if the server dropped it."""
+        if self._server is not None:
+            try:
+                if self._server.noop()[0] == 250:
+                    return self._server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_connection()
+        
+        self._server = self._connect()
+        logger.debug(f"Opened pooled SMTP connection to {self.smtp_server}:{self.smtp_port}")
+        return self._server
+    
+    def _close_connection(self):
+        """Close the pooled connection, ignoring errors from a dead socket."""
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._server = None
+    
+    def close(self):
+        """Close the pooled SMTP connection, if any."""
+        with self._lock:
+            self._close_connection()
+    
     def send_report(
         self,
         to_address: str,
@@ -76,14 +122,16 @@ class EmailReporter:
             # Send email
             logger.info(f"Sending email to {to_address}")
             
-            if self.use_tls:
-                with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                    server.starttls()
-                    server.login(self.from_address, self.password)
-                    server.send_message(msg)
+            if self.keep_alive:
+                with self._lock:
+                    try:
+                        self._get_connection().send_message(msg)
+                    except (smtplib.SMTPServerDisconnected, OSError):
+                        # Idle connection was dropped between checks, retry once
+                        self._close_connection()
+                        self._get_connection().send_message(msg)
             else:
-                with smtplib.SMTP_SSL(self.smtp_server, self.smtp_port) as server:
-                    server.login(self.from_address, self.password)
+                with self._connect() as server:
                     server.send_message(msg)
             
             logger.info(f"Email sent successfully to {to_address}")
@@ -1,18 +1,50 @@
 """Report generation and formatting."""
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Iterable
 from datetime import datetime
 
+from ..models.article import Article
+
 logger = logging.getLogger(__name__)
 
+# Articles listed in an aggregate report
+AGGREGATE_ARTICLES = 50
+
+
+def first_unique_articles(articles: Iterable[Article], limit: int = AGGREGATE_ARTICLES) -> List[Article]:
+    """
+    Take the first ``limit`` articles with distinct URLs from a stream.
+    
+    Articles without a link are always kept. Reading stops as soon as the
+    list is full, so only the URLs seen up to then are held in memory.
+    
+    Args:
+        articles: Articles in report order (e.g. DataManager.iter_articles)
+        limit: Max number of articles
+    
+    Returns:
+        Up to ``limit`` articles
+    """
+    seen_urls = set()
+    unique_articles = []
+    for article in articles:
+        if len(unique_articles) == limit:
+            break
+        if not article.has_link:
+            unique_articles.append(article)
+        elif article.url not in seen_urls:
+            seen_urls.add(article.url)
+            unique_articles.append(article)
+    return unique_articles
+
 
 class ReportGenerator:
     """Generates formatted reports from news data."""
     
     def generate_html_report(
         self,
-        articles: List[Dict[str, Any]],
+        articles: List[Article],
         analysis: str,
         prompt: str,
         report_type: str = "instant"
@@ -37,14 +69,14 @@ class ReportGenerator:
             articles_html += f"""
             <div style="margin-bottom: 20px; padding: 15px; background-color: #f8f9fa; border-left: 4px solid #007bff; border-radius: 4px;">
                 <h3 style="margin-top: 0; color: #007bff;">
-                    {i}. {article.get('title', 'No Title')}
+                    {i}. {article.title}
                 </h3>
                 <p style="margin: 5px 0; color: #6c757d; font-size: 0.9em;">
-                    <strong>Source:</strong> {article.get('source', 'Unknown')}
+                    <strong>Source:</strong> {article.source}
                 </p>
-                {f'<p style="margin: 5px 0;"><a href="{article.get("url")}" style="color: #007bff; text-decoration: none;">Read Article →</a></p>' if article.get('url') and article.get('url') != 'N/A' else ''}
+                {f'<p style="margin: 5px 0;"><a href="{article.url}" style="color: #007bff; text-decoration: none;">Read Article →</a></p>' if article.has_link else ''}
                 <p style="margin: 10px 0 0 0;">
-                    {article.get('snippet', 'No description available.')}
+                    {article.snippet or 'No description available.'}
                 </p>
             </div>
             """
@@ -102,7 +134,7 @@ class ReportGenerator:
     
     def generate_text_report(
         self,
-        articles: List[Dict[str, Any]],
+        articles: List[Article],
         analysis: str,
         prompt: str,
         report_type: str = "instant"
@@ -144,11 +176,11 @@ NEWS ARTICLES ({len(articles)})
         
         for i, article in enumerate(articles, 1):
             report += f"""
-{i}. {article.get('title', 'No Title')}
-   Source: {article.get('source', 'Unknown')}
-   URL: {article.get('url', 'N/A')}
+{i}. {article.title}
+   Source: {article.source}
+   URL: {article.url}
    
-   {article.get('snippet', 'No description available.')}
+   {article.snippet or 'No description available.'}
 
 {'-' * 80}
 """
@@ -164,7 +196,8 @@ Powered by LangChain & Python
     
     def generate_aggregate_report(
         self,
-        all_articles: List[List[Dict[str, Any]]],
+        unique_articles: List[Article],
+        stats: Dict[str, int],
         aggregate_analysis: str,
         prompt: str,
         start_date: datetime,
@@ -174,7 +207,8 @@ Powered by LangChain & Python
         Generate an aggregate HTML report from multiple monitoring sessions.
         
         Args:
-            all_articles: List of article lists from each session
+            unique_articles: Articles to list (see first_unique_articles)
+            stats: Article counts over the whole history (DataManager.get_article_stats)
             aggregate_analysis: Combined analysis from DeepSeek
             prompt: Original search prompt
             start_date: Start of monitoring period
@@ -183,38 +217,24 @@ Powered by LangChain & Python
         Returns:
             HTML string
         """
-        total_articles = sum(len(articles) for articles in all_articles)
-        num_sessions = len(all_articles)
-        
-        # Flatten and deduplicate articles
-        seen_urls = set()
-        unique_articles = []
-        for articles in all_articles:
-            for article in articles:
-                url = article.get('url', '')
-                if url and url != 'N/A' and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_articles.append(article)
-                elif not url or url == 'N/A':
-                    unique_articles.append(article)
-        
         # Generate articles HTML
-        articles_html = ""
-        for i, article in enumerate(unique_articles[:50], 1):  # Limit to top 50
-            articles_html += f"""
+        articles_html = "".join(
+            f"""
             <div style="margin-bottom: 20px; padding: 15px; background-color: #f8f9fa; border-left: 4px solid #28a745; border-radius: 4px;">
                 <h3 style="margin-top: 0; color: #28a745;">
-                    {i}. {article.get('title', 'No Title')}
+                    {i}. {article.title}
                 </h3>
                 <p style="margin: 5px 0; color: #6c757d; font-size: 0.9em;">
-                    <strong>Source:</strong> {article.get('source', 'Unknown')}
+                    <strong>Source:</strong> {article.source}
                 </p>
-                {f'<p style="margin: 5px 0;"><a href="{article.get("url")}" style="color: #28a745; text-decoration: none;">Read Article →</a></p>' if article.get('url') and article.get('url') != 'N/A' else ''}
+                {f'<p style="margin: 5px 0;"><a href="{article.url}" style="color: #28a745; text-decoration: none;">Read Article →</a></p>' if article.has_link else ''}
                 <p style="margin: 10px 0 0 0;">
-                    {article.get('snippet', 'No description available.')}
+                    {article.snippet or 'No description available.'}
                 </p>
             </div>
             """
+            for i, article in enumerate(unique_articles[:AGGREGATE_ARTICLES], 1)
+        )
         
         html = f"""
         <!DOCTYPE html>
@@ -232,9 +252,9 @@ Powered by LangChain & Python
                 <p style="margin: 0; opacity: 0.9; font-size: 14px;">
                     <strong>Period:</strong> {start_date.strftime("%Y-%m-%d %H:%M")} to {end_date.strftime("%Y-%m-%d %H:%M")}<br>
                     <strong>Query:</strong> "{prompt}"<br>
-                    <strong>Monitoring Sessions:</strong> {num_sessions}<br>
-                    <strong>Total Articles Found:</strong> {total_articles}<br>
-                    <strong>Unique Articles:</strong> {len(unique_articles)}
+                    <strong>Monitoring Sessions:</strong> {stats['runs']}<br>
+                    <strong>Total Articles Found:</strong> {stats['articles']}<br>
+                    <strong>Unique Articles:</strong> {stats['unique_articles']}
                 </p>
             </div>
             
@@ -251,7 +271,7 @@ Powered by LangChain & Python
             <!-- All Articles -->
             <div style="margin-bottom: 30px;">
                 <h2 style="color: #11998e; border-bottom: 2px solid #11998e; padding-bottom: 10px;">
-                    📑 Unique Articles ({len(unique_articles)})
+                    📑 Unique Articles ({stats['unique_articles']})
                 </h2>
                 {articles_html}
             </div>
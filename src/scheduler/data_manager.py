@@ -2,12 +2,24 @@
 
 import logging
 import json
+import re
 from datetime import datetime, timedelta
+from itertools import groupby
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple, Set
+import numpy as np
+from sqlalchemy import (
+    create_engine, Column, Integer, String, Text, DateTime, LargeBinary, UniqueConstraint, Index, func,
+    table, column, literal_column, insert, update, case, or_, distinct, event
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from ..models.article import Article
+from . import migrations
+from .vector_index import ArticleVectorIndex, article_text
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +29,9 @@ Base = declarative_base()
 class MonitoringSession(Base):
     """Database model for monitoring sessions."""
     __tablename__ = 'monitoring_sessions'
+    __table_args__ = (
+        Index('ix_monitoring_sessions_active', 'is_active'),
+    )
     
     id = Column(Integer, primary_key=True)
     prompt = Column(String(500), nullable=False)
@@ -27,12 +42,32 @@ class MonitoringSession(Base):
     email_to = Column(String(200))
     
 
+class MonitoringRun(Base):
+    """Database model for one monitoring cycle of a session (its articles and report)."""
+    __tablename__ = 'monitoring_runs'
+    __table_args__ = (
+        Index('ix_monitoring_runs_session_run_at', 'session_id', 'run_at'),
+        Index('ix_monitoring_runs_run_at', 'run_at'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    session_id = Column(Integer, nullable=False)
+    run_at = Column(DateTime, nullable=False)
+    article_count = Column(Integer, default=0)
+
+
 class NewsArticle(Base):
     """Database model for news articles."""
     __tablename__ = 'news_articles'
+    __table_args__ = (
+        Index('ix_news_articles_session_found', 'session_id', 'found_at'),
+        Index('ix_news_articles_found_at', 'found_at'),
+        Index('ix_news_articles_run', 'run_id'),
+    )
     
     id = Column(Integer, primary_key=True)
     session_id = Column(Integer, nullable=False)
+    run_id = Column(Integer)  # monitoring_runs.id
     title = Column(String(500))
     url = Column(Text)
     source = Column(String(200))
@@ -43,36 +78,199 @@ class NewsArticle(Base):
 class MonitoringReport(Base):
     """Database model for monitoring reports."""
     __tablename__ = 'monitoring_reports'
+    __table_args__ = (
+        Index('ix_monitoring_reports_session_created', 'session_id', 'created_at'),
+        Index('ix_monitoring_reports_created_at', 'created_at'),
+        Index('ix_monitoring_reports_run', 'run_id'),
+    )
     
     id = Column(Integer, primary_key=True)
     session_id = Column(Integer, nullable=False)
+    run_id = Column(Integer)  # monitoring_runs.id
     analysis = Column(Text)
     created_at = Column(DateTime, nullable=False)
     article_count = Column(Integer, default=0)
 
 
+class AggregateRollup(Base):
+    """Database model for per-bucket aggregate summaries of a session's reports."""
+    __tablename__ = 'aggregate_rollups'
+    __table_args__ = (
+        UniqueConstraint('session_id', 'granularity', 'bucket_start'),
+        Index('ix_aggregate_rollups_bucket_start', 'bucket_start'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    session_id = Column(Integer, nullable=False)
+    granularity = Column(String(10), nullable=False)  # 'day' or 'week'
+    bucket_start = Column(DateTime, nullable=False)
+    report_count = Column(Integer, nullable=False)
+    last_report_id = Column(Integer, nullable=False)
+    summary = Column(Text)
+    updated_at = Column(DateTime, nullable=False)
+
+
+class ArticleSignature(Base):
+    """MinHash signature of an analyzed article, used to skip repeated stories."""
+    __tablename__ = 'article_signatures'
+    __table_args__ = (
+        Index('ix_article_signatures_created_at', 'created_at'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    session_id = Column(Integer, nullable=False)
+    signature = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+
+class ArticleSignatureBand(Base):
+    """LSH band key of an article signature (lookup index for near duplicates)."""
+    __tablename__ = 'article_signature_bands'
+    __table_args__ = (
+        Index('ix_article_signature_bands_lookup', 'session_id', 'band_key'),
+    )
+    
+    signature_id = Column(Integer, primary_key=True)
+    band_key = Column(Integer, primary_key=True)
+    session_id = Column(Integer, nullable=False)
+
+
+class SeenUrl(Base):
+    """Hash of a canonical article URL already analyzed in a session."""
+    __tablename__ = 'seen_urls'
+    __table_args__ = (
+        Index('ix_seen_urls_first_seen', 'first_seen'),
+    )
+    
+    session_id = Column(Integer, primary_key=True)
+    url_hash = Column(Integer, primary_key=True)
+    first_seen = Column(DateTime, nullable=False)
+
+
+# FTS5 tables (created and kept in sync by the migrations)
+articles_fts = table('news_articles_fts', column('rowid'), column('title'), column('snippet'))
+reports_fts = table('monitoring_reports_fts', column('rowid'), column('analysis'))
+
+# Excerpt highlight markers (control characters never found in stored text)
+MATCH_START = '\x02'
+MATCH_END = '\x03'
+
+# Matches ranked per search: words found in a large share of the history are
+# ranked among their newest matches instead of all of them
+RANK_CANDIDATES = 5000
+
+_FTS_TERM_RE = re.compile(r'\w+\*?')
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn free text into an FTS5 query that matches all of its words.
+    
+    Words are quoted so punctuation and FTS5 operators in user input are
+    taken literally; a trailing ``*`` keeps a word as a prefix search.
+    
+    Args:
+        text: User query
+    
+    Returns:
+        FTS5 MATCH expression (empty if the text has no words)
+    """
+    terms = []
+    for term in _FTS_TERM_RE.findall(text):
+        prefix = term.endswith('*')
+        terms.append(f'"{term.rstrip("*")}"' + ('*' if prefix else ''))
+    return ' '.join(terms)
+
+
+# SQLite date modifiers that map a timestamp to the start of its bucket
+BUCKET_MODIFIERS = {
+    'day': (),
+    'week': ('-6 days', 'weekday 1'),  # Monday of the same week
+}
+
+BUCKET_LENGTHS = {
+    'day': timedelta(days=1),
+    'week': timedelta(days=7),
+}
+
+
+# Milliseconds a connection waits for another one's write lock before "database is locked"
+BUSY_TIMEOUT_MS = 30_000
+
+# Set on every new connection. WAL lets readers run alongside the one writer;
+# synchronous=NORMAL only fsyncs at checkpoints, which is still crash-safe in WAL.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16000",  # KiB of page cache per connection
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _configure_connection(dbapi_connection, connection_record):
+    """Apply CONNECTION_PRAGMAS to a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in CONNECTION_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 class DataManager:
     """Manages persistent storage for monitoring data."""
     
-    def __init__(self, database_path: Path):
+    def __init__(
+        self,
+        database_path: Path,
+        vector_index: Optional[ArticleVectorIndex] = None,
+        pool_size: int = 5
+    ):
         """
         Initialize data manager.
         
         Args:
             database_path: Path to SQLite database file
+            vector_index: Article vector index updated by store_articles (optional)
+            pool_size: Connections kept open for the threads sharing this manager
         """
         self.database_path = database_path
+        self.vector_index = vector_index
         database_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Create engine and tables
-        self.engine = create_engine(f'sqlite:///{database_path}')
+        # Create engine and tables. Each thread checks out its own pooled
+        # connection; writers queue on busy_timeout instead of failing.
+        self.engine = create_engine(
+            f'sqlite:///{database_path}',
+            poolclass=QueuePool,
+            pool_size=pool_size,
+            max_overflow=pool_size,
+            connect_args={'check_same_thread': False, 'timeout': BUSY_TIMEOUT_MS / 1000}
+        )
+        event.listen(self.engine, 'connect', _configure_connection)
         Base.metadata.create_all(self.engine)
+        self._upgrade_schema()
         
         # Create session maker
         self.Session = sessionmaker(bind=self.engine)
         
         logger.info(f"DataManager initialized with database: {database_path}")
     
+    def _upgrade_schema(self):
+        """Apply pending schema migrations (indexes etc. create_all leaves out on existing tables)."""
+        connection = self.engine.raw_connection()
+        try:
+            applied = migrations.upgrade(connection.driver_connection)
+            if applied:
+                logger.info(f"Applied {applied} database migration(s), schema version {migrations.SCHEMA_VERSION}")
+        finally:
+            connection.close()
+    
+    def close(self):
+        """Close the pooled database connections (new ones are opened on next use)."""
+        self.engine.dispose()
+    
     def create_session(
         self,
         prompt: str,
@@ -164,40 +362,139 @@ class DataManager:
         finally:
             session.close()
     
+    def _create_run(self, session, session_id: int, run_at: datetime, article_count: int) -> int:
+        """Insert a monitoring run within an open session and return its ID."""
+        return session.scalar(
+            insert(MonitoringRun).values(
+                session_id=session_id, run_at=run_at, article_count=article_count
+            ).returning(MonitoringRun.id)
+        )
+    
+    def _insert_articles(
+        self,
+        session,
+        session_id: int,
+        run_id: int,
+        articles: List[Article],
+        found_at: datetime
+    ) -> List[Tuple[int, int, str]]:
+        """
+        Bulk insert a run's articles within an open session.
+        
+        Rows go out as multi-row INSERT ... RETURNING statements instead of
+        one ORM object (and one statement) per article.
+        
+        Returns:
+            (article ID, session ID, text) of the articles to add to the vector index
+        """
+        if not articles:
+            return []
+        
+        rows = [
+            dict(article.to_columns(), session_id=session_id, run_id=run_id, found_at=found_at)
+            for article in articles
+        ]
+        article_ids = session.scalars(
+            insert(NewsArticle).returning(NewsArticle.id, sort_by_parameter_order=True), rows
+        ).all()
+        return [
+            (article_id, session_id, article_text(article.title, article.snippet))
+            for article_id, article in zip(article_ids, articles) if article.has_link
+        ]
+    
+    def _index_articles(self, indexed: List[Tuple[int, int, str]]):
+        """Add stored articles to the vector index, if there is one."""
+        if self.vector_index is None:
+            return
+        try:
+            self.vector_index.add(indexed)
+        except Exception as e:
+            # The next sync_vector_index call catches up
+            logger.error(f"Failed to index stored articles: {e}")
+    
     def store_articles(
         self,
         session_id: int,
-        articles: List[Dict[str, Any]]
-    ):
+        articles: List[Article]
+    ) -> int:
         """
-        Store found articles for a session.
+        Store found articles for a session as a new monitoring run.
         
         Args:
             session_id: Monitoring session ID
-            articles: List of article dictionaries
+            articles: List of articles
+        
+        Returns:
+            ID of the run the articles belong to
         """
+        found_at = datetime.now()
+        
         session = self.Session()
         try:
-            for article in articles:
-                news_article = NewsArticle(
-                    session_id=session_id,
-                    title=article.get('title', ''),
-                    url=article.get('url', ''),
-                    source=article.get('source', ''),
-                    snippet=article.get('snippet', ''),
-                    found_at=datetime.now()
-                )
-                session.add(news_article)
+            run_id = self._create_run(session, session_id, found_at, len(articles))
+            indexed = self._insert_articles(session, session_id, run_id, articles, found_at)
             session.commit()
             logger.info(f"Stored {len(articles)} articles for session {session_id}")
         finally:
             session.close()
+        
+        self._index_articles(indexed)
+        return run_id
+    
+    def store_cycle(
+        self,
+        session_id: int,
+        articles: List[Article],
+        analysis: str,
+        run_at: Optional[datetime] = None
+    ) -> int:
+        """
+        Store the results of one monitoring cycle in a single transaction.
+        
+        The run, its articles and report, and the session's last run time
+        are written together (all or nothing) and share one timestamp,
+        replacing separate store_articles, store_report and
+        update_session_run calls.
+        
+        Args:
+            session_id: Monitoring session ID
+            articles: Articles found in the cycle
+            analysis: Analysis text
+            run_at: Timestamp of the cycle (defaults to now)
+        
+        Returns:
+            ID of the new monitoring run
+        """
+        run_at = run_at or datetime.now()
+        
+        session = self.Session()
+        try:
+            run_id = self._create_run(session, session_id, run_at, len(articles))
+            indexed = self._insert_articles(session, session_id, run_id, articles, run_at)
+            session.execute(insert(MonitoringReport), [{
+                'session_id': session_id,
+                'run_id': run_id,
+                'analysis': analysis,
+                'created_at': run_at,
+                'article_count': len(articles)
+            }])
+            session.execute(
+                update(MonitoringSession).where(MonitoringSession.id == session_id).values(last_run_at=run_at)
+            )
+            session.commit()
+            logger.info(f"Stored cycle for session {session_id} ({len(articles)} articles)")
+        finally:
+            session.close()
+        
+        self._index_articles(indexed)
+        return run_id
     
     def store_report(
         self,
         session_id: int,
         analysis: str,
-        article_count: int
+        article_count: int,
+        run_id: Optional[int] = None
     ):
         """
         Store a monitoring report.
@@ -206,13 +503,19 @@ class DataManager:
             session_id: Monitoring session ID
             analysis: Analysis text
             article_count: Number of articles found
+            run_id: Run the report belongs to (a new run if not given)
         """
+        created_at = datetime.now()
+        
         session = self.Session()
         try:
+            if run_id is None:
+                run_id = self._create_run(session, session_id, created_at, article_count)
             report = MonitoringReport(
                 session_id=session_id,
+                run_id=run_id,
                 analysis=analysis,
-                created_at=datetime.now(),
+                created_at=created_at,
                 article_count=article_count
             )
             session.add(report)
@@ -224,62 +527,569 @@ class DataManager:
     def get_session_articles(
         self,
         session_id: int,
-        since: Optional[datetime] = None
-    ) -> List[List[Dict[str, Any]]]:
+        since: Optional[datetime] = None,
+        last_runs: Optional[int] = None
+    ) -> List[List[Article]]:
         """
-        Get all articles for a session, grouped by time periods.
+        Get a session's articles grouped by monitoring run.
         
         Args:
             session_id: Monitoring session ID
-            since: Only get articles after this time
+            since: Only get runs at or after this time
+            last_runs: Only get this many of the most recent runs
             
         Returns:
-            List of article lists (one per monitoring run)
+            List of article lists (one per monitoring run, oldest first)
         """
         session = self.Session()
         try:
-            query = session.query(NewsArticle).filter_by(session_id=session_id)
+            runs = session.query(MonitoringRun.id).filter(MonitoringRun.session_id == session_id)
             if since:
-                query = query.filter(NewsArticle.found_at >= since)
+                runs = runs.filter(MonitoringRun.run_at >= since)
+            if last_runs is not None:
+                runs = runs.order_by(MonitoringRun.run_at.desc(), MonitoringRun.id.desc()).limit(last_runs)
             
-            articles = query.order_by(NewsArticle.found_at).all()
+            # Plain column rows avoid building (and tracking) full ORM objects
+            articles = session.query(
+                NewsArticle.run_id,
+                NewsArticle.title,
+                NewsArticle.url,
+                NewsArticle.source,
+                NewsArticle.snippet,
+                NewsArticle.found_at
+            ).filter(
+                NewsArticle.run_id.in_(runs.scalar_subquery())
+            ).order_by(NewsArticle.run_id, NewsArticle.id)
             
-            # Group by hour (approximate monitoring runs)
-            grouped = []
-            current_group = []
-            last_time = None
+            return [
+                [Article.from_row(article) for article in run_articles]
+                for _, run_articles in groupby(articles, key=lambda article: article.run_id)
+            ]
+        finally:
+            session.close()
+    
+    def get_runs(
+        self,
+        session_id: int,
+        limit: int = 20,
+        before_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a page of a session's monitoring runs, newest first.
+        
+        Pages are keyed on the run ID (pass the last ID of a page as
+        ``before_id`` for the next one), so deep pages cost the same as the
+        first.
+        
+        Args:
+            session_id: Monitoring session ID
+            limit: Max number of runs
+            before_id: Only runs with a smaller ID (optional)
+        
+        Returns:
+            List of dicts with id, session_id, run_at and article_count
+        """
+        session = self.Session()
+        try:
+            query = session.query(
+                MonitoringRun.id, MonitoringRun.session_id, MonitoringRun.run_at, MonitoringRun.article_count
+            ).filter(MonitoringRun.session_id == session_id)
+            if before_id is not None:
+                query = query.filter(MonitoringRun.id < before_id)
             
-            for article in articles:
-                if last_time and (article.found_at - last_time).total_seconds() > 1800:  # 30 min gap
-                    if current_group:
-                        grouped.append(current_group)
-                    current_group = []
+            return [dict(row._mapping) for row in query.order_by(MonitoringRun.id.desc()).limit(limit)]
+        finally:
+            session.close()
+    
+    def count_runs(self, session_id: int) -> int:
+        """Get the number of monitoring runs of a session."""
+        session = self.Session()
+        try:
+            return session.query(func.count(MonitoringRun.id)).filter(
+                MonitoringRun.session_id == session_id
+            ).scalar()
+        finally:
+            session.close()
+    
+    def get_run_articles(self, run_id: int) -> List[Article]:
+        """Get the articles of one monitoring run."""
+        session = self.Session()
+        try:
+            articles = session.query(
+                NewsArticle.title,
+                NewsArticle.url,
+                NewsArticle.source,
+                NewsArticle.snippet,
+                NewsArticle.found_at
+            ).filter(NewsArticle.run_id == run_id).order_by(NewsArticle.id)
+            return [Article.from_row(article) for article in articles]
+        finally:
+            session.close()
+    
+    def iter_articles(self, session_ids: List[int], batch_size: int = 500) -> Iterator[Article]:
+        """
+        Stream the articles of sessions, oldest run first within each session.
+        
+        Rows are fetched ``batch_size`` at a time (yield_per) in the order of
+        the (session_id, found_at) index, so memory use does not depend on
+        how many articles the sessions hold. Close the iterator (or read it
+        to the end) to release the database session.
+        
+        Args:
+            session_ids: Monitoring session IDs
+            batch_size: Rows fetched per round trip
+        
+        Yields:
+            Articles
+        """
+        session = self.Session()
+        try:
+            rows = session.query(
+                NewsArticle.title,
+                NewsArticle.url,
+                NewsArticle.source,
+                NewsArticle.snippet,
+                NewsArticle.found_at
+            ).filter(
+                NewsArticle.session_id.in_(session_ids)
+            ).order_by(
+                NewsArticle.session_id, NewsArticle.found_at, NewsArticle.id
+            ).yield_per(batch_size)
+            
+            for row in rows:
+                yield Article.from_row(row)
+        finally:
+            session.close()
+    
+    def get_article_stats(self, session_ids: List[int]) -> Dict[str, int]:
+        """
+        Count the articles of sessions in SQL.
+        
+        Unique articles are those with distinct URLs, plus every article
+        without a link (the same rule as the aggregate report's list).
+        
+        Args:
+            session_ids: Monitoring session IDs
+        
+        Returns:
+            Dict with articles, runs (with articles) and unique_articles
+        """
+        has_link = or_(NewsArticle.url.like('http://%'), NewsArticle.url.like('https://%'))
+        
+        session = self.Session()
+        try:
+            articles, runs, linked, unlinked = session.query(
+                func.count(NewsArticle.id),
+                func.count(distinct(NewsArticle.run_id)),
+                func.count(distinct(case((has_link, NewsArticle.url)))),
+                func.count(case((has_link, None), else_=NewsArticle.id))
+            ).filter(NewsArticle.session_id.in_(session_ids)).one()
+            return {'articles': articles, 'runs': runs, 'unique_articles': linked + unlinked}
+        finally:
+            session.close()
+    
+    def sync_vector_index(self, batch_size: int = 5000) -> int:
+        """
+        Index stored articles the vector index does not have yet.
+        
+        Covers articles stored before the index existed or while indexing
+        failed; run before searching. Only articles past the index's synced
+        watermark are read, so repeated calls are cheap.
+        
+        Args:
+            batch_size: Articles read and embedded per batch
+        
+        Returns:
+            Number of articles indexed
+        """
+        if self.vector_index is None:
+            return 0
+        
+        last_id = self.vector_index.synced_through
+        # Articles store_articles already indexed past the watermark
+        already_indexed = set(self.vector_index.ids_after(last_id).tolist())
+        indexed = 0
+        session = self.Session()
+        try:
+            while True:
+                rows = session.query(
+                    NewsArticle.id,
+                    NewsArticle.session_id,
+                    NewsArticle.title,
+                    NewsArticle.snippet
+                ).filter(
+                    NewsArticle.id > last_id,
+                    NewsArticle.url.like('http%')
+                ).order_by(NewsArticle.id).limit(batch_size).all()
+                if not rows:
+                    break
                 
-                current_group.append({
-                    'title': article.title,
-                    'url': article.url,
-                    'source': article.source,
-                    'snippet': article.snippet,
-                    'found_at': article.found_at
-                })
-                last_time = article.found_at
+                missing = [
+                    (row.id, row.session_id, article_text(row.title or '', row.snippet or ''))
+                    for row in rows if row.id not in already_indexed
+                ]
+                self.vector_index.add(missing)
+                indexed += len(missing)
+                last_id = rows[-1].id
+                self.vector_index.synced_through = last_id
+        finally:
+            session.close()
+        
+        if indexed:
+            logger.info(f"Indexed {indexed} stored articles")
+        return indexed
+    
+    def search_history(
+        self,
+        query: str,
+        limit: int = 10,
+        session_id: Optional[int] = None,
+        min_score: float = 0.1
+    ) -> List[Dict[str, Any]]:
+        """
+        Find stored articles similar to a query with the vector index.
+        
+        Args:
+            query: Free-text query
+            limit: Max number of results
+            session_id: Only search this session's articles (optional)
+            min_score: Min cosine similarity (lower ones are mostly hash collisions)
+        
+        Returns:
+            Dicts with score, session_id and article, by descending score
+            (articles deleted since they were indexed are left out)
+        """
+        if self.vector_index is None:
+            raise ValueError("DataManager has no vector index")
+        
+        # Over-fetch a little to make up for deleted articles
+        matches = self.vector_index.search(query, limit * 2, session_id, min_score)
+        if not matches:
+            return []
+        
+        session = self.Session()
+        try:
+            rows = session.query(
+                NewsArticle.id,
+                NewsArticle.session_id,
+                NewsArticle.title,
+                NewsArticle.url,
+                NewsArticle.source,
+                NewsArticle.snippet,
+                NewsArticle.found_at
+            ).filter(NewsArticle.id.in_([article_id for article_id, _ in matches])).all()
+            by_id = {row.id: row for row in rows}
             
-            if current_group:
-                grouped.append(current_group)
+            results = []
+            for article_id, score in matches:
+                row = by_id.get(article_id)
+                if row is not None:
+                    results.append({
+                        'score': score,
+                        'session_id': row.session_id,
+                        'article': Article.from_row(row)
+                    })
+            return results[:limit]
+        finally:
+            session.close()
+    
+    def search(
+        self,
+        query: str,
+        kind: str = 'articles',
+        session_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        Full-text search over stored articles or reports.
+        
+        Results are ranked by BM25 (article titles weigh twice as much as
+        snippets) and carry an excerpt with the matched words wrapped in
+        MATCH_START/MATCH_END. Queries matching more than RANK_CANDIDATES
+        rows are ranked among the newest RANK_CANDIDATES matches, which keeps
+        common words fast on a history of millions of articles.
+        
+        Args:
+            query: Words to find (all must match; ``word*`` matches a prefix)
+            kind: 'articles' or 'reports'
+            session_id: Only search this session (optional)
+            since: Only rows found/created at or after this time (optional)
+            until: Only rows found/created before this time (optional)
+            limit: Max number of results
+        
+        Returns:
+            Dicts by relevance; articles have id, session_id, title, url,
+            source, found_at and excerpt, reports have id, session_id,
+            created_at, article_count and excerpt
+        """
+        match = fts_query(query)
+        if not match:
+            return []
+        
+        if kind == 'articles':
+            fts, model, timestamp = articles_fts, NewsArticle, NewsArticle.found_at
+            rank = func.bm25(literal_column(fts.name), 2.0, 1.0)
+            fields = (
+                NewsArticle.id, NewsArticle.session_id, NewsArticle.title,
+                NewsArticle.url, NewsArticle.source, NewsArticle.found_at
+            )
+        elif kind == 'reports':
+            fts, model, timestamp = reports_fts, MonitoringReport, MonitoringReport.created_at
+            rank = func.bm25(literal_column(fts.name))
+            fields = (
+                MonitoringReport.id, MonitoringReport.session_id,
+                MonitoringReport.created_at, MonitoringReport.article_count
+            )
+        else:
+            raise ValueError(f"Unknown search kind: {kind}")
+        
+        excerpt = func.snippet(literal_column(fts.name), -1, MATCH_START, MATCH_END, '…', 24)
+        
+        session = self.Session()
+        try:
+            candidates = session.query(fts.c.rowid).join(model, model.id == fts.c.rowid).filter(
+                literal_column(fts.name).op('MATCH')(match)
+            )
+            if session_id is not None:
+                candidates = candidates.filter(model.session_id == session_id)
+            if since is not None:
+                candidates = candidates.filter(timestamp >= since)
+            if until is not None:
+                candidates = candidates.filter(timestamp < until)
+            
+            # FTS5 walks matches newest first without scoring them, so the cutoff is cheap
+            cutoff = candidates.order_by(fts.c.rowid.desc()).offset(RANK_CANDIDATES - 1).limit(1).scalar()
+            if cutoff is not None:
+                candidates = candidates.filter(fts.c.rowid >= cutoff)
+            
+            rows = candidates.with_entities(*fields, excerpt.label('excerpt')).order_by(rank).limit(limit)
+            return [dict(row._mapping) for row in rows]
+        finally:
+            session.close()
+    
+    def get_session_reports(
+        self,
+        session_id: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Get analysis reports for a session in chronological order.
+        
+        Args:
+            session_id: Monitoring session ID
+            since: Only get reports created at or after this time
+            until: Only get reports created before this time
+        
+        Returns:
+            List of analysis texts
+        """
+        session = self.Session()
+        try:
+            query = session.query(MonitoringReport.analysis).filter_by(session_id=session_id)
+            if since:
+                query = query.filter(MonitoringReport.created_at >= since)
+            if until:
+                query = query.filter(MonitoringReport.created_at < until)
             
-            return grouped
+            return [r.analysis for r in query.order_by(MonitoringReport.created_at)]
         finally:
             session.close()
     
-    def get_session_reports(self, session_id: int) -> List[str]:
-        """Get all analysis reports for a session."""
+    def get_report_buckets(self, session_id: int, granularity: str = 'day') -> List[Dict[str, Any]]:
+        """
+        Get a session's reports grouped into time buckets.
+        
+        Args:
+            session_id: Monitoring session ID
+            granularity: Bucket size ('day' or 'week')
+        
+        Returns:
+            Chronological list of dicts with bucket_start, bucket_end,
+            report_count and last_report_id
+        """
+        bucket = func.date(MonitoringReport.created_at, *BUCKET_MODIFIERS[granularity])
+        
         session = self.Session()
         try:
-            reports = session.query(MonitoringReport).filter_by(
-                session_id=session_id
-            ).order_by(MonitoringReport.created_at).all()
+            rows = session.query(
+                bucket.label('bucket'),
+                func.count(MonitoringReport.id),
+                func.max(MonitoringReport.id)
+            ).filter(
+                MonitoringReport.session_id == session_id
+            ).group_by('bucket').order_by('bucket').all()
             
-            return [r.analysis for r in reports]
+            buckets = []
+            for bucket_date, report_count, last_report_id in rows:
+                bucket_start = datetime.strptime(bucket_date, '%Y-%m-%d')
+                buckets.append({
+                    'bucket_start': bucket_start,
+                    'bucket_end': bucket_start + BUCKET_LENGTHS[granularity],
+                    'report_count': report_count,
+                    'last_report_id': last_report_id
+                })
+            return buckets
+        finally:
+            session.close()
+    
+    def get_rollups(self, session_id: int, granularity: str = 'day') -> Dict[datetime, Dict[str, Any]]:
+        """
+        Get stored rollup summaries for a session.
+        
+        Args:
+            session_id: Monitoring session ID
+            granularity: Bucket size ('day' or 'week')
+        
+        Returns:
+            Dict of bucket_start -> rollup dict
+        """
+        session = self.Session()
+        try:
+            rollups = session.query(AggregateRollup).filter_by(
+                session_id=session_id, granularity=granularity
+            ).all()
+            return {
+                r.bucket_start: {
+                    'report_count': r.report_count,
+                    'last_report_id': r.last_report_id,
+                    'summary': r.summary
+                }
+                for r in rollups
+            }
+        finally:
+            session.close()
+    
+    def store_rollup(
+        self,
+        session_id: int,
+        granularity: str,
+        bucket_start: datetime,
+        report_count: int,
+        last_report_id: int,
+        summary: str
+    ):
+        """
+        Create or replace the rollup summary of one bucket.
+        
+        Args:
+            session_id: Monitoring session ID
+            granularity: Bucket size ('day' or 'week')
+            bucket_start: Start of the bucket
+            report_count: Number of reports summarized
+            last_report_id: Newest report included (detects new reports)
+            summary: Summary text
+        """
+        session = self.Session()
+        try:
+            rollup = session.query(AggregateRollup).filter_by(
+                session_id=session_id, granularity=granularity, bucket_start=bucket_start
+            ).first()
+            if rollup is None:
+                rollup = AggregateRollup(
+                    session_id=session_id, granularity=granularity, bucket_start=bucket_start
+                )
+                session.add(rollup)
+            
+            rollup.report_count = report_count
+            rollup.last_report_id = last_report_id
+            rollup.summary = summary
+            rollup.updated_at = datetime.now()
+            session.commit()
+        finally:
+            session.close()
+    
+    def get_similar_signatures(self, session_id: int, band_keys: Iterable[int]) -> List[bytes]:
+        """
+        Get stored article signatures sharing at least one LSH band key.
+        
+        Args:
+            session_id: Monitoring session ID
+            band_keys: Band keys of the signatures being looked up
+        
+        Returns:
+            Raw signatures of the candidate articles
+        """
+        band_keys = list(band_keys)
+        if not band_keys:
+            return []
+        
+        session = self.Session()
+        try:
+            candidates = session.query(ArticleSignatureBand.signature_id).filter(
+                ArticleSignatureBand.session_id == session_id,
+                ArticleSignatureBand.band_key.in_(band_keys)
+            )
+            rows = session.query(ArticleSignature.signature).filter(
+                ArticleSignature.id.in_(candidates.scalar_subquery())
+            ).all()
+            return [signature for signature, in rows]
+        finally:
+            session.close()
+    
+    def store_signatures(self, session_id: int, entries: List[Tuple[bytes, List[int]]]):
+        """
+        Store article signatures and their band keys for a session.
+        
+        Args:
+            session_id: Monitoring session ID
+            entries: (raw signature, band keys) per article
+        """
+        now = datetime.now()
+        session = self.Session()
+        try:
+            for signature, keys in entries:
+                record = ArticleSignature(session_id=session_id, signature=signature, created_at=now)
+                session.add(record)
+                session.flush()
+                session.add_all(
+                    ArticleSignatureBand(signature_id=record.id, band_key=key, session_id=session_id)
+                    for key in set(keys)
+                )
+            session.commit()
+            logger.debug(f"Stored {len(entries)} article signatures for session {session_id}")
+        finally:
+            session.close()
+    
+    def get_seen_url_hashes(self, session_id: int) -> Set[int]:
+        """
+        Get the canonical URL hashes already seen in a session.
+        
+        Args:
+            session_id: Monitoring session ID
+        
+        Returns:
+            Set of signed 64-bit URL hashes
+        """
+        session = self.Session()
+        try:
+            rows = session.query(SeenUrl.url_hash).filter_by(session_id=session_id)
+            return {url_hash for url_hash, in rows}
+        finally:
+            session.close()
+    
+    def store_seen_urls(self, session_id: int, url_hashes: Iterable[int]):
+        """
+        Record canonical URL hashes as seen in a session (existing ones are kept).
+        
+        Args:
+            session_id: Monitoring session ID
+            url_hashes: Signed 64-bit URL hashes
+        """
+        now = datetime.now()
+        rows = [
+            {'session_id': session_id, 'url_hash': url_hash, 'first_seen': now}
+            for url_hash in set(url_hashes)
+        ]
+        if not rows:
+            return
+        
+        session = self.Session()
+        try:
+            session.execute(sqlite_insert(SeenUrl).on_conflict_do_nothing(), rows)
+            session.commit()
         finally:
             session.close()
     
@@ -304,7 +1114,60 @@ class DataManager:
                 MonitoringReport.created_at < cutoff_date
             ).delete()
             
+            # Delete old runs
+            session.query(MonitoringRun).filter(
+                MonitoringRun.run_at < cutoff_date
+            ).delete()
+            
+            # Delete old signatures (stories that old may be reported again)
+            old_signatures = session.query(ArticleSignature.id).filter(
+                ArticleSignature.created_at < cutoff_date
+            )
+            session.query(ArticleSignatureBand).filter(
+                ArticleSignatureBand.signature_id.in_(old_signatures.scalar_subquery())
+            ).delete(synchronize_session=False)
+            session.query(ArticleSignature).filter(
+                ArticleSignature.created_at < cutoff_date
+            ).delete(synchronize_session=False)
+            
+            # Forget old URLs (matches the near-duplicate signatures above)
+            session.query(SeenUrl).filter(
+                SeenUrl.first_seen < cutoff_date
+            ).delete(synchronize_session=False)
+            
+            # Delete rollups whose reports are gone (current bucket is rebuilt)
+            session.query(AggregateRollup).filter(
+                AggregateRollup.bucket_start < cutoff_date
+            ).delete()
+            
             session.commit()
             logger.info(f"Cleaned up data older than {days} days")
         finally:
             session.close()
+        
+        self.prune_vector_index()
+    
+    def prune_vector_index(self) -> int:
+        """
+        Remove vector index rows of deleted articles.
+        
+        Returns:
+            Number of rows removed
+        """
+        if self.vector_index is None:
+            return 0
+        
+        def live_ids() -> np.ndarray:
+            session = self.Session()
+            try:
+                rows = session.query(NewsArticle.id).yield_per(50_000)
+                return np.fromiter((article_id for article_id, in rows), dtype=np.int64)
+            finally:
+                session.close()
+        
+        try:
+            return self.vector_index.retain(live_ids)
+        except Exception as e:
+            # Deleted articles are skipped at search time until the next cleanup
+            logger.error(f"Failed to prune the vector index: {e}")
+            return 0
@@ -0,0 +1,200 @@
+"""Versioned schema migrations for the monitoring database."""
+
+import logging
+import sqlite3
+from typing import Callable, List
+
+logger = logging.getLogger(__name__)
+
+# FTS5 indexes over article and report text, kept in sync by triggers.
+# External content tables: the text is stored once, in the base table.
+FTS_INDEXES = {
+    'news_articles_fts': ('news_articles', ('title', 'snippet')),
+    'monitoring_reports_fts': ('monitoring_reports', ('analysis',)),
+}
+FTS_TOKENIZER = 'porter unicode61 remove_diacritics 2'
+
+
+def _table_names(db: sqlite3.Connection) -> set:
+    """Names of the tables in the database."""
+    return {name for name, in db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+
+def create_full_text_search(db: sqlite3.Connection):
+    """Create the FTS5 tables and sync triggers, indexing existing rows once."""
+    existing = _table_names(db)
+    for fts_name, (base, columns) in FTS_INDEXES.items():
+        names = ', '.join(columns)
+        new_values = ', '.join(f'new.{c}' for c in columns)
+        old_values = ', '.join(f'old.{c}' for c in columns)
+        delete_old = (
+            f"INSERT INTO {fts_name}({fts_name}, rowid, {names}) "
+            f"VALUES ('delete', old.id, {old_values});"
+        )
+        insert_new = f"INSERT INTO {fts_name}(rowid, {names}) VALUES (new.id, {new_values});"
+        
+        db.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_name} USING fts5("
+            f"{names}, content='{base}', content_rowid='id', tokenize='{FTS_TOKENIZER}')"
+        )
+        db.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts_name}_insert AFTER INSERT ON {base} "
+            f"BEGIN {insert_new} END"
+        )
+        db.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts_name}_delete AFTER DELETE ON {base} "
+            f"BEGIN {delete_old} END"
+        )
+        db.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts_name}_update AFTER UPDATE ON {base} "
+            f"BEGIN {delete_old} {insert_new} END"
+        )
+        
+        if fts_name not in existing:
+            # Rows stored before the index existed
+            db.execute(f"INSERT INTO {fts_name}({fts_name}) VALUES ('rebuild')")
+
+
+def create_lookup_indexes(db: sqlite3.Connection):
+    """Index the session and time columns the DataManager queries filter on."""
+    for statement in (
+        # get_session_articles / get_session_reports: session, then time order or range
+        "CREATE INDEX IF NOT EXISTS ix_news_articles_session_found ON news_articles (session_id, found_at)",
+        "CREATE INDEX IF NOT EXISTS ix_monitoring_reports_session_created "
+        "ON monitoring_reports (session_id, created_at)",
+        # cleanup_old_data and time-only search filters
+        "CREATE INDEX IF NOT EXISTS ix_news_articles_found_at ON news_articles (found_at)",
+        "CREATE INDEX IF NOT EXISTS ix_monitoring_reports_created_at ON monitoring_reports (created_at)",
+        "CREATE INDEX IF NOT EXISTS ix_article_signatures_created_at ON article_signatures (created_at)",
+        "CREATE INDEX IF NOT EXISTS ix_seen_urls_first_seen ON seen_urls (first_seen)",
+        "CREATE INDEX IF NOT EXISTS ix_aggregate_rollups_bucket_start ON aggregate_rollups (bucket_start)",
+        # get_active_sessions
+        "CREATE INDEX IF NOT EXISTS ix_monitoring_sessions_active ON monitoring_sessions (is_active)",
+    ):
+        db.execute(statement)
+    # Give the query planner row counts for the new indexes
+    db.execute("ANALYZE")
+
+
+def _column_names(db: sqlite3.Connection, table: str) -> set:
+    """Names of a table's columns."""
+    return {row[1] for row in db.execute(f"PRAGMA table_info({table})")}
+
+
+def create_monitoring_runs(db: sqlite3.Connection):
+    """Add monitoring runs and assign existing articles and reports to them."""
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS monitoring_runs ("
+        "id INTEGER NOT NULL PRIMARY KEY, session_id INTEGER NOT NULL, "
+        "run_at DATETIME NOT NULL, article_count INTEGER)"
+    )
+    for table in ('news_articles', 'monitoring_reports'):
+        if 'run_id' not in _column_names(db, table):
+            db.execute(f"ALTER TABLE {table} ADD COLUMN run_id INTEGER")
+    for statement in (
+        "CREATE INDEX IF NOT EXISTS ix_monitoring_runs_session_run_at ON monitoring_runs (session_id, run_at)",
+        "CREATE INDEX IF NOT EXISTS ix_monitoring_runs_run_at ON monitoring_runs (run_at)",
+        "CREATE INDEX IF NOT EXISTS ix_news_articles_run ON news_articles (run_id)",
+        "CREATE INDEX IF NOT EXISTS ix_monitoring_reports_run ON monitoring_reports (run_id)",
+    ):
+        db.execute(statement)
+    
+    # Re-index text only when it changes (the backfill below only sets run_id)
+    for fts_name, (base, columns) in FTS_INDEXES.items():
+        names = ', '.join(columns)
+        db.execute(f"DROP TRIGGER IF EXISTS {fts_name}_update")
+        db.execute(
+            f"CREATE TRIGGER {fts_name}_update AFTER UPDATE OF {names} ON {base} BEGIN "
+            f"INSERT INTO {fts_name}({fts_name}, rowid, {names}) "
+            f"VALUES ('delete', old.id, {', '.join(f'old.{c}' for c in columns)}); "
+            f"INSERT INTO {fts_name}(rowid, {names}) VALUES (new.id, {', '.join(f'new.{c}' for c in columns)}); "
+            f"END"
+        )
+    
+    # Each stored report ended one cycle: it becomes a run, and the articles
+    # stored before it (after the session's previous report) belong to it
+    offset = db.execute("SELECT COALESCE(MAX(id), 0) FROM monitoring_runs").fetchone()[0]
+    db.execute(
+        "INSERT INTO monitoring_runs (id, session_id, run_at, article_count) "
+        "SELECT id + ?, session_id, created_at, article_count FROM monitoring_reports WHERE run_id IS NULL",
+        (offset,)
+    )
+    db.execute("UPDATE monitoring_reports SET run_id = id + ? WHERE run_id IS NULL", (offset,))
+    db.execute(
+        "UPDATE news_articles SET run_id = ("
+        "SELECT r.run_id FROM monitoring_reports r "
+        "WHERE r.session_id = news_articles.session_id AND r.created_at >= news_articles.found_at "
+        "ORDER BY r.created_at LIMIT 1"
+        ") WHERE run_id IS NULL"
+    )
+    
+    # Articles of a cycle that never stored its report: one run per session
+    db.execute(
+        "INSERT INTO monitoring_runs (session_id, run_at, article_count) "
+        "SELECT session_id, MIN(found_at), COUNT(*) FROM news_articles WHERE run_id IS NULL GROUP BY session_id"
+    )
+    db.execute(
+        "UPDATE news_articles SET run_id = ("
+        "SELECT MAX(id) FROM monitoring_runs WHERE monitoring_runs.session_id = news_articles.session_id"
+        ") WHERE run_id IS NULL"
+    )
+
+
+# Applied in order; a database at version N has had the first N applied.
+# Migrations run after create_all (which creates missing tables at their
+# current shape), so each one must also be a no-op on such tables.
+MIGRATIONS: List[Callable[[sqlite3.Connection], None]] = [
+    create_full_text_search,
+    create_lookup_indexes,
+    create_monitoring_runs,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def upgrade(db: sqlite3.Connection) -> int:
+    """
+    Bring a database up to SCHEMA_VERSION.
+    
+    The version is kept in SQLite's ``user_version`` header field. Each
+    migration runs in its own exclusive transaction together with the version
+    bump, so an interrupted upgrade resumes where it stopped and concurrent
+    processes apply each migration once.
+    
+    Args:
+        db: sqlite3 connection (its transaction handling is restored afterwards)
+    
+    Returns:
+        Number of migrations applied
+    
+    Raises:
+        RuntimeError: If the database was written by a newer schema version
+    """
+    isolation_level = db.isolation_level
+    db.isolation_level = None  # explicit BEGIN/COMMIT, so DDL is transactional too
+    applied = 0
+    try:
+        while True:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                version = db.execute("PRAGMA user_version").fetchone()[0]
+                if version > SCHEMA_VERSION:
+                    raise RuntimeError(
+                        f"Database schema version {version} is newer than supported ({SCHEMA_VERSION})"
+                    )
+                if version == SCHEMA_VERSION:
+                    db.execute("ROLLBACK")
+                    return applied
+                
+                migration = MIGRATIONS[version]
+                logger.info(f"Migrating database to version {version + 1}: {migration.__doc__}")
+                migration(db)
+                db.execute(f"PRAGMA user_version = {version + 1}")
+                db.execute("COMMIT")
+                applied += 1
+            except BaseException:
+                if db.in_transaction:
+                    db.execute("ROLLBACK")
+                raise
+    finally:
+        db.isolation_level = isolation_level
@@ -1,9 +1,10 @@
 """Scheduled monitoring with APScheduler."""
 
 import logging
-from typing import Callable, Optional
-from datetime import datetime
+from typing import Callable, Optional, List, Dict, Any, Tuple
+from datetime import datetime, timedelta
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.triggers.interval import IntervalTrigger
 import pytz
 
@@ -13,18 +14,30 @@ logger = logging.getLogger(__name__)
 class NewsScheduler:
     """Manages scheduled news monitoring tasks."""
     
-    def __init__(self, timezone: str = "America/New_York"):
+    def __init__(self, timezone: str = "America/New_York", max_workers: int = 10):
         """
         Initialize the scheduler.
         
         Args:
             timezone: Timezone for scheduling
+            max_workers: Maximum number of monitoring cycles running at once
         """
         self.timezone = pytz.timezone(timezone)
-        self.scheduler = BackgroundScheduler(timezone=self.timezone)
+        self.scheduler = BackgroundScheduler(
+            timezone=self.timezone,
+            executors={'default': ThreadPoolExecutor(max_workers)},
+            job_defaults={
+                'coalesce': True,  # Collapse missed runs into a single run
+                'max_instances': 1,  # Never overlap cycles of the same session
+                'misfire_grace_time': 3600
+            }
+        )
         self.jobs = {}
         
-        logger.info(f"NewsScheduler initialized with timezone: {timezone}")
+        logger.info(
+            f"NewsScheduler initialized with timezone: {timezone}, "
+            f"max workers: {max_workers}"
+        )
     
     def start(self):
         """Start the scheduler."""
@@ -43,6 +56,7 @@ class NewsScheduler:
         session_id: int,
         interval_hours: int,
         callback: Callable,
+        start_at: Optional[datetime] = None,
         **callback_kwargs
     ) -> str:
         """
@@ -52,6 +66,7 @@ class NewsScheduler:
             session_id: Monitoring session ID
             interval_hours: Run every N hours
             callback: Function to call on each run
+            start_at: Time of the first run (defaults to now)
             **callback_kwargs: Arguments to pass to callback
             
         Returns:
@@ -72,7 +87,7 @@ class NewsScheduler:
             trigger=IntervalTrigger(hours=interval_hours),
             id=job_id,
             kwargs=callback_kwargs,
-            next_run_time=datetime.now(self.timezone)  # Run immediately
+            next_run_time=start_at or datetime.now(self.timezone)  # Run immediately
         )
         
         self.jobs[job_id] = job
@@ -80,6 +95,72 @@ class NewsScheduler:
         
         return job_id
     
+    def sync_sessions(
+        self,
+        sessions: List[Dict[str, Any]],
+        callback: Callable,
+        **callback_kwargs
+    ) -> Tuple[int, int]:
+        """
+        Reconcile scheduled jobs with the given active sessions.
+        
+        Sessions without a job are scheduled (resuming from their last run),
+        sessions whose interval changed are rescheduled and jobs whose session
+        is no longer active are removed.
+        
+        Args:
+            sessions: Active session dicts as returned by DataManager
+            callback: Function to call on each run
+            **callback_kwargs: Shared arguments to pass to callback
+        
+        Returns:
+            Tuple of (number of jobs added, number of jobs removed)
+        """
+        added = 0
+        active_job_ids = set()
+        now = datetime.now(self.timezone)
+        
+        for session in sessions:
+            job_id = f"monitoring_{session['id']}"
+            active_job_ids.add(job_id)
+            interval = timedelta(hours=session['interval_hours'])
+            
+            job = self.jobs.get(job_id)
+            if job and job.trigger.interval == interval:
+                continue
+            
+            # Resume where the session left off instead of running everything at once
+            start_at = now
+            if session.get('last_run_at'):
+                next_run = session['last_run_at'].astimezone(self.timezone) + interval
+                start_at = max(next_run, now)
+            
+            self.schedule_monitoring(
+                session_id=session['id'],
+                interval_hours=session['interval_hours'],
+                callback=callback,
+                start_at=start_at,
+                prompt=session['prompt'],
+                email_to=session['email_to'],
+                **callback_kwargs
+            )
+            added += 1
+        
+        stale_job_ids = [
+            job_id for job_id in self.jobs
+            if job_id.startswith('monitoring_') and job_id not in active_job_ids
+        ]
+        for job_id in stale_job_ids:
+            self.remove_job(job_id)
+        
+        if added or stale_job_ids:
+            logger.info(
+                f"Synchronized sessions: {added} scheduled, {len(stale_job_ids)} removed, "
+                f"{len(self.jobs)} active"
+            )
+        
+        return added, len(stale_job_ids)
+    
     def remove_job(self, job_id: str):
         """
         Remove a scheduled job.
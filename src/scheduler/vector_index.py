@@ -0,0 +1,308 @@
+"""Local vector index over stored article history (hashing-trick embeddings)."""
+
+import logging
+import math
+import os
+import re
+import threading
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are only serialized within the process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# Words that carry no topic (kept short: rare words are what the hashing buckets separate)
+STOPWORDS = frozenset((
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in',
+    'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'were', 'will', 'with'
+))
+
+
+def embed(text: str, dimensions: int) -> np.ndarray:
+    """
+    Embed a text with the hashing trick.
+    
+    Words and consecutive word pairs are hashed (CRC32, stable across runs)
+    into ``dimensions`` signed buckets weighted by 1 + log(count); the vector
+    is L2-normalized so a dot product is the cosine similarity. No
+    vocabulary or model is needed and nothing leaves the machine.
+    
+    Args:
+        text: Text to embed
+        dimensions: Vector length (a power of two)
+    
+    Returns:
+        float32 vector (all zeros for a text without words)
+    """
+    words = [w for w in _TOKEN_RE.findall(text.lower()) if w not in STOPWORDS]
+    features = Counter(words)
+    features.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    
+    vector = np.zeros(dimensions, dtype=np.float32)
+    for feature, count in features.items():
+        digest = zlib.crc32(feature.encode('utf-8'))
+        # Low bits pick the bucket, the top bit the sign (collisions cancel out on average)
+        sign = -1.0 if digest & 0x80000000 else 1.0
+        vector[digest & (dimensions - 1)] += sign * (1 + math.log(count))
+    
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def article_text(title: str, snippet: str) -> str:
+    """Text an article is embedded from (the title counts twice)."""
+    return f"{title}\n{title}\n{snippet}"
+
+
+class ArticleVectorIndex:
+    """
+    Append-only, memory-mapped vector index of stored articles.
+    
+    Embeddings are appended as contiguous float32 rows to one file
+    (``article_vectors_<dimensions>.f32``) and the matching article and
+    session IDs to a second one (``.ids``) as articles are stored. Queries
+    memory-map both files and score all rows with a single BLAS
+    matrix-vector product, without reading the files into memory first.
+    
+    The CLI and the daemon share the files, so writers hold an exclusive
+    lock on a ``.lock`` file (readers a shared one while mapping): row N of
+    both files always belongs to the same article.
+    """
+    
+    def __init__(self, directory: Path, dimensions: int = 256):
+        """
+        Initialize the index.
+        
+        Args:
+            directory: Directory of the index files (created if missing)
+            dimensions: Embedding length, a power of two (each value has its own files)
+        """
+        if dimensions <= 0 or dimensions & (dimensions - 1):
+            raise ValueError(f"dimensions must be a power of two, got {dimensions}")
+        
+        self.dimensions = dimensions
+        base = Path(directory) / f"article_vectors_{dimensions}"
+        self.vectors_path = base.with_suffix('.f32')
+        self.ids_path = base.with_suffix('.ids')
+        self._synced_path = base.with_suffix('.synced')
+        self._lock_path = base.with_suffix('.lock')
+        base.parent.mkdir(parents=True, exist_ok=True)
+        
+        self.vector_dtype = np.dtype(('<f4', (dimensions,)))
+        self.id_dtype = np.dtype([('article_id', '<i8'), ('session_id', '<i4')])
+        self._lock = threading.Lock()
+        with self._locked():
+            self._repair()
+    
+    @contextmanager
+    def _locked(self, shared: bool = False):
+        """Hold the index lock: exclusive for writers, shared for readers."""
+        if fcntl is None:
+            if shared:
+                yield
+            else:
+                with self._lock:
+                    yield
+            return
+        
+        with open(self._lock_path, 'a+b') as lock_file:
+            if shared:
+                fcntl.flock(lock_file, fcntl.LOCK_SH)
+                yield
+            else:
+                # Threads queue on the thread lock, processes on the file lock
+                with self._lock:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    yield
+            # Closing the file releases the lock
+    
+    def _repair(self):
+        """Cut rows left incomplete by an interrupted append (call with the lock held)."""
+        count = len(self)
+        for path, dtype in ((self.vectors_path, self.vector_dtype), (self.ids_path, self.id_dtype)):
+            if path.exists() and path.stat().st_size != count * dtype.itemsize:
+                logger.warning(f"Truncating incomplete rows at the end of {path}")
+                with open(path, 'r+b') as f:
+                    f.truncate(count * dtype.itemsize)
+    
+    def __len__(self) -> int:
+        """Number of complete indexed rows."""
+        counts = [
+            path.stat().st_size // dtype.itemsize if path.exists() else 0
+            for path, dtype in ((self.vectors_path, self.vector_dtype), (self.ids_path, self.id_dtype))
+        ]
+        return min(counts)
+    
+    def _rows(self) -> Optional[Tuple[np.memmap, np.memmap]]:
+        """Memory-map the vectors and IDs written so far (None if there are none)."""
+        # A mapping keeps its file, so the lock is only needed while opening
+        with self._locked(shared=True):
+            return self._map_rows()
+    
+    def _map_rows(self) -> Optional[Tuple[np.memmap, np.memmap]]:
+        """Memory-map both files (call with the lock held)."""
+        count = len(self)
+        if count == 0:
+            return None
+        vectors = np.memmap(self.vectors_path, dtype='<f4', mode='r', shape=(count, self.dimensions))
+        ids = np.memmap(self.ids_path, dtype=self.id_dtype, mode='r', shape=(count,))
+        return vectors, ids
+    
+    def add(self, rows: Sequence[Tuple[int, int, str]]):
+        """
+        Append articles to the index.
+        
+        Args:
+            rows: (article ID, session ID, text) per article
+        """
+        if not rows:
+            return
+        
+        vectors = np.stack([embed(text, self.dimensions) for _, _, text in rows])
+        ids = np.array([(article_id, session_id) for article_id, session_id, _ in rows], dtype=self.id_dtype)
+        
+        with self._locked():
+            # A writer killed between the two appends leaves a partial row
+            self._repair()
+            with open(self.vectors_path, 'ab') as f:
+                f.write(vectors.tobytes())
+            with open(self.ids_path, 'ab') as f:
+                f.write(ids.tobytes())
+    
+    @property
+    def synced_through(self) -> int:
+        """Article ID up to which every stored article is known to be indexed."""
+        try:
+            return int(self._synced_path.read_text())
+        except (OSError, ValueError):
+            return 0
+    
+    @synced_through.setter
+    def synced_through(self, article_id: int):
+        self._synced_path.write_text(str(article_id))
+    
+    def ids_after(self, article_id: int) -> np.ndarray:
+        """
+        Get the indexed article IDs greater than ``article_id``.
+        
+        Args:
+            article_id: Lower bound (exclusive)
+        
+        Returns:
+            Array of article IDs
+        """
+        rows = self._rows()
+        if rows is None:
+            return np.empty(0, dtype=np.int64)
+        article_ids = rows[1]['article_id']
+        return np.asarray(article_ids[article_ids > article_id])
+    
+    def clear(self):
+        """Delete all rows."""
+        with self._locked():
+            for path in (self.vectors_path, self.ids_path, self._synced_path):
+                path.unlink(missing_ok=True)
+    
+    def retain(self, live_ids: Callable[[], np.ndarray], batch_size: int = 100_000) -> int:
+        """
+        Drop the rows of articles that no longer exist (e.g. deleted by cleanup).
+        
+        ``live_ids`` is called with the index locked, so an article stored
+        meanwhile is either in its result or appended after the rewrite.
+        Kept rows are copied to temporary files that replace the index files;
+        searches that already mapped the old files finish on them.
+        
+        Args:
+            live_ids: Returns the IDs of the articles that still exist
+            batch_size: Rows copied per batch
+        
+        Returns:
+            Number of rows removed
+        """
+        with self._locked():
+            rows = self._map_rows()
+            if rows is None:
+                return 0
+            vectors, ids = rows
+            
+            keep = np.isin(ids['article_id'], live_ids())
+            removed = int(len(keep) - np.count_nonzero(keep))
+            if removed == 0:
+                return 0
+            
+            targets = [
+                (self.vectors_path, vectors, self.vectors_path.with_suffix('.f32.tmp')),
+                (self.ids_path, ids, self.ids_path.with_suffix('.ids.tmp')),
+            ]
+            for path, source, tmp_path in targets:
+                with open(tmp_path, 'wb') as f:
+                    for start in range(0, len(keep), batch_size):
+                        end = start + batch_size
+                        f.write(np.ascontiguousarray(source[start:end][keep[start:end]]).tobytes())
+                    f.flush()
+                    os.fsync(f.fileno())
+            for path, _, tmp_path in targets:
+                os.replace(tmp_path, path)
+        
+        logger.info(f"Removed {removed} rows of deleted articles from the vector index")
+        return removed
+    
+    def search(
+        self,
+        query: str,
+        k: int = 10,
+        session_id: Optional[int] = None,
+        min_score: float = 0.0
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the articles most similar to a query.
+        
+        Args:
+            query: Query text
+            k: Max number of results
+            session_id: Only search this session's articles (optional)
+            min_score: Leave out articles at or below this similarity
+        
+        Returns:
+            (article ID, cosine similarity) pairs by descending similarity
+        """
+        rows = self._rows()
+        query_vector = embed(query, self.dimensions)
+        if rows is None or k <= 0 or not query_vector.any():
+            return []
+        vectors, ids = rows
+        
+        if session_id is None:
+            positions = None
+            scores = vectors @ query_vector
+        else:
+            # Only the session's rows are read from the vector file
+            positions = np.flatnonzero(ids['session_id'] == session_id)
+            scores = vectors[positions] @ query_vector
+        
+        # Rows appended twice (e.g. by two processes catching up) count once
+        candidates = min(len(scores), 2 * k)
+        top = np.argpartition(scores, -candidates)[-candidates:]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        article_ids = ids['article_id'][top if positions is None else positions[top]]
+        
+        results = []
+        seen = set()
+        for article_id, score in zip(article_ids.tolist(), scores[top].tolist()):
+            if score <= min_score or len(results) == k:
+                break
+            if article_id not in seen:
+                seen.add(article_id)
+                results.append((article_id, score))
+        return results
@@ -0,0 +1,12 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from src.scheduler.data_manager import DataManager
+
+
+@pytest.fixture
+def data_manager(tmp_path):
+    data_manager = DataManager(tmp_path / "news.db")
+    yield data_manager
+    data_manager.close()
@@ -0,0 +1,58 @@
+"""Tests for the shared component container."""
+
+import pytest
+import yaml
+
+from src.components import Components
+from src.config.config_manager import ConfigManager
+
+
+@pytest.fixture
+def config(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump({
+        'app': {'database_path': str(tmp_path / "news.db")},
+        'cache': {'path': str(tmp_path / "llm_cache.db")},
+        'fetcher': {'cache_dir': str(tmp_path / "http_cache")},
+        'history_index': {'dir': str(tmp_path / "vector_index")},
+        'email': {'smtp_server': 'localhost', 'from_address': 'me@example.com'},
+    }))
+    return ConfigManager(str(path))
+
+
+def test_close_releases_and_resets_every_component(config):
+    components = Components(config)
+    pooled = {
+        'data_manager': components.data_manager,
+        'llm_cache': components.llm_cache,
+        'fetcher': components.fetcher,
+        'seen_urls': components.seen_urls,
+        'summarizer': components.summarizer,
+        'email_reporter': components.email_reporter,
+    }
+    closed = []
+    for name in ('llm_cache', 'fetcher', 'email_reporter', 'data_manager'):
+        component = pooled[name]
+        close = component.close
+        component.close = lambda name=name, close=close: (closed.append(name), close())
+    components.http_client
+    
+    components.close()
+    
+    assert sorted(closed) == ['data_manager', 'email_reporter', 'fetcher', 'llm_cache']
+    assert [name for name in vars(components) if name.startswith('_') and name != '_lock'
+            and getattr(components, name) is not None] == []
+    
+    # Components are rebuilt on next use
+    assert components.data_manager is not pooled['data_manager']
+    assert components.data_manager.get_active_sessions() == []
+    components.close()
+
+
+def test_database_pool_follows_worker_count(config):
+    components = Components(config, max_workers=12)
+    try:
+        assert components.data_manager.engine.pool.size() == 12
+        assert components.data_manager.vector_index is not None
+    finally:
+        components.close()
@@ -0,0 +1,28 @@
+"""Tests for boolean configuration values."""
+
+import yaml
+
+from src.config.config_manager import ConfigManager
+
+
+def test_booleans_from_yaml_and_environment(tmp_path, monkeypatch):
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump({
+        'cache': {'enabled': False},
+        'dedup': {'enabled': 'no'},
+        'enrichment': {'enabled': True, 'top_k': 5},
+    }))
+    monkeypatch.setenv("HISTORY_INDEX_ENABLED", "False")
+    monkeypatch.setenv("EMAIL_USE_TLS", "YES")
+    monkeypatch.delenv("DEDUP_SKIP_SEEN_URLS", raising=False)
+    config = ConfigManager(str(path))
+    
+    assert config.cache_enabled is False
+    assert config.dedup_enabled is False
+    assert config.dedup_skip_seen_urls is True
+    assert config.history_index_enabled is False
+    assert config.email_use_tls is True
+    assert config.enrichment_top_k == 5
+    
+    monkeypatch.setenv("ENRICHMENT_ENABLED", "0")
+    assert config.enrichment_top_k == 0
@@ -0,0 +1,170 @@
+"""Tests for DataManager storage: migrations, full-text search and cycle storage."""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.article import Article
+from src.scheduler import migrations
+from src.scheduler.data_manager import MATCH_END, MATCH_START, DataManager
+
+
+def make_articles(prefix: str, count: int, link: bool = True):
+    return [
+        Article(
+            title=f"{prefix} story {i}",
+            url=f"https://news.example.com/{prefix}/{i}" if link else 'N/A',
+            source="Example News",
+            snippet=f"Details on {prefix} number {i}"
+        )
+        for i in range(count)
+    ]
+
+
+def test_migrations_assign_legacy_articles_to_runs(tmp_path):
+    path = tmp_path / "news.db"
+    DataManager(path).close()
+    
+    # Rows stored before runs, FTS and the lookup indexes existed
+    db = sqlite3.connect(path)
+    for fts_name in migrations.FTS_INDEXES:
+        for trigger in ('insert', 'delete', 'update'):
+            db.execute(f"DROP TRIGGER {fts_name}_{trigger}")
+        db.execute(f"DROP TABLE {fts_name}")
+    db.execute("DROP TABLE monitoring_runs")
+    db.execute("PRAGMA user_version = 0")
+    db.execute("INSERT INTO monitoring_sessions (id, prompt, interval_hours, started_at) VALUES (1, 'oil', 6, '2025-01-01 00:00:00')")
+    db.executemany(
+        "INSERT INTO news_articles (session_id, title, url, snippet, found_at) VALUES (1, ?, ?, 'crude supply', ?)",
+        [(f"Oil {i}", f"https://example.com/{i}", f"2025-01-01 0{i}:00:00") for i in range(4)]
+    )
+    db.executemany(
+        "INSERT INTO monitoring_reports (session_id, analysis, created_at, article_count) VALUES (1, ?, ?, 2)",
+        [("First report", "2025-01-01 01:30:00"), ("Second report", "2025-01-01 03:30:00")]
+    )
+    db.commit()
+    db.close()
+    
+    data_manager = DataManager(path)
+    try:
+        db = sqlite3.connect(path)
+        assert db.execute("PRAGMA user_version").fetchone()[0] == migrations.SCHEMA_VERSION
+        db.close()
+        
+        runs = data_manager.get_session_articles(1)
+        assert [[a.title for a in run] for run in runs] == [["Oil 0", "Oil 1"], ["Oil 2", "Oil 3"]]
+        assert data_manager.count_runs(1) == 2
+        # Existing rows were indexed for full-text search
+        assert len(data_manager.search("crude")) == 4
+        assert len(data_manager.search("second", kind='reports')) == 1
+    finally:
+        data_manager.close()
+    
+    # Opening an up-to-date database applies nothing
+    db = sqlite3.connect(path)
+    assert migrations.upgrade(db) == 0
+    db.close()
+
+
+def test_newer_schema_is_rejected(tmp_path):
+    path = tmp_path / "news.db"
+    DataManager(path).close()
+    db = sqlite3.connect(path)
+    db.execute(f"PRAGMA user_version = {migrations.SCHEMA_VERSION + 1}")
+    
+    with pytest.raises(RuntimeError):
+        migrations.upgrade(db)
+    db.close()
+
+
+def test_search_follows_inserts_updates_and_deletes(data_manager):
+    session_id = data_manager.create_session("energy", 6, "you@example.com")
+    old = datetime.now() - timedelta(days=60)
+    data_manager.store_cycle(session_id, make_articles("turbine", 2), "Wind report", run_at=old)
+    data_manager.store_cycle(session_id, make_articles("solar", 2), "Solar report")
+    
+    results = data_manager.search("solar")
+    assert {r['title'] for r in results} == {"solar story 0", "solar story 1"}
+    assert f"{MATCH_START}solar{MATCH_END}" in results[0]['excerpt']
+    assert data_manager.search("sola*", session_id=session_id + 1) == []
+    
+    db = sqlite3.connect(data_manager.database_path)
+    db.execute("UPDATE news_articles SET title = 'geothermal story', snippet = 'Details on geothermal' WHERE title = 'solar story 0'")
+    db.commit()
+    db.close()
+    assert [r['title'] for r in data_manager.search("solar story")] == ["solar story 1"]
+    assert len(data_manager.search("geothermal")) == 1
+    
+    data_manager.cleanup_old_data(days=30)
+    assert data_manager.search("turbine") == []
+    assert data_manager.search("wind", kind='reports') == []
+    assert len(data_manager.search("solar", kind='reports')) == 1
+
+
+def test_store_cycle_writes_run_articles_report_and_last_run(data_manager):
+    session_id = data_manager.create_session("energy", 6, "you@example.com")
+    run_at = datetime(2026, 3, 1, 12)
+    
+    run_id = data_manager.store_cycle(session_id, make_articles("wind", 3), "Wind report", run_at=run_at)
+    
+    assert data_manager.get_runs(session_id) == [
+        {'id': run_id, 'session_id': session_id, 'run_at': run_at, 'article_count': 3}
+    ]
+    assert [a.found_at for a in data_manager.get_run_articles(run_id)] == [run_at] * 3
+    assert data_manager.get_session_reports(session_id) == ["Wind report"]
+    assert data_manager.get_session(session_id)['last_run_at'] == run_at
+
+
+def test_failed_store_cycle_writes_nothing(data_manager):
+    session_id = data_manager.create_session("energy", 6, "you@example.com")
+    
+    # The report fails to bind after the run and articles were inserted
+    with pytest.raises(Exception):
+        data_manager.store_cycle(session_id, make_articles("wind", 3), object())
+    
+    assert data_manager.count_runs(session_id) == 0
+    assert data_manager.get_session_articles(session_id) == []
+    assert data_manager.search("wind") == []
+    assert data_manager.get_session(session_id)['last_run_at'] is None
+
+
+def test_session_articles_are_grouped_by_run(data_manager):
+    session_id = data_manager.create_session("energy", 6, "you@example.com")
+    start = datetime(2026, 3, 1)
+    for day, prefix in enumerate(("wind", "solar", "hydro")):
+        data_manager.store_cycle(session_id, make_articles(prefix, 2), f"{prefix} report", run_at=start + timedelta(days=day))
+    data_manager.store_cycle(session_id, [], "Nothing new", run_at=start + timedelta(days=3))
+    
+    runs = data_manager.get_session_articles(session_id)
+    assert [[a.title for a in run] for run in runs] == [
+        ["wind story 0", "wind story 1"],
+        ["solar story 0", "solar story 1"],
+        ["hydro story 0", "hydro story 1"],
+    ]
+    assert [run[0].title for run in data_manager.get_session_articles(session_id, last_runs=3)] == [
+        "solar story 0", "hydro story 0"
+    ]
+    assert len(data_manager.get_session_articles(session_id, since=start + timedelta(days=2))) == 1
+    
+    first_page = data_manager.get_runs(session_id, limit=2)
+    second_page = data_manager.get_runs(session_id, limit=2, before_id=first_page[-1]['id'])
+    assert [r['article_count'] for r in first_page + second_page] == [0, 2, 2, 2]
+
+
+def test_iter_articles_and_stats(data_manager):
+    first = data_manager.create_session("energy", 6, "you@example.com")
+    second = data_manager.create_session("markets", 6, "you@example.com")
+    start = datetime(2026, 3, 1)
+    data_manager.store_cycle(second, make_articles("stocks", 2), "Markets", run_at=start)
+    data_manager.store_cycle(first, make_articles("wind", 2), "Wind", run_at=start + timedelta(days=1))
+    data_manager.store_cycle(first, make_articles("wind", 1) + make_articles("error", 2, link=False), "Wind again", run_at=start + timedelta(days=2))
+    
+    titles = [a.title for a in data_manager.iter_articles([first, second], batch_size=2)]
+    assert titles == [
+        "wind story 0", "wind story 1", "wind story 0", "error story 0", "error story 1",
+        "stocks story 0", "stocks story 1",
+    ]
+    # The repeated wind URL counts once, articles without a link each count
+    assert data_manager.get_article_stats([first]) == {'articles': 5, 'runs': 2, 'unique_articles': 4}
+    assert data_manager.get_article_stats([]) == {'articles': 0, 'runs': 0, 'unique_articles': 0}
@@ -0,0 +1,64 @@
+"""Tests for seen-URL and near-duplicate filtering."""
+
+import pytest
+
+from src.agents.dedup import NearDuplicateFilter, SeenUrlFilter, minhash, similarity
+from src.models.article import Article
+
+STORY = (
+    "The central bank kept its benchmark interest rate unchanged on Thursday, "
+    "saying inflation was easing but remained above its target for the year"
+)
+
+
+def article(url: str, title: str = "Central bank holds rates", snippet: str = STORY) -> Article:
+    return Article(title=title, url=url, source="Example News", snippet=snippet)
+
+
+@pytest.fixture
+def session_id(data_manager):
+    return data_manager.create_session("interest rates", 6, "you@example.com")
+
+
+def test_seen_urls_are_skipped_across_instances(data_manager, session_id):
+    first = SeenUrlFilter(data_manager)
+    first.remember(session_id, [article("https://example.com/a")])
+
+    articles = [article("https://www.example.com/a/?utm_source=x"), article("https://example.com/b")]
+    assert [a.url for a in first.filter(session_id, articles)] == ["https://example.com/b"]
+    assert [a.url for a in SeenUrlFilter(data_manager).filter(session_id, articles)] == ["https://example.com/b"]
+
+
+def test_seen_urls_reload_after_ttl(data_manager, session_id):
+    seen = SeenUrlFilter(data_manager, ttl=0)
+    seen.remember(session_id, [article("https://example.com/a")])
+    assert seen.filter(session_id, [article("https://example.com/a")]) == []
+
+    data_manager.cleanup_old_data(days=-1)
+    assert len(seen.filter(session_id, [article("https://example.com/a")])) == 1
+
+
+def test_seen_url_cache_is_bounded(data_manager):
+    seen = SeenUrlFilter(data_manager, max_sessions=2)
+    session_ids = [data_manager.create_session(f"topic {i}", 6, "you@example.com") for i in range(5)]
+    for session_id in session_ids:
+        seen.filter(session_id, [article("https://example.com/a")])
+    assert list(seen._seen) == session_ids[-2:]
+
+
+def test_near_duplicates_collapse_and_persist(data_manager, session_id):
+    dedup = NearDuplicateFilter(data_manager)
+    reworded = article("https://other.example.org/x", "Central bank leaves rates on hold", STORY + " analysts said")
+    unrelated = article("https://example.com/c", "Football", "The club signed a new striker for a record fee this summer")
+
+    kept = dedup.filter(session_id, [article("https://example.com/a"), reworded, unrelated])
+    assert [a.url for a in kept] == ["https://example.com/a", "https://example.com/c"]
+
+    dedup.remember(session_id, kept)
+    assert NearDuplicateFilter(data_manager).filter(session_id, [reworded]) == []
+
+
+def test_minhash_similarity():
+    assert similarity(minhash(STORY), minhash(STORY)) == 1.0
+    assert similarity(minhash(STORY), minhash("Football club signs a striker for a record fee")) < 0.2
+    assert minhash("too short") is None
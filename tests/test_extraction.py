@@ -0,0 +1,79 @@
+"""Tests for main-content extraction on the saved pages in benchmarks/fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+from src.agents.extraction import extract_text
+
+FIXTURES = Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures"
+
+# Page -> (start of the article body, text near its end)
+PAGES = {
+    'wire_article.html': (
+        "Grid operators across northern Europe approved a joint plan",
+        "once environmental assessments are complete.",
+    ),
+    'blog_div_layout.html': (
+        "When the city council voted last spring to replace diesel buses",
+        "a regional association is drafting guidance based on the pilot.",
+    ),
+    'spa_hydration.html': (
+        "A consortium of hospitals has begun testing a speech-recognition system",
+        "than it does for doctors.",
+    ),
+    'liveblog.html': (
+        "Election day live: polls close",
+        "Polls have opened in all 312 constituencies.",
+    ),
+    'legacy_table_cp1252.html': (
+        "La cooperativa lechera subirá un 8 % el precio",
+        "se ha reducido casi a la mitad.",
+    ),
+}
+
+
+def load(name: str) -> bytes:
+    return (FIXTURES / name).read_bytes()
+
+
+@pytest.mark.parametrize('name', list(PAGES))
+def test_main_content_is_extracted(name):
+    start, end = PAGES[name]
+
+    text = extract_text(load(name))
+
+    assert text.startswith(start)
+    assert end in text
+    # No script code, and whitespace is collapsed
+    assert '<script' not in text and 'function(' not in text and '_gaq' not in text
+    assert '  ' not in text and '\n' not in text
+
+
+def test_navigation_and_footer_are_dropped():
+    text = extract_text(load('liveblog.html'))
+
+    assert '__LIVE_STATE__' not in text
+    assert 'corrections@example.org' not in text
+
+
+def test_legacy_charset_is_decoded():
+    text = extract_text(load('legacy_table_cp1252.html'))
+
+    assert 'José María Etxeberria' in text
+    assert '�' not in text
+
+
+@pytest.mark.parametrize('max_chars', [50, 500, 1000])
+def test_text_is_cut_at_max_chars(max_chars):
+    full = extract_text(load('wire_article.html'))
+
+    text = extract_text(load('wire_article.html'), max_chars=max_chars)
+
+    assert len(text) <= max_chars
+    assert full.startswith(text.rstrip('.… '))
+
+
+def test_empty_and_bodyless_pages():
+    assert extract_text(b'') == ''
+    assert extract_text(b'<html><head><title>x</title></head></html>') == ''
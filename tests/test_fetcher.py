@@ -0,0 +1,85 @@
+"""Tests for the pooled article fetcher and its disk cache."""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.agents.fetcher import ArticleFetcher
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    requests = 0
+
+    def do_GET(self):
+        PageHandler.requests += 1
+        body = f"<html><body>{self.path} {'x' * 1000}</body></html>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+@pytest.fixture
+def fetcher(tmp_path):
+    fetcher = ArticleFetcher(cache_dir=tmp_path / "cache", min_host_interval=0)
+    yield fetcher
+    fetcher.close()
+
+
+def test_cached_page_is_served_without_request(fetcher, server):
+    before = PageHandler.requests
+    first = fetcher.fetch(f"{server}/a")
+    second = fetcher.fetch(f"{server}/a")
+
+    assert first['status'] == 200 and not first['from_cache']
+    assert second['from_cache'] and second['content'] == first['content']
+    assert PageHandler.requests == before + 1
+
+
+def test_prune_removes_old_and_oversized_entries(fetcher, server):
+    for name in ("old", "b", "c", "d"):
+        fetcher.fetch(f"{server}/{name}")
+    old_meta, _ = fetcher._cache_paths(f"{server}/old")
+    os.utime(old_meta, (time.time() - 10 * 24 * 3600,) * 2)
+
+    fetcher.cache_max_age = 24 * 3600
+    assert fetcher.prune_cache() == 1
+    assert fetcher._read_cache(f"{server}/old") is None
+
+    fetcher.cache_max_bytes = 1
+    assert fetcher.prune_cache() == 3
+    assert list(fetcher.cache_dir.iterdir()) == []
+
+
+def test_host_state_is_bounded_and_in_use_sessions_stay_open(fetcher):
+    fetcher.max_hosts = 2
+    busy = fetcher._acquire_host("busy.example.com")
+    closed = []
+    busy.session.close = lambda: closed.append(True)
+    for i in range(5):
+        fetcher._release_host(fetcher._acquire_host(f"host{i}.example.com"))
+
+    assert len(fetcher._hosts) == 2
+    assert "busy.example.com" in fetcher._hosts
+    assert closed == []
+
+    fetcher._release_host(busy)
+    fetcher._release_host(fetcher._acquire_host("other.example.com"))
+    assert "busy.example.com" not in fetcher._hosts
+    assert closed == [True]
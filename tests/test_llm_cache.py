@@ -0,0 +1,99 @@
+"""Tests for the persistent LLM response cache."""
+
+import pytest
+
+from src.api import llm_cache
+from src.api.llm_cache import LLMCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(llm_cache.time, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMCache(tmp_path / "llm_cache.db", max_entries=10, ttls={'analysis': 60}, default_ttl=600)
+    yield cache
+    cache.close()
+
+
+def key(n: int) -> str:
+    return LLMCache.make_key("model", 0.0, [{'role': 'user', 'content': f"prompt {n}"}])
+
+
+def test_key_depends_on_the_whole_request():
+    messages = [{'role': 'user', 'content': "prompt"}]
+    assert LLMCache.make_key("model", 0.0, messages) == LLMCache.make_key("model", 0.0, list(messages))
+    assert LLMCache.make_key("model", 0.0, messages) != LLMCache.make_key("model", 0.5, messages)
+    assert LLMCache.make_key("model", 0.0, messages) != LLMCache.make_key("model", 0.0, messages, max_tokens=10)
+
+
+def test_entries_expire_after_their_stage_ttl(cache, clock):
+    cache.set('analysis', key(1), "analysis")
+    cache.set('search_query', key(2), "query")
+
+    clock.now += 59
+    assert cache.get('analysis', key(1)) == "analysis"
+
+    clock.now += 2
+    assert cache.get('analysis', key(1)) is None
+    # Stages without their own TTL use the default
+    assert cache.get('search_query', key(2)) == "query"
+
+    clock.now += 600
+    assert cache.get('search_query', key(2)) is None
+    assert cache.stats()['entries'] == 0
+
+
+def test_least_recently_used_entries_are_evicted(cache, clock):
+    for n in range(10):
+        cache.set('analysis', key(n), f"response {n}")
+        clock.now += 1
+    # Reading entry 0 makes entry 1 the least recently used
+    assert cache.get('analysis', key(0)) == "response 0"
+    clock.now += 1
+
+    cache.set('analysis', key(10), "response 10")
+
+    # Over max_entries, the cache shrinks to 90%: the two oldest accesses go
+    assert cache.stats()['entries'] == 9
+    assert cache.get('analysis', key(0)) == "response 0"
+    assert cache.get('analysis', key(1)) is None
+    assert cache.get('analysis', key(2)) is None
+    assert cache.get('analysis', key(3)) == "response 3"
+
+
+def test_hits_and_misses_are_counted_per_stage(cache, clock):
+    cache.set('analysis', key(1), "analysis")
+    cache.get('analysis', key(1))
+    cache.get('analysis', key(1))
+    cache.get('analysis', key(2))
+    cache.get('search_query', key(3))
+
+    assert cache.stats()['stages'] == {
+        'analysis': {'hits': 2, 'misses': 1},
+        'search_query': {'hits': 0, 'misses': 1},
+    }
+
+
+def test_entries_persist_across_instances(tmp_path):
+    cache = LLMCache(tmp_path / "llm_cache.db")
+    cache.set('analysis', key(1), "analysis")
+    cache.close()
+
+    cache = LLMCache(tmp_path / "llm_cache.db")
+    try:
+        assert cache.get('analysis', key(1)) == "analysis"
+    finally:
+        cache.close()
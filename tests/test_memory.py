@@ -0,0 +1,83 @@
+"""Tests for NewsMemory tiers, compaction and retrieval."""
+
+import threading
+
+from src.agents.memory import NewsMemory, condense_summary
+
+
+def wait_for_compaction():
+    for thread in threading.enumerate():
+        if thread.name == "memory-compaction":
+            thread.join()
+
+
+def log_lines(memory: NewsMemory) -> int:
+    with open(memory.memory_file) as f:
+        return sum(1 for _ in f)
+
+
+def test_log_and_index_stay_bounded(tmp_path):
+    memory = NewsMemory(str(tmp_path / "memory.jsonl"), recent_entries=5, condensed_entries=20)
+    topic_limit = 5 + 20 + 1
+    bound = NewsMemory.COMPACT_FACTOR * topic_limit * 2 + 1
+
+    for i in range(500):
+        memory.add_report(f"topic {i % 2}", f"Report {i}. Markets moved on the news. " * 5)
+        wait_for_compaction()
+
+    assert log_lines(memory) <= bound
+    assert len(memory._indexed) <= bound
+    assert len(memory._index) == len(memory._indexed)
+
+    memory.save_memory()
+    for name in ("topic 0", "topic 1"):
+        topic = memory.topics[name]
+        assert len(topic.recent) == 5
+        assert len(topic.older) == 20
+        assert topic.archive is not None
+    assert log_lines(memory) == 2 * topic_limit
+
+
+def test_compacted_log_reloads(tmp_path):
+    path = str(tmp_path / "memory.jsonl")
+    memory = NewsMemory(path, recent_entries=2, condensed_entries=3)
+    for i in range(10):
+        memory.add_report("energy prices", f"Report {i} on energy prices.", timestamp=f"2025-01-{i + 1:02d}T00:00:00")
+    memory.save_memory()
+
+    reloaded = NewsMemory(path, recent_entries=2, condensed_entries=3)
+    topic = reloaded.topics["energy prices"]
+    assert [entry['summary'] for entry in topic.recent] == ["Report 9 on energy prices.", "Report 8 on energy prices."]
+    assert len(topic.older) == 3
+    assert topic.archive['since'].startswith("2025-01-01")
+    assert topic.archive['timestamp'].startswith("2025-01-05")
+    assert topic.archive['summary'].index("2025-01-01") < topic.archive['summary'].index("2025-01-05")
+
+
+def test_torn_last_line_is_skipped(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    memory = NewsMemory(str(path))
+    memory.add_report("chip exports", "Export rules tightened.")
+    with open(path, 'a') as f:
+        f.write('{"timestamp": "2025')
+
+    reloaded = NewsMemory(str(path))
+    assert len(reloaded.topics["chip exports"].recent) == 1
+    assert log_lines(reloaded) == 1
+
+
+def test_context_falls_back_to_related_topics(tmp_path):
+    memory = NewsMemory(str(tmp_path / "memory.jsonl"))
+    memory.add_report("central bank interest rates", "The central bank held interest rates.")
+    memory.add_report("football transfers", "Clubs signed new players.")
+
+    context = memory.get_context("interest rates outlook")
+    assert "central bank held interest rates" in context
+    assert "Clubs signed" not in context
+
+
+def test_condense_summary_keeps_leading_sentences():
+    summary = "## Heading\nFirst sentence here. Second sentence follows. " + "Filler words. " * 50
+    condensed = condense_summary(summary, max_chars=60)
+    assert condensed.startswith("Heading First sentence here.")
+    assert len(condensed) <= 60
@@ -0,0 +1,186 @@
+"""Tests for NewsAgent cycle handling of repeated stories."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.agents.dedup import SeenUrlFilter
+from src.agents.memory import NewsMemory
+from src.agents.news_agent import NewsAgent
+from src.agents.tools import SimpleTool
+from src.api.llm_cache import LLMCache
+from src.models.article import Article
+
+
+def make_articles(count: int):
+    return [
+        Article(
+            title=f"Story {i} about energy prices",
+            url=f"https://news.example.com/story/{i}",
+            source="Example News",
+            snippet=f"Details of story {i}. " * 20
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def agent(tmp_path, data_manager):
+    agent = NewsAgent(
+        api_key="test",
+        base_url="http://localhost",
+        model="test-model",
+        memory=NewsMemory(str(tmp_path / "memory.jsonl")),
+        num_queries=1,
+        seen_urls=SeenUrlFilter(data_manager)
+    )
+    agent.llm_calls = []
+
+    async def ainvoke(stage, messages, key_messages=None):
+        agent.llm_calls.append(stage)
+        if agent.fail_analysis and stage == 'analysis':
+            raise RuntimeError("provider unavailable")
+        return ("energy prices" if stage == 'search_query' else "Analysis of the news."), False
+
+    agent.fail_analysis = False
+    agent.chain._ainvoke = ainvoke
+    return agent
+
+
+def set_results(agent: NewsAgent, articles):
+    async def search(query):
+        return list(articles)
+    agent.search_tool = SimpleTool("search", "test search", lambda query: list(articles), search)
+
+
+def test_failed_analysis_is_not_remembered(agent, data_manager):
+    session_id = data_manager.create_session("energy prices", 6, "you@example.com")
+    articles = make_articles(3)
+    agent.fail_analysis = True
+
+    analysis, analyzed = agent.analyze_articles("energy prices", articles)
+    agent.remember_articles(session_id, analyzed)
+
+    assert analyzed == []
+    assert data_manager.get_seen_url_hashes(session_id) == set()
+    assert "energy prices" not in agent.memory.topics
+
+
+def test_only_packed_articles_are_remembered(agent, data_manager):
+    session_id = data_manager.create_session("energy prices", 6, "you@example.com")
+    articles = make_articles(40)
+    agent.chain.token_budget = 1500
+
+    analysis, analyzed = agent.analyze_articles("energy prices", articles)
+    agent.remember_articles(session_id, analyzed)
+
+    assert 0 < len(analyzed) < len(articles)
+    set_results(agent, articles)
+    remaining = agent.search_news("energy prices", session_id=session_id)
+    assert [a.url for a in remaining] == [a.url for a in articles[len(analyzed):]]
+
+
+def test_cycle_with_only_seen_articles_is_empty(agent, data_manager):
+    session_id = data_manager.create_session("energy prices", 6, "you@example.com")
+    articles = make_articles(3)
+    agent.remember_articles(session_id, articles)
+    set_results(agent, articles)
+
+    assert agent.search_news("energy prices", session_id=session_id) == []
+    assert 'analysis' not in agent.llm_calls
+
+
+def test_search_without_results_gives_placeholder(agent):
+    set_results(agent, [])
+
+    articles = asyncio.run(agent.asearch_news("energy prices"))
+    assert [a.title for a in articles] == ['No Results']
+
+
+class FakeLLM:
+    model_name = "test-model"
+    temperature = 0.0
+
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        return SimpleNamespace(content=f"Response {self.calls}", usage_metadata=None)
+
+
+def test_repeated_analysis_is_served_from_cache(tmp_path):
+    agent = NewsAgent(
+        api_key="test",
+        base_url="http://localhost",
+        model="test-model",
+        memory=NewsMemory(str(tmp_path / "memory.jsonl")),
+        num_queries=3,
+        cache=LLMCache(tmp_path / "llm_cache.db")
+    )
+    agent.chain.llm = FakeLLM()
+    articles = make_articles(3)
+    set_results(agent, articles)
+
+    try:
+        for _ in range(2):
+            found = agent.search_news("energy prices")
+            agent.analyze_articles("energy prices", found)
+    finally:
+        agent.chain.cache.close()
+
+    # The memory context grew after the first run; both stages still hit
+    assert agent.chain.llm.calls == 2
+    assert agent.chain.usage.snapshot()['analysis']['cached_calls'] == 1
+    assert len(agent.memory.topics["energy prices"]) == 1
+
+
+def test_merge_interleaves_and_drops_duplicates_by_canonical_url(agent):
+    first = [
+        Article(title="A", url="https://www.example.com/a?utm_source=x", source="S"),
+        Article(title="B", url="https://example.com/b", source="S"),
+        Article(title="C", url="https://example.com/c", source="S"),
+    ]
+    second = [
+        Article(title="A again", url="http://example.com/a", source="S"),
+        Article(title="D", url="https://example.com/d", source="S"),
+    ]
+    third = [
+        Article(title="No Link", source="S"),
+        Article(title="no link ", source="S"),
+    ]
+
+    merged = agent._merge_results([first, second, third])
+
+    # Each query's top result first, then each query's second, ...
+    assert [a.title for a in merged] == ["A", "No Link", "B", "D", "C"]
+
+
+def query_lines(agent, content):
+    async def ainvoke(stage, messages, key_messages=None):
+        return content, False
+    agent.chain._ainvoke = ainvoke
+    return asyncio.run(agent.chain.agenerate_search_queries("energy prices", "", count=3))
+
+
+def test_query_list_parsing(agent):
+    content = (
+        "Here are 3 search queries:\n"
+        "\n"
+        "1. \"EU gas price cap\"\n"
+        "2) oil supply cuts OPEC\n"
+        "- eu gas price cap\n"
+        "* electricity tariffs winter 2025\n"
+        "• extra query beyond the count\n"
+    )
+
+    assert query_lines(agent, content) == [
+        "EU gas price cap", "oil supply cuts OPEC", "electricity tariffs winter 2025"
+    ]
+
+
+def test_query_preambles_are_dropped(agent):
+    assert query_lines(agent, "Sure! Queries:\nSearch queries:\nOklahoma wind farms") == ["Oklahoma wind farms"]
+    # Nothing usable falls back to the prompt
+    assert query_lines(agent, "Here is what I found:") == ["energy prices"]
@@ -0,0 +1,34 @@
+"""DataManager queries must use indexes on an upgraded legacy database."""
+
+import sqlite3
+
+import pytest
+
+from benchmarks.check_query_plans import CHECKS, check_full_scans, make_legacy_database
+from src.scheduler import migrations
+from src.scheduler.data_manager import DataManager
+
+
+@pytest.fixture(scope='module')
+def legacy(tmp_path_factory):
+    path = tmp_path_factory.mktemp("plans") / "news.db"
+    make_legacy_database(path)
+    data_manager = DataManager(path)
+    db = sqlite3.connect(path)
+    yield data_manager, db
+    db.close()
+    data_manager.close()
+
+
+def test_legacy_database_is_upgraded(legacy):
+    _, db = legacy
+    assert db.execute("PRAGMA user_version").fetchone()[0] == migrations.SCHEMA_VERSION
+    indexes = {name for name, in db.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {'ix_news_articles_session_found', 'ix_monitoring_reports_session_created'} <= indexes
+
+
+# cleanup_old_data is the last check, so it runs after the reads it would empty
+@pytest.mark.parametrize('name', list(CHECKS))
+def test_query_uses_indexes(legacy, name):
+    data_manager, db = legacy
+    assert check_full_scans(data_manager, db, CHECKS[name]) == []
@@ -0,0 +1,20 @@
+"""Tests for the BM25 index."""
+
+from src.agents.retrieval import BM25Index, tokenize
+
+
+def test_tokenize_drops_stopwords_and_single_characters():
+    assert tokenize("The latest news on a U.S. rate cut") == ["rate", "cut"]
+
+
+def test_search_ranks_by_relevance_and_ages_from_newest():
+    index = BM25Index()
+    index.add("central bank raises interest rates")
+    index.add("football club signs striker")
+    index.add("interest rates held by central bank, rates outlook")
+
+    results = index.search("interest rates", k=5)
+    assert [age for age, _ in results] == [0, 2]
+    assert results[0][1] > results[1][1]
+    assert index.search("weather", k=5) == []
+    assert len(index) == 3
@@ -0,0 +1,70 @@
+"""Tests for incremental rollups and the aggregate LLM call limit."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+from src.api.rollups import RollupAggregator
+from src.api.summarizer import MapReduceSummarizer
+
+
+class FakeClient:
+    """Stands in for DeepSeekClient and records how many calls overlap."""
+
+    token_budget = 48000
+
+    def __init__(self):
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def chat_completion(self, messages, max_tokens=None, stage='default'):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+        return f"{stage} summary"
+
+    def create_aggregate_summary(self, reports):
+        return "aggregate summary"
+
+
+def add_reports(data_manager, session_id, days, per_day):
+    start = datetime(2026, 1, 1, 8)
+    for day in range(days):
+        for i in range(per_day):
+            run_at = start + timedelta(days=day, hours=i)
+            data_manager.store_cycle(session_id, [], f"Report {day}-{i}: " + "energy prices " * 200, run_at=run_at)
+
+
+def test_buckets_share_the_summarizer_call_limit(data_manager):
+    session_id = data_manager.create_session("energy prices", 6, "you@example.com")
+    add_reports(data_manager, session_id, days=8, per_day=6)
+    client = FakeClient()
+    summarizer = MapReduceSummarizer(client, chunk_tokens=600, summary_tokens=64, max_workers=3)
+
+    rollups = RollupAggregator(data_manager, summarizer).update_rollups(session_id)
+
+    assert len(rollups) == 8
+    assert client.calls > 8
+    assert client.max_active <= 3
+
+
+def test_only_changed_buckets_are_rebuilt(data_manager):
+    session_id = data_manager.create_session("energy prices", 6, "you@example.com")
+    add_reports(data_manager, session_id, days=3, per_day=2)
+    client = FakeClient()
+    aggregator = RollupAggregator(data_manager, MapReduceSummarizer(client, summary_tokens=64))
+
+    aggregator.update_rollups(session_id)
+    first = client.calls
+    aggregator.update_rollups(session_id)
+    assert client.calls == first
+
+    data_manager.store_cycle(session_id, [], "Late report: " + "energy prices " * 200, run_at=datetime(2026, 1, 3, 20))
+    aggregator.update_rollups(session_id)
+    assert client.calls == first + 1
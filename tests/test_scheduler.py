@@ -0,0 +1,81 @@
+"""Tests for reconciling scheduled jobs with the active sessions."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.scheduler.scheduler import NewsScheduler
+
+
+def callback(**kwargs):
+    pass
+
+
+def session(session_id: int, interval_hours: int = 6, last_run_at=None):
+    return {
+        'id': session_id,
+        'prompt': f"topic {session_id}",
+        'interval_hours': interval_hours,
+        'last_run_at': last_run_at,
+        'email_to': "you@example.com",
+    }
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = NewsScheduler("UTC", max_workers=2)
+    # Paused, so jobs are kept but never run
+    scheduler.scheduler.start(paused=True)
+    yield scheduler
+    scheduler.stop()
+
+
+def test_new_sessions_are_scheduled(scheduler):
+    added, removed = scheduler.sync_sessions([session(1), session(2)], callback, components="shared")
+
+    assert (added, removed) == (2, 0)
+    assert sorted(job['id'] for job in scheduler.list_jobs()) == ['monitoring_1', 'monitoring_2']
+    job = scheduler.scheduler.get_job('monitoring_1')
+    assert job.kwargs == {
+        'prompt': "topic 1", 'email_to': "you@example.com", 'components': "shared", 'session_id': 1
+    }
+    assert job.trigger.interval == timedelta(hours=6)
+
+
+def test_unchanged_sessions_are_left_alone(scheduler):
+    scheduler.sync_sessions([session(1)], callback)
+    job = scheduler.jobs['monitoring_1']
+
+    assert scheduler.sync_sessions([session(1)], callback) == (0, 0)
+    assert scheduler.jobs['monitoring_1'] is job
+
+
+def test_inactive_sessions_are_removed(scheduler):
+    scheduler.sync_sessions([session(1), session(2)], callback)
+
+    assert scheduler.sync_sessions([session(2)], callback) == (0, 1)
+    assert [job['id'] for job in scheduler.list_jobs()] == ['monitoring_2']
+    assert scheduler.get_job_status('monitoring_1') is None
+
+
+def test_changed_interval_is_rescheduled(scheduler):
+    scheduler.sync_sessions([session(1, interval_hours=6)], callback)
+
+    assert scheduler.sync_sessions([session(1, interval_hours=2)], callback) == (1, 0)
+    assert len(scheduler.list_jobs()) == 1
+    assert scheduler.scheduler.get_job('monitoring_1').trigger.interval == timedelta(hours=2)
+
+
+def test_sessions_resume_from_their_last_run(scheduler):
+    recent = datetime.now() - timedelta(hours=1)
+    overdue = datetime.now() - timedelta(hours=30)
+    before = datetime.now(scheduler.timezone)
+
+    scheduler.sync_sessions([session(1, 6, recent), session(2, 6, overdue), session(3)], callback)
+
+    next_runs = {job['id']: job['next_run_time'] for job in scheduler.list_jobs()}
+    expected = recent.astimezone(scheduler.timezone) + timedelta(hours=6)
+    assert abs(next_runs['monitoring_1'] - expected) < timedelta(seconds=1)
+    # Overdue and never-run sessions run right away, not all their missed cycles
+    assert next_runs['monitoring_2'] - before < timedelta(seconds=5)
+    assert next_runs['monitoring_3'] - before < timedelta(seconds=5)
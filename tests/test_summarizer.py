@@ -0,0 +1,102 @@
+"""Tests for map-reduce chunking and reduction."""
+
+from src.api.summarizer import MapReduceSummarizer
+from src.api.tokens import count_tokens
+
+
+class RecordingClient:
+    """Stands in for DeepSeekClient: fixed-size summaries, records every request."""
+
+    def __init__(self, token_budget: int = 2000, summary_words: int = 100):
+        self.token_budget = token_budget
+        self.summary_words = summary_words
+        self.prompts = []
+        self.final = None
+
+    def chat_completion(self, messages, max_tokens=None, stage='default'):
+        self.prompts.append((stage, messages[-1]['content']))
+        return " ".join(f"{stage}{len(self.prompts)}w{i}" for i in range(self.summary_words))
+
+    def create_aggregate_summary(self, reports):
+        self.final = list(reports)
+        return "aggregate summary"
+
+
+def report(n: int, words: int = 150) -> str:
+    return " ".join(f"r{n}w{i}" for i in range(words))
+
+
+def test_chunks_fit_the_budget_and_keep_order():
+    summarizer = MapReduceSummarizer(RecordingClient(), chunk_tokens=1000)
+    reports = [report(n, words=50 + 40 * (n % 5)) for n in range(30)]
+
+    chunks = summarizer._chunk(reports)
+
+    assert [text for chunk in chunks for text in chunk] == reports
+    assert all(sum(count_tokens(text) for text in chunk) <= 1000 for chunk in chunks)
+    # Chunks are filled: a chunk plus the next text would not fit
+    for chunk, following in zip(chunks, chunks[1:]):
+        assert sum(count_tokens(text) for text in chunk) + count_tokens(following[0]) > 1000
+
+
+def test_chunk_boundaries_do_not_move_when_reports_are_appended():
+    summarizer = MapReduceSummarizer(RecordingClient(), chunk_tokens=1000)
+    reports = [report(n) for n in range(20)]
+
+    before = summarizer._chunk(reports)
+    after = summarizer._chunk(reports + [report(n) for n in range(20, 25)])
+
+    assert after[:len(before) - 1] == before[:-1]
+
+
+def test_oversized_texts_are_cut_to_fit_a_chunk():
+    summarizer = MapReduceSummarizer(RecordingClient(), chunk_tokens=500)
+
+    chunks = summarizer._chunk([report(0, words=2000), report(1, words=2000)], min_size=2)
+
+    assert len(chunks) == 1
+    assert sum(count_tokens(text) for text in chunks[0]) <= 500
+
+
+def test_combine_reduces_until_the_final_call_fits():
+    client = RecordingClient(token_budget=2000, summary_words=100)
+    summarizer = MapReduceSummarizer(client, chunk_tokens=1500)
+    summaries = [report(n, words=300) for n in range(40)]
+
+    assert summarizer.combine(summaries) == "aggregate summary"
+
+    assert sum(count_tokens(text) for text in client.final) <= client.token_budget
+    assert len(client.final) < len(summaries)
+    assert all(stage == 'aggregate_reduce' for stage, _ in client.prompts)
+    # Every reduce prompt stayed within the chunk budget (plus the period labels)
+    assert all(count_tokens(prompt) <= 1500 + 200 for _, prompt in client.prompts)
+
+
+def test_combine_skips_reduction_when_summaries_fit():
+    client = RecordingClient(token_budget=10_000)
+    summaries = [report(n, words=50) for n in range(5)]
+
+    MapReduceSummarizer(client).combine(summaries)
+
+    assert client.prompts == []
+    assert client.final == summaries
+
+
+def test_condense_reduces_to_one_summary():
+    client = RecordingClient(summary_words=100)
+    summarizer = MapReduceSummarizer(client, chunk_tokens=800, summary_tokens=64)
+
+    summary = summarizer.condense([report(n, words=200) for n in range(20)])
+
+    stages = [stage for stage, _ in client.prompts]
+    assert stages.count('aggregate_map') == len(summarizer._chunk([report(n, words=200) for n in range(20)]))
+    assert 'aggregate_reduce' in stages
+    assert summary.startswith(f"aggregate_reduce{len(client.prompts)}w0")
+
+
+def test_short_input_is_condensed_without_a_call():
+    client = RecordingClient()
+    summarizer = MapReduceSummarizer(client, summary_tokens=1024)
+
+    assert summarizer.condense(["one", "two"]) == "one\n\n---\n\ntwo"
+    assert client.prompts == []
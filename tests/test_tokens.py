@@ -0,0 +1,101 @@
+"""Tests for token-budgeted prompt packing."""
+
+from src.api.tokens import count_tokens, fit_texts, pack_articles, truncate_to_tokens
+from src.models.article import Article
+
+
+def words(prefix: str, count: int) -> str:
+    return " ".join(f"{prefix}{i}" for i in range(count))
+
+
+def make_articles(count: int, body_words: int = 300):
+    return [
+        Article(
+            title=f"Story {i} about energy prices",
+            url=f"https://news.example.com/story/{i}",
+            source="Example News",
+            snippet=words(f"s{i}w", body_words)
+        )
+        for i in range(count)
+    ]
+
+
+def test_truncate_stays_within_limit():
+    text = words("w", 500)
+    for limit in (1, 5, 50, 499):
+        truncated = truncate_to_tokens(text, limit)
+        assert count_tokens(truncated) <= limit
+        assert truncated.endswith("...")
+    assert truncate_to_tokens(text, 0) == ""
+    assert truncate_to_tokens("short text", 50) == "short text"
+
+
+def test_fit_texts_returns_fitting_texts_unchanged():
+    texts = [words("a", 20), words("b", 30)]
+    assert fit_texts(texts, 10_000) == texts
+
+
+def test_fit_texts_trims_proportionally_within_budget():
+    texts = [words("a", 400), words("b", 200), words("c", 100)]
+    counts = [count_tokens(text) for text in texts]
+    budget = sum(counts) // 2
+
+    fitted = fit_texts(texts, budget, min_tokens=16)
+
+    assert len(fitted) == 3
+    fitted_counts = [count_tokens(text) for text in fitted]
+    assert sum(fitted_counts) <= budget
+    # Same ratio for every text, so the order of sizes is kept
+    assert fitted_counts[0] > fitted_counts[1] > fitted_counts[2]
+    assert all(fitted[i][:20] == texts[i][:20] for i in range(3))
+
+
+def test_fit_texts_pins_short_texts_to_their_minimum():
+    texts = [words("a", 1000), words("b", 40)]
+    budget = count_tokens(texts[0]) // 10
+
+    fitted = fit_texts(texts, budget, min_tokens=32)
+
+    assert sum(count_tokens(text) for text in fitted) <= budget
+    assert count_tokens(fitted[1]) <= 32
+    assert count_tokens(fitted[0]) > count_tokens(fitted[1])
+
+
+def test_fit_texts_drops_lowest_priority_texts_first():
+    texts = [words(f"t{i}w", 100) for i in range(10)]
+
+    fitted = fit_texts(texts, 100, min_tokens=32)
+
+    assert len(fitted) == 3
+    assert [text[:4] for text in fitted] == [text[:4] for text in texts[:3]]
+    assert sum(count_tokens(text) for text in fitted) <= 100
+
+
+def test_pack_articles_keeps_rank_order_within_budget():
+    articles = make_articles(40)
+    budget = 1500
+
+    packed = pack_articles(articles, budget)
+
+    assert 0 < len(packed) < len(articles)
+    assert [a for a, _ in packed] == articles[:len(packed)]
+    # Every kept article still gets part of its body
+    assert all(body.startswith(a.snippet[:4]) for a, body in packed)
+    total = sum(
+        count_tokens(f"{a.title} {a.source} {a.url} {a.published or ''}") + 10 + count_tokens(body)
+        for a, body in packed
+    )
+    assert total <= budget
+
+
+def test_pack_articles_prefers_fetched_content():
+    article = make_articles(1)[0]
+    article.content = "Full article text about energy prices."
+
+    [(packed_article, body)] = pack_articles([article], 1000)
+    assert packed_article is article
+    assert body == article.content
+
+
+def test_pack_articles_without_room_for_any_article():
+    assert pack_articles(make_articles(3), 10) == []
@@ -0,0 +1,74 @@
+"""Tests for normalizing search provider results."""
+
+from datetime import datetime
+
+from src.agents.tools import normalize_search_result
+
+
+def test_news_result():
+    article = normalize_search_result({
+        'title': '  Grid operators   approve\nNorth Sea link ',
+        'url': ' https://www.example.com/news/grid ',
+        'body': 'Operators  agreed on\ta shared network.',
+        'source': 'Example Wire',
+        'date': '2025-05-14T10:00:00+00:00',
+    })
+
+    assert article.title == 'Grid operators approve North Sea link'
+    assert article.url == 'https://www.example.com/news/grid'
+    assert article.snippet == 'Operators agreed on a shared network.'
+    assert article.source == 'Example Wire'
+    assert article.published == '2025-05-14T10:00:00+00:00'
+
+
+def test_text_result_key_variants():
+    article = normalize_search_result({
+        'title': 'Grid plan',
+        'href': 'https://www.example.com/grid',
+        'snippet': 'Snippet text',
+        'published': datetime(2025, 5, 14, 10),
+    })
+
+    assert article.url == 'https://www.example.com/grid'
+    assert article.snippet == 'Snippet text'
+    # Without a source the domain is used
+    assert article.source == 'example.com'
+    assert article.published == '2025-05-14T10:00:00'
+
+
+def test_missing_snippet_falls_back_to_title():
+    article = normalize_search_result({'title': 'Grid plan approved', 'link': 'https://example.com/a'})
+
+    assert article.snippet == 'Grid plan approved'
+    assert article.published is None
+
+
+def test_missing_url():
+    article = normalize_search_result({'title': 'Grid plan approved', 'body': 'Details'})
+
+    assert article.url == 'N/A'
+    assert article.source == 'Web'
+    assert not article.has_link
+
+
+def test_missing_title():
+    article = normalize_search_result({'url': 'https://example.com/a', 'body': 'Details'})
+
+    assert article.title == 'Untitled Article'
+    assert article.has_link
+
+
+def test_result_without_title_or_url_is_dropped():
+    assert normalize_search_result({'body': 'Orphan snippet'}) is None
+    assert normalize_search_result({'title': '  ', 'url': ''}) is None
+
+
+def test_malformed_values_are_tolerated():
+    article = normalize_search_result({
+        'title': 'Grid plan',
+        'url': 'http://[broken/path',
+        'date': 'yesterday',
+    })
+
+    assert article.source == 'Web'
+    assert article.published is None
@@ -0,0 +1,44 @@
+"""Tests for URL canonicalization."""
+
+import pytest
+
+from src.agents.urls import canonicalize_url, url_hash
+
+
+@pytest.mark.parametrize("variant", [
+    "https://www.example.com/world/story-1/",
+    "http://example.com/world/story-1",
+    "https://m.example.com/world/story-1?utm_source=feed&fbclid=abc#comments",
+    "https://EXAMPLE.com:443/world/story-1",
+    "https://example.com/amp/world/story-1",
+    "https://example.com/world/story-1/amp",
+    "https://example-com.cdn.ampproject.org/c/s/example.com/world/story-1",
+    "  https://example.com/world/story-1\n",
+])
+def test_variants_share_canonical_form(variant):
+    assert canonicalize_url(variant) == "https://example.com/world/story-1"
+    assert url_hash(variant) == url_hash("https://example.com/world/story-1")
+
+
+def test_amp_html_page_matches_html_page():
+    assert canonicalize_url("https://example.com/story.amp.html") == canonicalize_url("https://example.com/story.html")
+
+
+def test_content_parameters_are_kept_and_sorted():
+    assert canonicalize_url("https://example.com/search?q=rates&page=2&utm_medium=x") == \
+        "https://example.com/search?page=2&q=rates"
+
+
+def test_non_default_port_is_kept():
+    assert canonicalize_url("https://example.com:8443/a") == "https://example.com:8443/a"
+
+
+@pytest.mark.parametrize("url", ["https://example.com:abc/x", "https://[::1/x"])
+def test_malformed_urls_fall_back_to_raw(url):
+    assert canonicalize_url(f" {url} ") == url
+    assert isinstance(url_hash(url), int)
+
+
+def test_non_http_urls_are_only_stripped():
+    assert canonicalize_url(" Search ") == "Search"
+    assert canonicalize_url("") == ""
@@ -0,0 +1,73 @@
+"""Tests for the memory-mapped article vector index."""
+
+import multiprocessing
+
+import numpy as np
+
+from src.models.article import Article
+from src.scheduler.data_manager import DataManager
+from src.scheduler.vector_index import ArticleVectorIndex, embed
+
+TOPICS = ["energy prices", "football transfers", "chip exports", "interest rates"]
+
+
+def append_rows(directory, worker: int, batches: int):
+    index = ArticleVectorIndex(directory, dimensions=64)
+    for batch in range(batches):
+        rows = []
+        for i in range(50):
+            article_id = (worker * batches + batch) * 50 + i + 1
+            rows.append((article_id, worker, f"{TOPICS[article_id % 4]} story {article_id}"))
+        index.add(rows)
+
+
+def test_concurrent_processes_keep_rows_aligned(tmp_path):
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=append_rows, args=(tmp_path, worker, 40)) for worker in range(8)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+
+    index = ArticleVectorIndex(tmp_path, dimensions=64)
+    vectors, ids = index._rows()
+    assert len(index) == 8 * 40 * 50
+    for row in range(0, len(index), 7):
+        article_id = int(ids['article_id'][row])
+        expected = embed(f"{TOPICS[article_id % 4]} story {article_id}", 64)
+        assert np.allclose(vectors[row], expected)
+
+
+def test_search_finds_similar_articles(tmp_path):
+    index = ArticleVectorIndex(tmp_path, dimensions=256)
+    index.add([
+        (1, 1, "Central bank raises interest rates again"),
+        (2, 1, "Football club signs new striker"),
+        (3, 2, "Interest rates held steady by central bank"),
+    ])
+
+    assert [article_id for article_id, _ in index.search("central bank interest rates", k=2)] in ([1, 3], [3, 1])
+    assert [article_id for article_id, _ in index.search("interest rates", k=5, session_id=2)] == [3]
+
+
+def test_cleanup_prunes_deleted_articles(tmp_path):
+    index = ArticleVectorIndex(tmp_path / "index", dimensions=64)
+    data_manager = DataManager(tmp_path / "news.db", vector_index=index)
+    try:
+        session_id = data_manager.create_session("energy prices", 6, "you@example.com")
+        articles = [
+            Article(title=f"Energy prices story {i}", url=f"https://example.com/{i}", snippet="Prices rose.")
+            for i in range(5)
+        ]
+        data_manager.store_cycle(session_id, articles, "Analysis")
+        assert len(index) == 5
+
+        data_manager.cleanup_old_data(days=-1)
+        assert len(index) == 0
+        assert data_manager.search_history("energy prices") == []
+
+        data_manager.store_cycle(session_id, articles[:2], "Analysis")
+        assert len(index) == 2
+        assert len(data_manager.search_history("energy prices story")) == 2
+    finally:
+        data_manager.close()